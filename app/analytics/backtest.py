@@ -4,18 +4,28 @@
 월말 리밸런싱 기준으로 매일 NAV를 계산한다.
 """
 
-from collections import defaultdict
-from typing import Dict, List, Optional, Tuple
-
-from app.assets.assets import reload_assets
+import bisect
+import contextlib
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date as _date
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+
+from app.assets.assets import AssetUniverse
 from app.constants import LOOKBACK_DAYS
-from app.analytics.csv_logger import load_ohlc_prices, save_strategy_nav
-from app.analytics.returns import compute_weighted_return
-from app.data.data_utils import parse_history
-from app.indicators.momentum import compute_momentum
+from app.analytics.csv_logger import open_ohlc_panel, save_strategy_nav_many
+from app.analytics.price_panel import PricePanel
+from app.analytics.price_store import PriceStore, open_price_store
+from app.analytics.signal_cache import PriceFingerprint, SignalCache
+from app.analytics.signal_panel import SignalPanel
+from app.analytics.momentum_panel import MomentumPanel
 from app.strategy import BaseStrategy
 
 
+REBALANCE_SCHEDULES = ("daily", "weekly", "monthly", "quarterly")
+
+
 def _get_month_end_dates(all_dates: List[str]) -> List[str]:
     """날짜 목록에서 각 달의 마지막 거래일을 반환한다."""
     month_last: Dict[str, str] = {}
@@ -25,61 +35,159 @@ def _get_month_end_dates(all_dates: List[str]) -> List[str]:
     return sorted(month_last.values())
 
 
-def _prices_up_to(
-    price_dict: Dict[str, Dict[str, float]],
-    ticker: str,
-    cutoff: str,
-) -> List[float]:
-    """특정 날짜 미만의 가격 시계열(오름차순)을 반환한다.
+def _get_rebalance_dates(
+    all_dates: List[str],
+    schedule: Union[str, Sequence[str]] = "monthly",
+) -> List[str]:
+    """거래일 목록(오름차순)에서 리밸런싱일을 반환한다.
 
-    cutoff 당일 종가를 제외하여 look-ahead 바이어스를 방지한다.
-    월말 신호는 전일 종가 기준으로 산출되고, 당일(월말)에 진입하는 흐름과 일치한다.
+    schedule:
+        "daily"      모든 거래일
+        "weekly"     각 주(ISO)의 마지막 거래일
+        "monthly"    각 달의 마지막 거래일 (기본)
+        "quarterly"  각 분기의 마지막 거래일
+        날짜 목록     각 날짜 당일 또는 직전 거래일 (중복 제거)
     """
-    data = price_dict.get(ticker, {})
-    dates = sorted(d for d in data if d < cutoff)
-    return [data[d] for d in dates]
-
-
-def _compute_scores_at_date(
+    if not isinstance(schedule, str):
+        picked = set()
+        for d in schedule:
+            i = bisect.bisect_right(all_dates, d)
+            if i:
+                picked.add(all_dates[i - 1])
+        return sorted(picked)
+    if schedule == "daily":
+        return list(all_dates)
+    if schedule == "monthly":
+        return _get_month_end_dates(all_dates)
+    if schedule not in REBALANCE_SCHEDULES:
+        raise ValueError(f"알 수 없는 리밸런싱 주기: {schedule!r} (사용 가능: {REBALANCE_SCHEDULES})")
+    last: Dict[Tuple[int, int], str] = {}
+    for d in all_dates:
+        if schedule == "weekly":
+            key = tuple(_date.fromisoformat(d).isocalendar()[:2])
+        else:
+            key = (int(d[:4]), (int(d[5:7]) - 1) // 3)
+        last[key] = d
+    return sorted(last.values())
+
+
+def _group_columns(
     strategy: BaseStrategy,
-    price_dict: Dict[str, Dict[str, float]],
-    date: str,
-) -> Dict[str, Optional[float]]:
-    """특정 날짜 기준 전략 universe의 모멘텀 점수를 계산한다."""
-    from app.assets.assets import group_tickers
-    reload_assets(strategy.assets)
-
-    scores: Dict[str, Optional[float]] = {}
-    for group in strategy.get_universe():
-        score = None
-        for ticker in group_tickers(group):
-            prices = _prices_up_to(price_dict, ticker, date)
-            if len(prices) > LOOKBACK_DAYS["12m"]:
-                _, returns = compute_momentum(prices)
-                score = strategy.score_from_returns(returns)
-                if score is not None:
-                    break
-        scores[group] = score
-    return scores
-
-
-def _build_histories_at_date(
+    panel: PricePanel,
+) -> Dict[str, List[str]]:
+    """전략 universe의 그룹 → 패널에 있는 후보 티커 목록 (우선순위 순)."""
+    universe = strategy.universe
+    return {
+        group: [t for t in universe.group_tickers(group) if t in panel]
+        for group in strategy.get_universe()
+    }
+
+
+def _group_return(panel: PricePanel, tickers: List[str], prev_row: int, row: int) -> float:
+    """prev_row → row 그룹 수익률: 두 날짜 모두 가격이 있는 첫 번째 티커 기준, 없으면 0."""
+    if row == prev_row + 1:
+        for ticker in tickers:
+            r = panel.returns(ticker)[row]
+            if r == r:
+                return r
+        return 0.0
+    for ticker in tickers:
+        col = panel.column(ticker)
+        prev_price, curr_price = col[prev_row], col[row]
+        if prev_price > 0 and curr_price == curr_price and curr_price != 0:
+            return curr_price / prev_price - 1.0
+    return 0.0
+
+
+def _target_groups(
+    targets: Dict[str, float],
+    groups: Dict[str, List[str]],
+    panel: PricePanel,
+    universe: AssetUniverse,
+) -> List[Tuple[List[str], float]]:
+    """targets({group: weight}) → [(후보 티커 목록, weight)] (일별 수익률 계산용)."""
+    return [
+        (groups.get(g) or [t for t in universe.group_tickers(g) if t in panel], w)
+        for g, w in targets.items()
+    ]
+
+
+def _select_rows(
     strategy: BaseStrategy,
-    price_dict: Dict[str, Dict[str, float]],
-    date: str,
-) -> Dict[str, List[float]]:
-    """특정 날짜 기준 전략 universe의 파싱된 가격 시계열을 반환한다.
+    signals: SignalPanel,
+    rows: List[int],
+    signal_cache: Optional[SignalCache] = None,
+    fingerprint: Optional[PriceFingerprint] = None,
+) -> Dict[int, Optional[Dict[str, float]]]:
+    """리밸런싱 행들의 targets ({row: targets}, 데이터 부족 행은 None).
+
+    signal_cache 적중 행은 저장된 결과를 쓰고, 나머지는 select_targets_batch 1회로 계산한다.
+    rows는 오름차순이어야 fingerprint 누적 해시가 O(history)로 유지된다.
+    """
+    selected: Dict[int, Optional[Dict[str, float]]] = {}
+    keys: Dict[int, str] = {}
+    misses: List[int] = []
+    for row in rows:
+        if signal_cache is not None and fingerprint is not None:
+            keys[row] = fingerprint.at(row)
+            hit, targets = signal_cache.get(signals.panel.dates[row], keys[row])
+            if hit:
+                selected[row] = targets
+                continue
+        misses.append(row)
+
+    if misses:
+        matrix = strategy.select_targets_batch(signals, misses)
+        for i, row in enumerate(misses):
+            selected[row] = matrix.targets(i)
+            if row in keys:
+                signal_cache.put(signals.panel.dates[row], keys[row], selected[row])
+    return selected
+
+
+def _restore_targets(
+    strategy: BaseStrategy,
+    signals: SignalPanel,
+    rebalance_dates: List[str],
+    signal_cache: Optional[SignalCache] = None,
+    fingerprint: Optional[PriceFingerprint] = None,
+) -> Dict[str, float]:
+    """저장된 NAV 마지막 날짜 시점의 targets를 복원한다.
+
+    마지막 리밸런싱일부터 거슬러 올라가며 select_targets가 성공한 첫 리밸런싱을 쓴다
+    (RuntimeError 시 이전 targets 유지 규칙과 동일). 과거 전체를 재시뮬레이션하지 않는다.
+    """
+    for d in reversed(rebalance_dates):
+        row = signals.panel.row_of[d]
+        targets = _select_rows(strategy, signals, [row], signal_cache, fingerprint)[row]
+        if targets is not None:
+            return targets
+    return {}
+
+
+def _static_weight_nav(
+    panel: PricePanel,
+    rows: List[int],
+    start: int,
+    nav: float,
+    target_groups: List[Tuple[List[str], float]],
+) -> List[Tuple[str, float, float]]:
+    """고정 비중 전략의 rows[start:] NAV: 그룹 수익률 컬럼 × 비중 합을 누적한다.
 
-    SMA·변동성·상관관계 계산이 필요한 전략(GTAA, Ivy, FAA, EAA, LAA)에 사용됩니다.
+    리밸런싱 때마다 같은 비중으로 되돌아가고 엔진은 매 거래일 목표 비중을 적용하므로
+    (리밸런싱 사이 drift 없음) 점수·히스토리·리밸런싱일 계산 없이 일반 경로와 같은 NAV가 나온다.
     """
-    from app.assets.assets import group_tickers
-    histories: Dict[str, List[float]] = {}
-    for group in strategy.get_universe():
-        for ticker in group_tickers(group):
-            prices = _prices_up_to(price_dict, ticker, date)
-            if prices:
-                histories[ticker] = prices
-    return histories
+    weights = [w for _, w in target_groups]
+    group_returns = [
+        [_group_return(panel, tickers, rows[k - 1], rows[k]) for k in range(start, len(rows))]
+        for tickers, _ in target_groups
+    ]
+    results: List[Tuple[str, float, float]] = []
+    for row, day_returns in zip(rows[start:], zip(*group_returns)):
+        daily_return = sum(w * r for w, r in zip(weights, day_returns))
+        nav *= (1.0 + daily_return)
+        results.append((panel.dates[row], daily_return, nav))
+    return results
 
 
 def run_backtest(
@@ -87,6 +195,11 @@ def run_backtest(
     strategy: BaseStrategy,
     price_dict: Dict[str, Dict[str, float]],
     lookback_months: int = 60,
+    panel: Optional[PricePanel] = None,
+    resume: Optional[Tuple[str, float]] = None,
+    signal_cache: Optional[SignalCache] = None,
+    momentum: Optional[MomentumPanel] = None,
+    schedule: Union[str, Sequence[str]] = "monthly",
 ) -> List[Tuple[str, float, float]]:
     """전략의 과거 NAV 시계열을 시뮬레이션한다.
 
@@ -95,120 +208,269 @@ def run_backtest(
         strategy: BaseStrategy 인스턴스
         price_dict: {ticker: {date: close_price}}
         lookback_months: 최대 백테스트 기간 (월)
+        panel: price_dict로 만든 PricePanel (여러 전략 실행 시 공유, 없으면 생성)
+        resume: 저장된 마지막 (date, nav). 지정 시 그 날짜 이전 마지막 월말 리밸런싱으로
+            targets만 복원하고, 이후 날짜만 시뮬레이션한다 (증분 연장).
+        signal_cache: 리밸런싱 targets 디스크 캐시 (호출자가 save)
+        momentum: panel 기반 MomentumPanel (여러 전략 실행 시 공유, 없으면 생성)
+        schedule: 리밸런싱 주기 ("daily" / "weekly" / "monthly" / "quarterly" 또는 날짜 목록).
+            점수·SMA는 공유 누적 배열에서 O(1)로 읽으므로 짧은 주기도 20년 구간에 쓸 수 있다.
+
+    strategy.static_targets()가 비중을 반환하는 고정 비중 전략은 시그널 계산(점수·히스토리·
+    signal_cache)을 건너뛰고 첫 리밸런싱일부터 고정 비중 NAV를 바로 누적한다.
 
     Returns:
         [(date, daily_return, cumulative_nav), ...] 날짜 오름차순
+        (resume 지정 시 resume 날짜 이후 행만)
     """
-    # 모든 관련 티커의 날짜 수집
-    all_dates: List[str] = []
-    reload_assets(strategy.assets)
-    from app.assets.assets import group_tickers
-    relevant_tickers = set()
-    for group in strategy.get_universe():
-        for ticker in group_tickers(group):
-            if ticker in price_dict:
-                relevant_tickers.add(ticker)
-                all_dates.extend(price_dict[ticker].keys())
-
-    if not all_dates:
+    if panel is None:
+        panel = PricePanel.from_price_dict(price_dict)
+    if momentum is None:
+        momentum = MomentumPanel(panel)
+
+    static_targets = strategy.static_targets()
+    if static_targets is not None:
+        signal_cache = None
+    groups = _group_columns(strategy, panel)
+    signals = SignalPanel(strategy, panel, momentum, groups)
+    relevant = sorted({t for tickers in groups.values() for t in tickers})
+
+    # 관련 티커 중 하나라도 가격이 있는 행 = 이 전략의 날짜 축
+    columns = [panel.column(t) for t in relevant]
+    fingerprint = PriceFingerprint(panel, relevant) if signal_cache is not None else None
+    rows = [i for i in range(len(panel)) if any(col[i] == col[i] for col in columns)]
+
+    if not rows:
         print(f"⚠️  {strategy_name}: 가격 데이터 없음")
         return []
 
-    all_dates = sorted(set(all_dates))
-    month_ends = _get_month_end_dates(all_dates)
-
-    # 워밍업: 최소 12개월 데이터 필요
-    min_warmup = LOOKBACK_DAYS["12m"]
-
-    # 선택 가능한 날짜 범위 결정 (lookback_months 제한)
-    if len(month_ends) > lookback_months + 2:
-        month_ends = month_ends[-(lookback_months + 2):]
+    strategy_dates = [panel.dates[i] for i in rows]
+    month_ends = _get_month_end_dates(strategy_dates)
+    rebalance_dates = _get_rebalance_dates(strategy_dates, schedule)
 
     nav = 1.0
-    results: List[Tuple[str, float, float]] = []
+    start = 0
     current_targets: Dict[str, float] = {}
-    last_rebalance_date = ""
+    rebalanced = False
+
+    if resume is not None:
+        # 증분 연장: resume 날짜 이후 행만 시뮬레이션, 월말 범위 제한 없음
+        last_date, nav = resume
+        start = next((k for k, row in enumerate(rows) if panel.dates[row] > last_date), len(rows))
+        if start == len(rows):
+            return []
+        past_rebalances = [d for d in rebalance_dates if d <= last_date]
+        if static_targets is not None:
+            current_targets = static_targets if past_rebalances else {}
+        else:
+            current_targets = _restore_targets(
+                strategy, signals, past_rebalances, signal_cache, fingerprint,
+            )
+        rebalanced = True
+    elif len(month_ends) > lookback_months + 2:
+        # 선택 가능한 날짜 범위 결정 (lookback_months 제한: 최근 lookback_months+2개 월말부터)
+        first = month_ends[-(lookback_months + 2)]
+        rebalance_dates = [d for d in rebalance_dates if d >= first]
+
+    rebalance_rows = [panel.row_of[d] for d in rebalance_dates if panel.row_of[d] >= rows[start]]
+
+    if static_targets is not None:
+        # 고정 비중: 첫 리밸런싱일(resume 시 복원된 targets가 있으면 start)부터 바로 누적
+        if not current_targets:
+            if not rebalance_rows:
+                return []
+            start = bisect.bisect_left(rows, rebalance_rows[0])
+        target_groups = _target_groups(static_targets, groups, panel, strategy.universe)
+        return _static_weight_nav(panel, rows, max(start, 1), nav, target_groups)
+
+    # 리밸런싱일 targets는 시뮬레이션 전에 한 번에 계산 (캐시 적중분 제외)
+    rebalance_targets = _select_rows(
+        strategy, signals, rebalance_rows, signal_cache, fingerprint,
+    )
 
-    for i, date in enumerate(all_dates):
-        # 이 날짜가 월말이면 리밸런싱
-        if date in set(month_ends):
-            reload_assets(strategy.assets)
-            scores = _compute_scores_at_date(strategy, price_dict, date)
-            histories = _build_histories_at_date(strategy, price_dict, date)
-            try:
-                current_targets = strategy.select_targets(scores, histories=histories)
-            except RuntimeError:
-                pass  # 데이터 부족 시 이전 targets 유지
-            last_rebalance_date = date
+    results: List[Tuple[str, float, float]] = []
+    target_groups = _target_groups(current_targets, groups, panel, strategy.universe)
 
-        if not current_targets or not last_rebalance_date:
+    for k in range(start, len(rows)):
+        row = rows[k]
+        # 이 날짜가 월말이면 리밸런싱
+        if row in rebalance_targets:
+            targets = rebalance_targets[row]
+            if targets is not None:
+                current_targets = targets  # None(데이터 부족)이면 이전 targets 유지
+            target_groups = _target_groups(current_targets, groups, panel, strategy.universe)
+            rebalanced = True
+
+        if not current_targets or not rebalanced or k == 0:
             continue
 
         # 일별 수익률 계산
-        if i == 0:
-            continue
-
-        prev_date = all_dates[i - 1]
-
-        reload_assets(strategy.assets)
-        daily_return = _calc_daily_return(
-            current_targets, price_dict, prev_date, date
+        prev_row = rows[k - 1]
+        daily_return = sum(
+            w * _group_return(panel, tickers, prev_row, row) for tickers, w in target_groups
         )
 
         nav *= (1.0 + daily_return)
-        results.append((date, daily_return, nav))
+        results.append((panel.dates[row], daily_return, nav))
 
     return results
 
 
-def _calc_daily_return(
-    targets: Dict[str, float],
-    price_dict: Dict[str, Dict[str, float]],
-    prev_date: str,
-    curr_date: str,
-) -> float:
-    """전날 → 오늘의 가중 수익률 계산."""
-    return compute_weighted_return(targets, price_dict, prev_date, curr_date)
+# ── 병렬 실행 (--jobs N) ─────────────────────────────────────────────────────
+# 워커는 패널의 컬럼 저장소(ohlc_history.cols의 현재 세대)를 초기화 시 1회 mmap 하고,
+# 태스크에는 전략 이름만 넘긴다. 저장소 없이 만든 패널(SQLite 백엔드)만 임시 디렉터리에 쓴다.
+
+_WORKER_PANEL: Optional[PricePanel] = None
+_WORKER_MOMENTUM: Optional[MomentumPanel] = None
+
+
+def _init_worker(panel_dir: str, tickers: Optional[Tuple[str, ...]]) -> None:
+    global _WORKER_PANEL, _WORKER_MOMENTUM
+    if tickers is None:
+        store = open_price_store(Path(panel_dir))
+    else:
+        store = PriceStore(Path(panel_dir), list(tickers))
+    if store is None:
+        raise RuntimeError(f"가격 패널 파일 없음: {panel_dir}")
+    _WORKER_PANEL = PricePanel.from_store(store)
+    _WORKER_MOMENTUM = MomentumPanel(_WORKER_PANEL)
+
+
+def _backtest_task(
+    name: str,
+    lookback_months: int,
+    resume: Optional[Tuple[str, float]],
+    use_signal_cache: bool,
+) -> List[Tuple[str, float, float]]:
+    return _run_strategy(
+        name, _WORKER_PANEL, _WORKER_MOMENTUM, lookback_months, resume, use_signal_cache
+    )
+
+
+def _run_strategy(
+    name: str,
+    panel: PricePanel,
+    momentum: MomentumPanel,
+    lookback_months: int,
+    resume: Optional[Tuple[str, float]],
+    use_signal_cache: bool,
+) -> List[Tuple[str, float, float]]:
+    """전략 1개 백테스트 (시그널 캐시 로드 → 실행 → 캐시 저장)."""
+    from app.strategies import get_strategy
+
+    strategy = get_strategy(name)
+    signal_cache = None
+    if use_signal_cache:
+        signal_cache = SignalCache.load(name, strategy)
+    nav_series = run_backtest(
+        name, strategy, {}, lookback_months,
+        panel=panel, resume=resume, signal_cache=signal_cache, momentum=momentum,
+    )
+    if signal_cache is not None:
+        signal_cache.save()
+        if signal_cache.hits:
+            print(f"  💾 {name}: 시그널 캐시 {signal_cache.hits}건 재사용, {signal_cache.misses}건 계산")
+    return nav_series
+
+
+def _run_parallel(
+    pending: Dict[str, Optional[Tuple[str, float]]],
+    panel: PricePanel,
+    lookback_months: int,
+    jobs: int,
+    use_signal_cache: bool,
+) -> List[Tuple[str, float, float, float]]:
+    """전략별 백테스트를 jobs개 프로세스로 실행하고 (date, strategy, ret, nav) 행을 모은다."""
+    rows: List[Tuple[str, float, float, float]] = []
+    with contextlib.ExitStack() as stack:
+        if panel.store is not None:
+            initargs = (str(panel.store.directory), panel.store.tickers)
+        else:
+            panel_dir = stack.enter_context(tempfile.TemporaryDirectory(prefix="price_panel_"))
+            panel.save(Path(panel_dir))
+            initargs = (panel_dir, None)
+        with ProcessPoolExecutor(
+            max_workers=jobs, initializer=_init_worker, initargs=initargs
+        ) as pool:
+            futures = {
+                name: pool.submit(_backtest_task, name, lookback_months, resume, use_signal_cache)
+                for name, resume in pending.items()
+            }
+            for name, future in futures.items():
+                try:
+                    nav_series = future.result()
+                except Exception as e:
+                    print(f"  ❌ {name} 백테스트 실패: {e}")
+                    continue
+                rows.extend((date, name, ret, nav) for date, ret, nav in nav_series)
+                print(f"  ✅ {name}: {len(nav_series)}일치 NAV 계산 완료")
+    return rows
 
 
 def run_all_backtests(
     strategy_entries: List[Dict],
     lookback_months: int = 60,
+    jobs: int = 1,
+    incremental: bool = False,
+    use_signal_cache: bool = True,
 ) -> None:
-    """모든 전략의 백테스트를 실행하고 strategy_nav.csv에 저장한다."""
-    from app.strategies import get_strategy
-    from app.analytics.csv_logger import load_strategy_nav
+    """모든 전략의 백테스트를 실행하고 strategy_nav.csv에 저장한다.
+
+    jobs > 1이면 전략을 프로세스 풀로 나눠 실행하고, 결과를 모아 1회 bulk 기록한다.
+    incremental=True이면 NAV가 저장된 전략은 마지막 (date, nav)에서 이어서
+    새 날짜만 시뮬레이션한다 (NAV가 없는 전략은 전체 백테스트).
+    use_signal_cache=True이면 과거 월말 targets를 data/signal_cache/에서 재사용한다.
+    """
+    from app.analytics.csv_logger import load_strategy_nav_frame
 
     # 기존 NAV 데이터 확인
-    existing_nav = load_strategy_nav()
+    existing_nav = load_strategy_nav_frame()
 
-    # 전체 price_dict 구축 (ohlc_history.csv 활용)
+    # 날짜 × 티커 패널은 컬럼 저장소(mmap)를 그대로 쓰고, 모멘텀 패널과 함께 모든 전략이 공유
     print("📂 가격 히스토리 로드 중...")
-    price_dict = load_ohlc_prices()
-
-    if not price_dict:
-        print("⚠️  ohlc_history.csv에 데이터 없음. run_backfill.py를 먼저 실행하세요.")
-        return
-
-    for entry in strategy_entries:
-        name = entry["name"]
-
-        # 이미 충분한 데이터가 있으면 스킵
-        existing = existing_nav.get(name, [])
-        if len(existing) > LOOKBACK_DAYS["12m"]:
-            print(f"⏭️  {name}: 이미 NAV 데이터 있음 ({len(existing)}일치), 스킵")
-            continue
-
-        print(f"\n🔄 {name} 백테스트 실행 중...")
-        try:
-            strategy = get_strategy(name)
-            nav_series = run_backtest(name, strategy, price_dict, lookback_months)
+    with open_ohlc_panel() as panel:
+        if panel is None:
+            print("⚠️  ohlc_history.csv에 데이터 없음. run_backfill.py를 먼저 실행하세요.")
+            return
+        momentum = MomentumPanel(panel)
+
+        # {전략: resume (date, nav) 또는 None(전체 백테스트)}
+        pending: Dict[str, Optional[Tuple[str, float]]] = {}
+        for entry in strategy_entries:
+            name = entry["name"]
+            existing = existing_nav.count(name)
+
+            if incremental and existing:
+                pending[name] = existing_nav.last(name)
+                continue
+
+            # 이미 충분한 데이터가 있으면 스킵
+            if existing > LOOKBACK_DAYS["12m"]:
+                print(f"⏭️  {name}: 이미 NAV 데이터 있음 ({existing}일치), 스킵")
+                continue
+            pending[name] = None
+
+        if jobs > 1 and len(pending) > 1:
+            print(f"\n🔄 {len(pending)}개 전략 백테스트 병렬 실행 중 (jobs={jobs})...")
+            rows = _run_parallel(pending, panel, lookback_months, jobs, use_signal_cache)
+            saved = save_strategy_nav_many(rows)
+            print(f"  ✅ {saved}행 NAV 저장 완료")
+            return
+
+        for name, resume in pending.items():
+            if resume is None:
+                print(f"\n🔄 {name} 백테스트 실행 중...")
+            else:
+                print(f"\n🔄 {name} NAV 연장 중 ({resume[0]} 이후)...")
+            try:
+                nav_series = _run_strategy(
+                    name, panel, momentum, lookback_months, resume, use_signal_cache
+                )
 
-            saved = 0
-            for date, daily_ret, nav_val in nav_series:
-                save_strategy_nav(date, name, daily_ret, nav_val)
-                saved += 1
+                saved = save_strategy_nav_many(
+                    (date, name, daily_ret, nav_val) for date, daily_ret, nav_val in nav_series
+                )
 
-            print(f"  ✅ {name}: {saved}일치 NAV 저장 완료")
-        except Exception as e:
-            print(f"  ❌ {name} 백테스트 실패: {e}")
+                print(f"  ✅ {name}: {saved}일치 NAV 저장 완료")
+            except Exception as e:
+                print(f"  ❌ {name} 백테스트 실패: {e}")
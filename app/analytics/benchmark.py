@@ -7,17 +7,21 @@ ohlc_history.csv의 SPY, AGG 가격으로 두 가지 벤치마크 NAV를 생성
 daily_return 기준으로 NAV를 누적한다.
 """
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, Iterable, List, Optional
 
 DATA_DIR = Path(__file__).resolve().parent.parent.parent / "data"
 BENCHMARK_NAV_CSV = DATA_DIR / "benchmark_nav.csv"
 
 
-def build_benchmark_nav(ohlc_rows: List[Dict]) -> List[Dict]:
+BENCHMARK_TICKERS = ["SPY", "AGG"]
+
+
+def build_benchmark_nav(ohlc_rows: Iterable[Dict]) -> List[Dict]:
     """ohlc_rows에서 벤치마크 NAV 시계열을 생성한다.
 
-    ohlc_rows: csv_logger.load_ohlc_history() 반환값 (list of dicts)
-    각 row: {"date": "YYYY-MM-DD", "ticker": "...", "close": "..."}
+    ohlc_rows: csv_logger.iter_ohlc_history(BENCHMARK_TICKERS) 또는
+               load_ohlc_history() 반환값 (1회 순회)
+    각 row: {"date": "YYYY-MM-DD", "ticker": "...", "close": ...}
 
     Returns: [{"date": ..., "spy_nav": ..., "spy_return": ...,
                 "balanced_nav": ..., "balanced_return": ...}, ...]
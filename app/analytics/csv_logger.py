@@ -1,7 +1,13 @@
 import csv
+import io
+import json
 import os
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import TYPE_CHECKING, Dict, Iterable, Iterator, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    from app.analytics.price_panel import PricePanel
 
 
 def _normalize_date(date_str: str) -> str:
@@ -39,31 +45,220 @@ STRATEGY_NAV_HEADER = ["date", "strategy", "daily_return", "nav", "net_nav", "ne
 PORTFOLIO_NAV_MODEL_HEADER = ["date", "nav", "daily_return", "net_nav", "net_daily_return"]
 PORTFOLIO_NAV_ACTUAL_HEADER = ["date", "nav", "daily_return", "total_equity", "fx_rate", "krw_nav"]
 
+# 파일별 중복 판정 키 (append 시 dedup 기준)
+HOLDINGS_KEY = ("date", "ticker")
+MOMENTUM_KEY = ("date", "strategy", "group")
+PORTFOLIO_KEY = ("date", "strategy", "group")
+PORTFOLIO_STATE_KEY = ("date",)
+STRATEGY_SIGNALS_KEY = ("date", "strategy")
+STRATEGY_NAV_KEY = ("date", "strategy")
+PORTFOLIO_NAV_KEY = ("date",)
+OHLC_KEY = ("ticker", "date")
+
+# 저장 백엔드: "csv"(기본) 또는 "sqlite"
+# 환경변수 CLASSICQUANT_STORAGE 또는 set_storage_backend()로 선택한다.
+STORAGE_BACKENDS = ("csv", "sqlite")
+STORAGE_BACKEND = os.environ.get("CLASSICQUANT_STORAGE", "csv")
+SQLITE_DB = DATA_DIR / "classicquant.sqlite3"
+_SQLITE_STORAGE = None
+
 
 def _ensure_dir() -> None:
     DATA_DIR.mkdir(parents=True, exist_ok=True)
 
 
-def _existing_dates_in_csv(
-    path: Path,
-    date_col: str,
-    filter_col: Optional[str] = None,
-    filter_val: Optional[str] = None,
-) -> set:
-    """CSV 파일에서 기존 날짜 집합을 반환한다.
-
-    filter_col/filter_val 지정 시 해당 컬럼 값이 일치하는 행만 검사한다.
-    파일이 없거나 비어 있으면 빈 set을 반환한다.
+def set_storage_backend(name: str) -> None:
+    """save_*/load_* 함수가 사용할 저장 백엔드를 바꾼다 ("csv" | "sqlite")."""
+    global STORAGE_BACKEND
+    if name not in STORAGE_BACKENDS:
+        raise ValueError(f"알 수 없는 저장 백엔드: {name} (지원: {', '.join(STORAGE_BACKENDS)})")
+    STORAGE_BACKEND = name
+
+
+def _sqlite():
+    """SQLite 백엔드 사용 중이면 열린 SqliteStorage를, CSV 백엔드면 None을 반환한다.
+
+    DB 파일을 처음 만들 때는 기존 data/ CSV를 모두 가져와 초기화한다.
     """
-    if not path.exists() or path.stat().st_size == 0:
+    global _SQLITE_STORAGE
+    if STORAGE_BACKEND != "sqlite":
+        return None
+    if _SQLITE_STORAGE is None or _SQLITE_STORAGE.path != SQLITE_DB:
+        from app.analytics.sqlite_store import SqliteStorage
+
+        _ensure_dir()
+        fresh = not SQLITE_DB.exists()
+        if _SQLITE_STORAGE is not None:
+            _SQLITE_STORAGE.close()
+        _SQLITE_STORAGE = SqliteStorage(SQLITE_DB)
+        if fresh:
+            for path, header, key_cols in _data_files():
+                _SQLITE_STORAGE.import_csv(path.stem, path, header, key_cols)
+    return _SQLITE_STORAGE
+
+
+def _data_files() -> List[Tuple[Path, List[str], Tuple[str, ...]]]:
+    """키로 관리되는 data/ CSV 목록: (경로, 헤더, 키 컬럼)."""
+    return [
+        (HOLDINGS_CSV, HOLDINGS_HEADER, HOLDINGS_KEY),
+        (MOMENTUM_CSV, MOMENTUM_HEADER, MOMENTUM_KEY),
+        (PORTFOLIO_CSV, PORTFOLIO_HEADER, PORTFOLIO_KEY),
+        (PORTFOLIO_STATE_CSV, PORTFOLIO_STATE_HEADER, PORTFOLIO_STATE_KEY),
+        (STRATEGY_SIGNALS_CSV, STRATEGY_SIGNALS_HEADER, STRATEGY_SIGNALS_KEY),
+        (STRATEGY_NAV_CSV, STRATEGY_NAV_HEADER, STRATEGY_NAV_KEY),
+        (PORTFOLIO_NAV_MODEL_CSV, PORTFOLIO_NAV_MODEL_HEADER, PORTFOLIO_NAV_KEY),
+        (PORTFOLIO_NAV_ACTUAL_CSV, PORTFOLIO_NAV_ACTUAL_HEADER, PORTFOLIO_NAV_KEY),
+        (OHLC_CSV, OHLC_HEADER, OHLC_KEY),
+    ]
+
+
+def export_storage_to_csv() -> Dict[str, int]:
+    """SQLite 백엔드의 테이블을 data/ CSV 스냅샷(키 순 정렬)으로 내보낸다.
+
+    git에 커밋하는 CSV를 SQLite 내용과 맞출 때 사용한다. CSV 백엔드면 아무것도 하지 않는다.
+    반환: {파일명: 행 수}
+    """
+    store = _sqlite()
+    if store is None:
+        return {}
+    return {
+        path.name: store.export_csv(path.stem, path, key_cols)
+        for path, _, key_cols in _data_files()
+        if store.has_table(path.stem)
+    }
+
+
+# 키 인덱스 사이드카: <csv>.<key_cols>.idx
+# 1행: 마지막으로 동기화한 CSV의 "size mtime_ns" (고정 폭, 제자리 갱신)
+# 2행~: 탭으로 구분된 키 (append 시 신규 키만 덧붙임)
+_KEY_INDEX_HEADER_LEN = 42
+_KEY_INDEX_CACHE: Dict[Path, Tuple[Tuple[int, int], set]] = {}
+
+
+def _file_signature(path: Path) -> Optional[Tuple[int, int]]:
+    if not path.exists():
+        return None
+    st = path.stat()
+    return st.st_size, st.st_mtime_ns
+
+
+def _key_index_path(path: Path, key_cols: Tuple[str, ...]) -> Path:
+    return path.with_name(f"{path.name}.{'+'.join(key_cols)}.idx")
+
+
+def _key_index_header(signature: Tuple[int, int]) -> bytes:
+    return f"{signature[0]:020d} {signature[1]:020d}\n".encode("ascii")
+
+
+def _row_key(row: Dict, key_cols: Tuple[str, ...]) -> Tuple[str, ...]:
+    return tuple(
+        _normalize_date(row.get(col, "")) if col == "date" else row.get(col, "")
+        for col in key_cols
+    )
+
+
+def _read_key_index(idx_path: Path, signature: Tuple[int, int]) -> Optional[set]:
+    """사이드카가 현재 CSV와 동기화되어 있으면 키 집합을, 아니면 None을 반환한다."""
+    try:
+        with open(idx_path, "rb") as f:
+            if f.read(_KEY_INDEX_HEADER_LEN) != _key_index_header(signature):
+                return None
+            return {tuple(line.split("\t")) for line in f.read().decode("utf-8").splitlines()}
+    except OSError:
+        return None
+
+
+def _write_key_index(idx_path: Path, signature: Tuple[int, int], keys: Iterable[Tuple[str, ...]]) -> None:
+    with open(idx_path, "wb") as f:
+        f.write(_key_index_header(signature))
+        f.write("".join("\t".join(key) + "\n" for key in keys).encode("utf-8"))
+
+
+def _extend_key_index(
+    idx_path: Path,
+    synced: Tuple[int, int],
+    signature: Tuple[int, int],
+    new_keys: List[Tuple[str, ...]],
+) -> bool:
+    """사이드카가 synced 시점과 일치하면 신규 키만 덧붙이고 헤더를 갱신한다.
+
+    사이드카가 없거나 다른 시점이면 False를 반환한다 (호출자가 전체 재작성).
+    """
+    try:
+        with open(idx_path, "r+b") as f:
+            if f.read(_KEY_INDEX_HEADER_LEN) != _key_index_header(synced):
+                return False
+            f.seek(0, os.SEEK_END)
+            f.write("".join("\t".join(key) + "\n" for key in new_keys).encode("utf-8"))
+            f.seek(0)
+            f.write(_key_index_header(signature))
+            return True
+    except OSError:
+        return False
+
+
+def _existing_keys(path: Path, key_cols: Tuple[str, ...]) -> set:
+    """CSV에 이미 존재하는 키 집합을 반환한다.
+
+    키 인덱스 사이드카가 CSV의 size/mtime과 일치하면 CSV를 읽지 않는다.
+    불일치(외부 수정, 최초 실행)일 때만 CSV 전체를 스캔해 사이드카를 재생성한다.
+    반환된 set은 프로세스 내에서 공유되므로 호출자가 직접 수정하지 않는다.
+    """
+    signature = _file_signature(path)
+    if signature is None or signature[0] == 0:
         return set()
-    with open(path, "r", newline="", encoding="utf-8") as f:
-        reader = csv.DictReader(f)
-        return {
-            _normalize_date(row.get(date_col, ""))
-            for row in reader
-            if filter_col is None or row.get(filter_col) == filter_val
-        }
+
+    idx_path = _key_index_path(path, key_cols)
+    cached = _KEY_INDEX_CACHE.get(idx_path)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+
+    keys = _read_key_index(idx_path, signature)
+    if keys is None:
+        with open(path, "r", newline="", encoding="utf-8") as f:
+            keys = {_row_key(row, key_cols) for row in csv.DictReader(f)}
+        _write_key_index(idx_path, signature, keys)
+    _KEY_INDEX_CACHE[idx_path] = (signature, keys)
+    return keys
+
+
+def _append_keyed_rows(
+    path: Path,
+    header: List[str],
+    key_cols: Tuple[str, ...],
+    keyed_rows: Iterable[Tuple[Tuple[str, ...], List]],
+) -> int:
+    """(키, 행) 목록에서 기존·배치 내 중복 키를 제외하고 append 한 뒤 사이드카를 갱신한다.
+
+    반환: 실제로 기록된 행 수
+    """
+    store = _sqlite()
+    if store is not None:
+        return store.insert_rows(path.stem, header, key_cols, (row for _, row in keyed_rows))
+
+    existing = _existing_keys(path, key_cols)
+    new_keys: List[Tuple[str, ...]] = []
+    rows: List[List] = []
+    seen = set()
+    for key, row in keyed_rows:
+        if key in existing or key in seen:
+            continue
+        seen.add(key)
+        new_keys.append(key)
+        rows.append(row)
+    if not rows:
+        return 0
+
+    synced = _file_signature(path)
+    _append_rows(path, header, rows)
+    signature = _file_signature(path)
+
+    idx_path = _key_index_path(path, key_cols)
+    keys = existing | seen
+    if synced is None or synced[0] == 0 or not _extend_key_index(idx_path, synced, signature, new_keys):
+        _write_key_index(idx_path, signature, keys)
+    _KEY_INDEX_CACHE[idx_path] = (signature, keys)
+    return len(rows)
 
 
 def _append_rows(path: Path, header: List[str], rows: List[List]) -> None:
@@ -138,32 +333,26 @@ def _append_unique_rows(
     path: Path,
     header: List[str],
     rows: List[List],
-    existing_key_fn,
-    row_key_fn,
+    key_cols: Tuple[str, ...],
 ) -> None:
     """기존 키와 중복되지 않는 행만 append 한다.
 
     기존 파일의 마지막 기록을 유지한 채, 같은 키의 중복 재실행만 방지한다.
+    키는 key_cols 컬럼 값 튜플이며 date 컬럼은 정규화하여 비교한다.
     """
     _ensure_dir()
-
-    existing_keys = set()
-    if path.exists() and path.stat().st_size > 0:
-        with open(path, "r", newline="", encoding="utf-8") as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                existing_keys.add(existing_key_fn(row))
-
-    unique_rows: List[List] = []
-    for row in rows:
-        key = row_key_fn(row)
-        if key in existing_keys:
-            continue
-        existing_keys.add(key)
-        unique_rows.append(row)
-
-    if unique_rows:
-        _append_rows(path, header, unique_rows)
+    positions = [header.index(col) for col in key_cols]
+    keyed_rows = [
+        (
+            tuple(
+                _normalize_date(row[i]) if col == "date" else str(row[i])
+                for col, i in zip(key_cols, positions)
+            ),
+            row,
+        )
+        for row in rows
+    ]
+    _append_keyed_rows(path, header, key_cols, keyed_rows)
 
 
 def save_holdings(
@@ -185,14 +374,7 @@ def save_holdings(
             HOLDINGS_CSV,
             HOLDINGS_HEADER,
             rows,
-            existing_key_fn=lambda row: (
-                _normalize_date(row.get("date", "")),
-                row.get("ticker", ""),
-            ),
-            row_key_fn=lambda row: (
-                _normalize_date(row[0]),
-                row[1],
-            ),
+            key_cols=HOLDINGS_KEY,
         )
 
 
@@ -221,16 +403,7 @@ def save_momentum(
             MOMENTUM_CSV,
             MOMENTUM_HEADER,
             rows,
-            existing_key_fn=lambda row: (
-                _normalize_date(row.get("date", "")),
-                row.get("strategy", ""),
-                row.get("group", ""),
-            ),
-            row_key_fn=lambda row: (
-                _normalize_date(row[0]),
-                row[1],
-                row[2],
-            ),
+            key_cols=MOMENTUM_KEY,
         )
 
 
@@ -262,16 +435,7 @@ def save_portfolio(
             PORTFOLIO_CSV,
             PORTFOLIO_HEADER,
             rows,
-            existing_key_fn=lambda row: (
-                _normalize_date(row.get("date", "")),
-                row.get("strategy", ""),
-                row.get("group", ""),
-            ),
-            row_key_fn=lambda row: (
-                _normalize_date(row[0]),
-                row[3],
-                row[4],
-            ),
+            key_cols=PORTFOLIO_KEY,
         )
 
 
@@ -280,12 +444,14 @@ def save_portfolio_state(date: str, total_equity: float, cash: float) -> None:
         PORTFOLIO_STATE_CSV,
         PORTFOLIO_STATE_HEADER,
         [[date, f"{total_equity:.2f}", f"{cash:.2f}"]],
-        existing_key_fn=lambda row: _normalize_date(row.get("date", "")),
-        row_key_fn=lambda row: _normalize_date(row[0]),
+        key_cols=PORTFOLIO_STATE_KEY,
     )
 
 
 def load_portfolio_state() -> List[Dict]:
+    store = _sqlite()
+    if store is not None:
+        return store.select(PORTFOLIO_STATE_CSV.stem)
     if not PORTFOLIO_STATE_CSV.exists():
         return []
     rows = []
@@ -321,19 +487,15 @@ def save_strategy_signal(
         STRATEGY_SIGNALS_CSV,
         STRATEGY_SIGNALS_HEADER,
         [row],
-        existing_key_fn=lambda existing_row: (
-            _normalize_date(existing_row.get("date", "")),
-            existing_row.get("strategy", ""),
-        ),
-        row_key_fn=lambda new_row: (
-            _normalize_date(new_row[0]),
-            new_row[1],
-        ),
+        key_cols=STRATEGY_SIGNALS_KEY,
     )
 
 
 def load_strategy_signals(strategy_name: str) -> List[Dict]:
     """특정 전략의 모든 신호를 날짜 순으로 로드한다."""
+    store = _sqlite()
+    if store is not None:
+        return store.select(STRATEGY_SIGNALS_CSV.stem, {"strategy": strategy_name})
     if not STRATEGY_SIGNALS_CSV.exists():
         return []
     rows = []
@@ -365,34 +527,69 @@ def save_strategy_nav(
     """
     _ensure_dir()
     date = _normalize_date(date)
+    row = _format_strategy_nav_row(date, strategy_name, daily_return, nav, net_nav, net_daily_return)
+    _append_keyed_rows(STRATEGY_NAV_CSV, STRATEGY_NAV_HEADER, STRATEGY_NAV_KEY, [((date, strategy_name), row)])
 
-    if date in _existing_dates_in_csv(STRATEGY_NAV_CSV, "date", "strategy", strategy_name):
-        return
 
+def _format_strategy_nav_row(
+    date: str,
+    strategy_name: str,
+    daily_return: float,
+    nav: float,
+    net_nav: Optional[float] = None,
+    net_daily_return: Optional[float] = None,
+) -> List:
     net_nav_str = f"{net_nav:.6f}" if net_nav is not None else ""
     net_dr_str = f"{net_daily_return:.6f}" if net_daily_return is not None else ""
-    row = [date, strategy_name, f"{daily_return:.6f}", f"{nav:.6f}", net_nav_str, net_dr_str]
-    _append_rows(STRATEGY_NAV_CSV, STRATEGY_NAV_HEADER, [row])
+    return [date, strategy_name, f"{daily_return:.6f}", f"{nav:.6f}", net_nav_str, net_dr_str]
 
 
-def load_strategy_nav(strategy_name: Optional[str] = None) -> Dict[str, List[Dict]]:
-    """strategy_nav.csv를 로드한다.
+def save_strategy_nav_many(nav_rows: Iterable[Tuple]) -> int:
+    """여러 전략 NAV 행을 strategy_nav.csv에 한 번에 기록한다 (중복 (전략, 날짜) 스킵).
 
-    strategy_name 지정 시 해당 전략만 반환, None이면 전체 반환.
-    날짜를 YYYY-MM-DD로 정규화하고, (전략, 날짜) 중복은 파일 하단(최신 기록) 우선으로 제거한다.
-    반환: {strategy_name: [{date, daily_return, nav}, ...]} (날짜 오름차순)
+    nav_rows: (date, strategy_name, daily_return, nav[, net_nav, net_daily_return]) 튜플들.
+    기존 키는 키 인덱스 사이드카에서 한 번만 읽고, 신규 행은 단일 append로 쓴다.
+    반환: 실제로 기록된 행 수
     """
-    if not STRATEGY_NAV_CSV.exists():
-        return {}
+    _ensure_dir()
+    keyed_rows = []
+    for date, strategy_name, *values in nav_rows:
+        date = _normalize_date(date)
+        keyed_rows.append(((date, strategy_name), _format_strategy_nav_row(date, strategy_name, *values)))
+    return _append_keyed_rows(STRATEGY_NAV_CSV, STRATEGY_NAV_HEADER, STRATEGY_NAV_KEY, keyed_rows)
+
+
+# 프로세스 내 파싱 결과 캐시: {path: ((size, mtime_ns), parsed)}
+_LOAD_CACHE: Dict[Tuple[Path, str], Tuple[Tuple[int, int], object]] = {}
+
+
+def _cached_load(path: Path, kind: str, parser):
+    """CSV 파싱 결과를 (경로, 형태, size, mtime) 기준으로 캐시한다.
+
+    파일이 바뀌지 않았으면 이전 파싱 결과를 그대로 돌려주므로, 한 번의 실행 안에서
+    같은 파일을 여러 번 로드해도 파싱은 1회만 일어난다. 파일이 없으면 None.
+    kind는 같은 파일을 다른 형태(행 dict / 컬럼 프레임)로 파싱한 결과를 구분한다.
+    """
+    key = (path, kind)
+    signature = _file_signature(path)
+    if signature is None:
+        _LOAD_CACHE.pop(key, None)
+        return None
+    cached = _LOAD_CACHE.get(key)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+    parsed = parser(path)
+    _LOAD_CACHE[key] = (signature, parsed)
+    return parsed
+
+
+def _parse_strategy_nav(path: Path) -> Dict[str, List[Dict]]:
     raw: Dict[str, List[Dict]] = {}
-    with open(STRATEGY_NAV_CSV, "r", newline="", encoding="utf-8") as f:
+    with open(path, "r", newline="", encoding="utf-8") as f:
         reader = csv.DictReader(f)
         for row in reader:
-            name = row.get("strategy", "")
-            if strategy_name and name != strategy_name:
-                continue
             row["date"] = _normalize_date(row.get("date", ""))
-            raw.setdefault(name, []).append(row)
+            raw.setdefault(row.get("strategy", ""), []).append(row)
 
     result: Dict[str, List[Dict]] = {}
     for name, rows in raw.items():
@@ -404,12 +601,85 @@ def load_strategy_nav(strategy_name: Optional[str] = None) -> Dict[str, List[Dic
     return result
 
 
+def load_strategy_nav(strategy_name: Optional[str] = None) -> Dict[str, List[Dict]]:
+    """strategy_nav.csv를 로드한다.
+
+    strategy_name 지정 시 해당 전략만 반환, None이면 전체 반환.
+    날짜를 YYYY-MM-DD로 정규화하고, (전략, 날짜) 중복은 파일 하단(최신 기록) 우선으로 제거한다.
+    파싱 결과는 프로세스 내에서 캐시·공유되므로 반환된 행을 수정하지 않는다.
+    반환: {strategy_name: [{date, daily_return, nav}, ...]} (날짜 오름차순)
+    """
+    store = _sqlite()
+    if store is not None:
+        where = {"strategy": strategy_name} if strategy_name else None
+        result: Dict[str, List[Dict]] = {}
+        for row in store.select(STRATEGY_NAV_CSV.stem, where, order_by=("strategy", "date")):
+            result.setdefault(row["strategy"], []).append(row)
+        return result
+
+    parsed = _cached_load(STRATEGY_NAV_CSV, "rows", _parse_strategy_nav)
+    if not parsed:
+        return {}
+    if strategy_name:
+        return {strategy_name: parsed[strategy_name]} if strategy_name in parsed else {}
+    return dict(parsed)
+
+
+def _parse_strategy_nav_frame(path: Path):
+    from app.analytics.nav_frame import StrategyNavFrame
+
+    with open(path, "r", newline="", encoding="utf-8") as f:
+        return StrategyNavFrame.from_rows(csv.DictReader(f))
+
+
+def load_strategy_nav_frame():
+    """strategy_nav.csv를 컬럼형 StrategyNavFrame으로 로드한다.
+
+    정수 날짜 축 + 전략별 float64 컬럼(daily_return, nav, net_nav, net_daily_return)으로
+    보관하므로 소비 측에서 문자열 → float 변환을 반복하지 않는다.
+    중복 처리는 load_strategy_nav와 같고, 결과는 프로세스 내에서 캐시·공유된다.
+    파일이 없으면 빈 프레임을 반환한다.
+    """
+    from app.analytics.nav_frame import StrategyNavFrame
+
+    store = _sqlite()
+    if store is not None:
+        return StrategyNavFrame.from_rows(store.select(STRATEGY_NAV_CSV.stem))
+
+    frame = _cached_load(STRATEGY_NAV_CSV, "frame", _parse_strategy_nav_frame)
+    return frame if frame is not None else StrategyNavFrame.from_rows([])
+
+
+def load_latest_strategy_nav(strategy_name: str) -> Optional[Dict]:
+    """전략의 가장 최근 NAV 행. 없으면 None.
+
+    SQLite 백엔드에서는 (strategy, date) 기본 키 역순 탐색 1회로 끝난다.
+    """
+    store = _sqlite()
+    if store is not None:
+        return store.latest(STRATEGY_NAV_CSV.stem, {"strategy": strategy_name})
+    series = load_strategy_nav(strategy_name).get(strategy_name)
+    return series[-1] if series else None
+
+
 def load_portfolio_snapshots() -> List[Dict]:
-    """portfolio.csv에서 날짜별 포트폴리오 스냅샷을 로드한다."""
+    """portfolio.csv에서 날짜별 포트폴리오 스냅샷을 로드한다.
+
+    날짜마다 마지막으로 기록된 행을 고른다 (CSV: 파일 하단 행, SQLite: 기록 순번이 가장 큰 행).
+    """
+    raw: Dict[str, Dict] = {}
+    store = _sqlite()
+    if store is not None:
+        from app.analytics.sqlite_store import INSERTION_ORDER
+
+        order = (INSERTION_ORDER, "date", "strategy", "group")
+        for row in store.select(PORTFOLIO_CSV.stem, order_by=order):
+            raw[row["date"]] = row
+        return sorted(raw.values(), key=lambda r: r.get("date", ""))
+
     if not PORTFOLIO_CSV.exists():
         return []
 
-    raw: Dict[str, Dict] = {}
     with open(PORTFOLIO_CSV, "r", newline="", encoding="utf-8") as f:
         reader = csv.DictReader(f)
         for row in reader:
@@ -428,6 +698,10 @@ def load_ohlc_history(tickers: Optional[List[str]] = None) -> List[Dict]:
     반환: [{"ticker": ..., "date": ..., "close": ...}, ...] (날짜 오름차순)
     tickers 지정 시 해당 티커만 반환한다.
     """
+    store = _sqlite()
+    if store is not None:
+        where = {"ticker": tickers} if tickers else None
+        return store.select(OHLC_CSV.stem, where, order_by=("date",))
     if not OHLC_CSV.exists():
         return []
     ticker_set = set(tickers) if tickers else None
@@ -446,61 +720,336 @@ def load_ohlc_history(tickers: Optional[List[str]] = None) -> List[Dict]:
     return sorted(rows, key=lambda r: r.get("date", ""))
 
 
+def iter_ohlc_history(
+    tickers: Optional[List[str]] = None,
+    start: Optional[str] = None,
+    end: Optional[str] = None,
+) -> Iterator[Dict]:
+    """ohlc_history.csv 행을 날짜 오름차순으로 하나씩 생성한다.
+
+    load_ohlc_history와 달리 전체 행을 메모리에 올리거나 정렬하지 않는다.
+    티커별로 날짜 정렬된 mmap 컬럼 저장소(price_store)를 날짜 축 순서대로 훑으며,
+    start/end(포함, YYYY-MM-DD 또는 YYYYMMDD)는 날짜 축에서 이분 탐색으로 자른다.
+    (ticker, date) 중복은 저장소와 같이 하단 기록 우선, close는 float.
+    반환: {"ticker": ..., "date": ..., "close": float} 이터레이터 (같은 날짜 안에서는 tickers 순서)
+    """
+    from bisect import bisect_left, bisect_right
+    from app.analytics.price_store import load_price_store
+    from app.time_utils import date_to_int, int_to_date
+
+    sqlite_store = _sqlite()
+    if sqlite_store is not None:
+        yield from _iter_ohlc_history_sqlite(sqlite_store, tickers, start, end)
+        return
+
+    store = load_price_store(OHLC_CSV)
+    if store is None:
+        return
+    try:
+        wanted = store.tickers if not tickers else [t for t in tickers if t in store]
+        columns = [(ticker, store.column(ticker)) for ticker in wanted]
+        dates = store.dates
+        lo = bisect_left(dates, date_to_int(start)) if start else 0
+        hi = bisect_right(dates, date_to_int(end)) if end else len(dates)
+        for i in range(lo, hi):
+            label = int_to_date(dates[i])
+            for ticker, col in columns:
+                close = col[i]
+                if close == close:
+                    yield {"ticker": ticker, "date": label, "close": close}
+    finally:
+        store.close()
+
+
+def _iter_ohlc_history_sqlite(store, tickers, start, end) -> Iterator[Dict]:
+    rank = {t: i for i, t in enumerate(tickers)} if tickers else None
+    where = {"ticker": tickers} if tickers else None
+    batch: List[Dict] = []
+    for row in store.select(OHLC_CSV.stem, where, order_by=("date", "ticker"),
+                            start=_normalize_date(start) if start else None,
+                            end=_normalize_date(end) if end else None):
+        try:
+            close = float(row["close"])
+        except (ValueError, TypeError):
+            continue
+        if batch and batch[0]["date"] != row["date"]:
+            yield from (sorted(batch, key=lambda r: rank[r["ticker"]]) if rank else batch)
+            batch = []
+        batch.append({"ticker": row["ticker"], "date": row["date"], "close": close})
+    yield from (sorted(batch, key=lambda r: rank[r["ticker"]]) if rank else batch)
+
+
 def load_ohlc_prices(tickers: Optional[List[str]] = None) -> Dict[str, Dict[str, float]]:
     """ohlc_history.csv에서 가격 데이터를 로드한다.
 
+    CSV를 직접 파싱하지 않고 mmap 컬럼 저장소(price_store)에서 읽는다.
+    저장소는 CSV가 바뀌었을 때만 재생성된다.
     반환: {ticker: {date: close_price}}
     """
-    if not OHLC_CSV.exists():
+    from app.analytics.price_store import load_price_store
+
+    sqlite_store = _sqlite()
+    if sqlite_store is not None:
+        prices: Dict[str, Dict[str, float]] = {}
+        for row in _iter_ohlc_history_sqlite(sqlite_store, tickers, None, None):
+            prices.setdefault(row["ticker"], {})[row["date"]] = row["close"]
+        return prices
+
+    store = load_price_store(OHLC_CSV)
+    if store is None:
         return {}
-    result: Dict[str, Dict[str, float]] = {}
-    ticker_set = set(tickers) if tickers else None
+    with store:
+        return store.to_price_dict(tickers)
+
+
+@contextmanager
+def open_ohlc_panel() -> Iterator[Optional["PricePanel"]]:
+    """ohlc_history를 날짜 × 티커 PricePanel로 연다 (with 블록 안에서만 유효).
+
+    CSV 백엔드는 {ticker: {date: close}} 변환 없이 mmap 컬럼 저장소를 그대로 패널로 쓰고,
+    블록이 끝나면 저장소를 닫는다. SQLite 백엔드는 load_ohlc_prices 결과로 패널을 만든다.
+    데이터가 없으면 None.
+    """
+    from app.analytics.price_panel import PricePanel
+    from app.analytics.price_store import load_price_store
+
+    if _sqlite() is not None:
+        prices = load_ohlc_prices()
+        yield PricePanel.from_price_dict(prices) if prices else None
+        return
+
+    store = load_price_store(OHLC_CSV)
+    if store is None:
+        yield None
+        return
+    with store:
+        yield PricePanel.from_store(store) if store.tickers else None
+
+
+# 티커별 high-water mark 사이드카: ohlc_history.csv.watermark.json
+# {"version", "size", "mtime_ns", "tickers": {ticker: {"last", "count", "recent"}}}
+# - last:   마지막 저장 날짜
+# - count:  저장된 행 수
+# - recent: 저장된 날짜 중 최근 _OHLC_RECENT_DATES개 (오름차순, 중복 없음)
+# 수집 시 API가 돌려주는 최근 ~260 bar 창은 recent 범위 안에서 겹치므로,
+# 겹치는 날짜는 recent로 dedup 하고 CSV 전체 스캔은 recent 이전 날짜가 들어올 때만 한다.
+# append 후 워터마크는 메모리 캐시만 갱신하고, 사이드카 파일은 save 호출 단위로 1회 기록한다
+# (save_ohlc_history_many는 모든 티커를 추가한 뒤 1회).
+_OHLC_WATERMARK_VERSION = 2
+_OHLC_RECENT_DATES = 400
+_OHLC_WATERMARK_CACHE: Dict[Path, Tuple[Tuple[int, int], Dict[str, Dict]]] = {}
+
+
+def _ohlc_watermark_path() -> Path:
+    return OHLC_CSV.with_name(f"{OHLC_CSV.name}.watermark.json")
+
+
+def _ohlc_mark(dates: Iterable[str], count: int) -> Dict:
+    recent = sorted(set(dates))[-_OHLC_RECENT_DATES:]
+    return {"last": recent[-1], "count": count, "recent": recent}
+
+
+def _write_ohlc_watermarks(signature: Tuple[int, int], marks: Dict[str, Dict]) -> None:
+    _OHLC_WATERMARK_CACHE[_ohlc_watermark_path()] = (signature, marks)
+    _flush_ohlc_watermarks()
+
+
+def _flush_ohlc_watermarks() -> None:
+    """메모리 캐시의 워터마크를 사이드카 파일에 기록한다."""
+    path = _ohlc_watermark_path()
+    cached = _OHLC_WATERMARK_CACHE.get(path)
+    if cached is None:
+        return
+    signature, marks = cached
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(
+            {
+                "version": _OHLC_WATERMARK_VERSION,
+                "size": signature[0],
+                "mtime_ns": signature[1],
+                "tickers": marks,
+            },
+            f,
+        )
+
+
+def _ohlc_watermarks() -> Dict[str, Dict]:
+    """티커별 {"last", "count", "recent"} 워터마크를 반환한다.
+
+    사이드카가 ohlc_history.csv의 size/mtime과 다를 때만 CSV를 1회 스캔해 재생성한다.
+    """
+    signature = _file_signature(OHLC_CSV)
+    if signature is None or signature[0] == 0:
+        return {}
+
+    path = _ohlc_watermark_path()
+    cached = _OHLC_WATERMARK_CACHE.get(path)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            meta = json.load(f)
+        if (meta.get("version"), meta.get("size"), meta.get("mtime_ns")) == (
+            _OHLC_WATERMARK_VERSION, *signature
+        ):
+            _OHLC_WATERMARK_CACHE[path] = (signature, meta["tickers"])
+            return meta["tickers"]
+    except (OSError, ValueError, KeyError):
+        pass
+
+    dates: Dict[str, List[str]] = {}
     with open(OHLC_CSV, "r", newline="", encoding="utf-8") as f:
-        reader = csv.DictReader(f)
+        reader = csv.reader(f)
+        next(reader, None)
         for row in reader:
-            ticker = row.get("ticker", "")
-            if ticker_set and ticker not in ticker_set:
-                continue
-            date = row.get("date", "")
-            try:
-                price = float(row.get("close", 0))
-            except (ValueError, TypeError):
-                continue
-            result.setdefault(ticker, {})[date] = price
-    return result
+            if len(row) >= 3:
+                dates.setdefault(row[0], []).append(_normalize_date(row[1]))
+    marks = {ticker: _ohlc_mark(values, len(values)) for ticker, values in dates.items()}
+    _write_ohlc_watermarks(signature, marks)
+    return marks
+
+
+def _ohlc_dates_for_ticker(ticker: str) -> set:
+    """ohlc_history.csv 전체를 스캔해 특정 티커의 기존 날짜 집합을 반환한다."""
+    dates = set()
+    with open(OHLC_CSV, "r", newline="", encoding="utf-8") as f:
+        reader = csv.reader(f)
+        next(reader, None)
+        for row in reader:
+            if len(row) >= 3 and row[0] == ticker:
+                dates.add(_normalize_date(row[1]))
+    return dates
 
 
 def save_ohlc_history(ticker: str, history_data: List[Dict]) -> None:
+    """티커의 일별 종가를 ohlc_history.csv에 추가한다 (기존 날짜 스킵).
+
+    워터마크(last) 이후 날짜는 그대로 append 하고, 겹치는 날짜는 워터마크의 recent로 dedup 한다.
+    recent보다 이전 날짜가 들어올 때만(백필 등) 해당 티커의 전체 dedup 스캔을 수행한다.
+    """
+    if _append_ohlc_history(ticker, history_data):
+        _flush_ohlc_watermarks()
+
+
+def save_ohlc_history_many(history_by_ticker: Dict[str, List[Dict]]) -> None:
+    """여러 티커의 일별 종가를 save_ohlc_history와 같은 규칙으로 추가한다.
+
+    워터마크 사이드카는 모든 티커를 추가한 뒤 1회만 기록한다 (일별 수집·리밸런싱용).
+    """
+    appended = False
+    for ticker, history_data in history_by_ticker.items():
+        appended = _append_ohlc_history(ticker, history_data) or appended
+    if appended:
+        _flush_ohlc_watermarks()
+
+
+def _append_ohlc_history(ticker: str, history_data: List[Dict]) -> bool:
+    """save_ohlc_history 본체. CSV에 행을 추가했으면 True (워터마크는 메모리 캐시만 갱신)."""
     from app.data.data_utils import extract_date, extract_price
 
-    new_rows = []
+    new_rows: Dict[str, float] = {}
     for row in history_data:
         date = _normalize_date(extract_date(row) or "")
         price = extract_price(row)
         if date and price is not None:
-            new_rows.append((date, price))
+            new_rows.setdefault(date, price)
 
     if not new_rows:
-        return
+        return False
+
+    store = _sqlite()
+    if store is not None:
+        store.insert_rows(OHLC_CSV.stem, OHLC_HEADER, OHLC_KEY,
+                          ([ticker, date, f"{price:.2f}"] for date, price in sorted(new_rows.items())))
+        return False
+
+    _ensure_dir()
+
+    mark = _ohlc_watermarks().get(ticker)
+    if mark is None:
+        existing_dates = set()
+    elif mark["count"] > len(mark["recent"]) and min(new_rows) < mark["recent"][0]:
+        existing_dates = _ohlc_dates_for_ticker(ticker)
+    else:
+        existing_dates = set(mark["recent"])
+
+    rows_to_add = [
+        [ticker, date, f"{price:.2f}"]
+        for date, price in sorted(new_rows.items())
+        if date not in existing_dates
+    ]
+    if not rows_to_add:
+        return False
+
+    marks = dict(_ohlc_watermarks())
+    _append_rows(OHLC_CSV, OHLC_HEADER, rows_to_add)
+    added_dates = [row[1] for row in rows_to_add]
+    if mark is None:
+        marks[ticker] = _ohlc_mark(added_dates, len(rows_to_add))
+    else:
+        marks[ticker] = _ohlc_mark(mark["recent"] + added_dates, mark["count"] + len(rows_to_add))
+    _OHLC_WATERMARK_CACHE[_ohlc_watermark_path()] = (_file_signature(OHLC_CSV), marks)
+    return True
+
+
+def save_ohlc_history_bulk(history_by_ticker: Dict[str, List[Dict]]) -> int:
+    """여러 티커의 일별 종가를 한 번에 병합해 ohlc_history.csv를 다시 쓴다 (백필용).
+
+    기존 CSV를 1회만 읽고, 기존에 없는 (ticker, date)만 추가한 뒤
+    (ticker, date) 오름차순으로 정렬·중복 제거하여 임시 파일 → rename으로 교체한다.
+    기존 행 값은 그대로 유지하며, 기존 파일 내 중복은 하단 기록 우선으로 정리한다.
+    반환: 새로 추가된 행 수
+    """
+    from app.data.data_utils import extract_date, extract_price
+
+    store = _sqlite()
+    if store is not None:
+        rows = []
+        for ticker, history_data in history_by_ticker.items():
+            for row in history_data:
+                date = _normalize_date(extract_date(row) or "")
+                price = extract_price(row)
+                if date and price is not None:
+                    rows.append([ticker, date, f"{price:.2f}"])
+        return store.insert_rows(OHLC_CSV.stem, OHLC_HEADER, OHLC_KEY, rows)
 
     _ensure_dir()
 
-    existing_dates = set()
+    merged: Dict[Tuple[str, str], str] = {}
     if OHLC_CSV.exists() and OHLC_CSV.stat().st_size > 0:
         with open(OHLC_CSV, "r", newline="", encoding="utf-8") as f:
             reader = csv.reader(f)
-            header = next(reader, None)
+            next(reader, None)
             for row in reader:
-                if len(row) >= 3 and row[0] == ticker:
-                    existing_dates.add(row[1])
+                if len(row) >= 3:
+                    merged[(row[0], _normalize_date(row[1]))] = row[2]
+
+    added = 0
+    for ticker, history_data in history_by_ticker.items():
+        for row in history_data:
+            date = _normalize_date(extract_date(row) or "")
+            price = extract_price(row)
+            if not date or price is None or (ticker, date) in merged:
+                continue
+            merged[(ticker, date)] = f"{price:.2f}"
+            added += 1
 
-    rows_to_add = []
-    for date, price in new_rows:
-        if date not in existing_dates:
-            rows_to_add.append([ticker, date, f"{price:.2f}"])
+    if added == 0:
+        return 0
 
-    if rows_to_add:
-        _append_rows(OHLC_CSV, OHLC_HEADER, rows_to_add)
+    dates: Dict[str, List[str]] = {}
+    tmp_path = OHLC_CSV.with_name(f"{OHLC_CSV.name}.tmp")
+    with open(tmp_path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(OHLC_HEADER)
+        for (ticker, date), close in sorted(merged.items()):
+            writer.writerow([ticker, date, close])
+            dates.setdefault(ticker, []).append(date)
+    os.replace(tmp_path, OHLC_CSV)
+    marks = {ticker: _ohlc_mark(values, len(values)) for ticker, values in dates.items()}
+    _write_ohlc_watermarks(_file_signature(OHLC_CSV), marks)
+    return added
 
 
 def save_portfolio_nav_model(
@@ -513,19 +1062,21 @@ def save_portfolio_nav_model(
     """모델 포트폴리오 NAV를 portfolio_nav_model.csv에 기록한다."""
     _ensure_dir()
     date = _normalize_date(date)
-    if date in _existing_dates_in_csv(PORTFOLIO_NAV_MODEL_CSV, "date"):
-        return
     net_nav_str = f"{net_nav:.6f}" if net_nav is not None else ""
     net_dr_str = f"{net_daily_return:.6f}" if net_daily_return is not None else ""
-    _append_rows(
+    _append_unique_rows(
         PORTFOLIO_NAV_MODEL_CSV,
         PORTFOLIO_NAV_MODEL_HEADER,
         [[date, f"{nav:.6f}", f"{daily_return:.6f}", net_nav_str, net_dr_str]],
+        key_cols=PORTFOLIO_NAV_KEY,
     )
 
 
 def load_portfolio_nav_model() -> List[Dict]:
     """portfolio_nav_model.csv 로드. 날짜 오름차순."""
+    store = _sqlite()
+    if store is not None:
+        return store.select(PORTFOLIO_NAV_MODEL_CSV.stem)
     if not PORTFOLIO_NAV_MODEL_CSV.exists():
         return []
     rows = []
@@ -547,22 +1098,25 @@ def save_portfolio_nav_actual(
 ) -> None:
     """실제 포트폴리오 NAV를 portfolio_nav_actual.csv에 기록한다."""
     _ensure_dir()
-    _migrate_legacy_portfolio_nav_to_actual_if_needed()
+    if STORAGE_BACKEND == "csv":
+        _migrate_legacy_portfolio_nav_to_actual_if_needed()
     date = _normalize_date(date)
-    if date in _existing_dates_in_csv(PORTFOLIO_NAV_ACTUAL_CSV, "date"):
-        return
     equity_str = f"{total_equity:.2f}" if total_equity is not None else ""
     fx_str = f"{fx_rate:.2f}" if fx_rate is not None else ""
     krw_str = f"{krw_nav:.2f}" if krw_nav is not None else ""
-    _append_rows(
+    _append_unique_rows(
         PORTFOLIO_NAV_ACTUAL_CSV,
         PORTFOLIO_NAV_ACTUAL_HEADER,
         [[date, f"{nav:.6f}", f"{daily_return:.6f}", equity_str, fx_str, krw_str]],
+        key_cols=PORTFOLIO_NAV_KEY,
     )
 
 
 def load_portfolio_nav_actual() -> List[Dict]:
     """portfolio_nav_actual.csv 로드. 날짜 오름차순."""
+    store = _sqlite()
+    if store is not None:
+        return store.select(PORTFOLIO_NAV_ACTUAL_CSV.stem) or _load_portfolio_nav_actual_rows_from_legacy()
     if not PORTFOLIO_NAV_ACTUAL_CSV.exists():
         return _load_portfolio_nav_actual_rows_from_legacy()
     rows = []
@@ -572,3 +1126,95 @@ def load_portfolio_nav_actual() -> List[Dict]:
             row["date"] = _normalize_date(row.get("date", ""))
             rows.append(row)
     return sorted(rows, key=lambda r: r.get("date", ""))
+
+
+# ── 압축 (compaction) ────────────────────────────────────────────────────────
+# append 전용 CSV에 누적된 중복·대체된 행을 정리한다. 읽기 시점 dedup 규칙
+# (같은 키는 파일 하단 기록 우선)을 적용하고 남은 행의 파일 내 순서를 그대로 두므로
+# "하단 기록 우선" 로더(load_portfolio_snapshots 등)와 행 순서를 쓰는 로더 결과가 바뀌지 않는다.
+
+def compact_csv(
+    path: Path,
+    header: List[str],
+    key_cols: Tuple[str, ...],
+    dry_run: bool = False,
+) -> Optional[Dict]:
+    """CSV 하나를 키 기준으로 중복 제거해 다시 쓴다.
+
+    같은 키는 파일 하단 기록만 남기고, 남은 행은 원래 파일 순서를 유지한다 (정렬하지 않음).
+    날짜는 YYYY-MM-DD로 정규화한다.
+    헤더보다 긴 행이 있고 파일 헤더가 현재 header의 앞부분(구버전)이면 헤더를 늘린다
+    (예: net_nav 컬럼 추가 전 헤더 + 이후 append 된 6컬럼 행).
+    그 외에 헤더보다 긴 행이 있으면 값 손실을 막기 위해 건너뛴다 ("skipped" 사유 기록).
+    임시 파일에 쓴 뒤 rename으로 교체하므로 중간에 중단돼도 원본은 온전하다.
+    내용이 이미 정리된 상태면 파일을 건드리지 않는다 (mtime 유지 → 사이드카 캐시 유효).
+    반환: {"file", "rows_before", "rows_after", "bytes_before", "bytes_after", "rewritten"}
+          파일이 없으면 None
+    """
+    if not path.exists() or path.stat().st_size == 0:
+        return None
+
+    with open(path, "r", newline="", encoding="utf-8") as f:
+        original = f.read()
+    bytes_before = path.stat().st_size
+    reader = csv.reader(io.StringIO(original, newline=""))
+    file_header = next(reader, [])
+    records = [values for values in reader if values]
+    width = max((len(values) for values in records), default=0)
+    columns = file_header
+    if width > len(file_header):
+        if len(header) >= width and header[:len(file_header)] == file_header:
+            columns = list(header[:width])
+        else:
+            return {
+                "file": path.name,
+                "rows_before": len(records),
+                "rows_after": len(records),
+                "bytes_before": bytes_before,
+                "bytes_after": bytes_before,
+                "rewritten": False,
+                "skipped": f"헤더({len(file_header)}컬럼)보다 긴 행 발견",
+            }
+
+    latest: Dict[Tuple[str, ...], List[str]] = {}
+    for values in records:
+        row = dict(zip(columns, values + [""] * (len(columns) - len(values))))
+        if "date" in row:
+            row["date"] = _normalize_date(row["date"])
+        key = _row_key(row, key_cols)
+        latest.pop(key, None)  # 하단 기록의 위치로 이동 (삽입 순서 = 남은 행의 파일 순서)
+        latest[key] = [row[col] for col in columns]
+
+    # 헤더 행의 줄바꿈 형식으로 통일 (git 체크아웃 \n + csv.writer append \r\n 혼재 정리)
+    lineterminator = "\r\n" if original.split("\n", 1)[0].endswith("\r") else "\n"
+    buf = io.StringIO(newline="")
+    writer = csv.writer(buf, lineterminator=lineterminator)
+    writer.writerow(columns)
+    writer.writerows(latest.values())
+    compacted = buf.getvalue()
+
+    rewritten = compacted != original
+    if rewritten and not dry_run:
+        tmp_path = path.with_name(f"{path.name}.tmp")
+        with open(tmp_path, "w", newline="", encoding="utf-8") as f:
+            f.write(compacted)
+        os.replace(tmp_path, path)
+
+    return {
+        "file": path.name,
+        "rows_before": len(records),
+        "rows_after": len(latest),
+        "bytes_before": bytes_before,
+        "bytes_after": len(compacted.encode("utf-8")),
+        "rewritten": rewritten,
+    }
+
+
+def compact_data_files(dry_run: bool = False) -> List[Dict]:
+    """data/ 아래의 append 전용 CSV를 모두 압축한다. 반환: 파일별 compact_csv 결과."""
+    results = []
+    for path, header, key_cols in _data_files():
+        result = compact_csv(path, header, key_cols, dry_run=dry_run)
+        if result is not None:
+            results.append(result)
+    return results
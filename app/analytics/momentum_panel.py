@@ -0,0 +1,178 @@
+"""PricePanel·API 히스토리 위의 모멘텀 수익률·점수 공유 패널.
+
+app/indicators의 순수 계산(compute_momentum, 점수 공식)을 여러 전략이 같은 티커에 대해
+반복하지 않도록 티커별 결과를 1회 계산해 보관한다.
+
+- MomentumPanel:        티커별 r1m/r3m/r6m/r12m 수익률 배열 (백테스트·일별 실행 공통)
+- ScoreMatrix:          PricePanel 행 × 티커 공식별 점수 컬럼 (SignalPanel이 공유)
+
+일별 실행의 API 히스토리 조회는 app.indicators.momentum.get_momentum_scores가 맡고,
+이 패널을 넘기면 조회·수익률 계산을 전략 간에 공유한다.
+"""
+import math
+from array import array
+from typing import Dict, Iterable, Optional, Sequence
+
+from app.analytics.price_panel import PricePanel
+from app.constants import LOOKBACK_DAYS
+from app.data.data_utils import extract_date, parse_history
+from app.indicators.cache import IndicatorCache, IndicatorHistory
+from app.indicators.score import PERIODS, SCORE_FORMULAS
+
+
+class MomentumPanel:
+    """티커별 r1m/r3m/r6m/r12m 수익률을 전체 관측 구간에 대해 1회 계산해 공유한다.
+
+    여러 전략이 같은 티커(SPY, AGG, SHY…)의 모멘텀을 반복 계산하지 않도록
+    백테스트(PricePanel 기반)와 일별 실행(API 히스토리 기반) 모두 이 패널을 거친다.
+
+    - returns_at(t, count): 관측 종가 앞쪽 count개만 있을 때의 수익률
+      (compute_momentum(prices[:count])와 동일, 없으면 None)
+    - at_row(t, row):       PricePanel row 이전 관측 기준 (당일 종가 제외)
+    - row_columns(t):       at_row를 PricePanel 전체 행에 대해 컬럼으로 (ScoreMatrix용)
+    - latest(t):            전체 관측 기준
+    - score_matrix():       PricePanel 행 × 티커 공식별 점수 (SignalPanel이 전략 간 공유)
+    - price_histories(raw): select_targets용 종가 히스토리 (IndicatorHistory, indicators 캐시 공유)
+    """
+
+    def __init__(self, price_panel: Optional[PricePanel] = None):
+        self._price_panel = price_panel
+        self._prices: Dict[str, Sequence[float]] = {}
+        self._returns: Dict[str, Dict[str, array]] = {}
+        self._tagged: Dict[str, IndicatorHistory] = {}
+        self.histories: Dict[str, list] = {}  # API 원본 히스토리 (get_momentum_scores 공유용)
+        self.indicators = IndicatorCache()  # 전략 간 SMA·변동성 결과 공유
+        self._score_matrix: Optional["ScoreMatrix"] = None
+
+    def __contains__(self, ticker: str) -> bool:
+        if ticker in self._prices:
+            return True
+        return self._price_panel is not None and ticker in self._price_panel
+
+    def add_history(self, ticker: str, history: list) -> None:
+        """API 원본 히스토리를 등록한다 (수익률은 처음 조회할 때 계산)."""
+        self.histories[ticker] = history
+        self.set_prices(ticker, parse_history(history))
+
+    def set_prices(self, ticker: str, prices: Sequence[float]) -> None:
+        self._prices[ticker] = prices
+        self._returns.pop(ticker, None)
+        self._tagged.pop(ticker, None)
+
+    def price_histories(self, histories: Dict[str, list]) -> Dict[str, IndicatorHistory]:
+        """API 원본 히스토리 → {ticker: 종가 히스토리} (parse_history와 같은 값).
+
+        티커별로 1회만 파싱하고, 같은 객체를 여러 전략에 넘겨 지표 결과를
+        (ticker, 마지막 bar 날짜, 지표, 파라미터) 키로 indicators 캐시에서 재사용한다.
+        """
+        result: Dict[str, IndicatorHistory] = {}
+        for ticker, raw in histories.items():
+            if self.histories.get(ticker) is not raw:
+                self.add_history(ticker, raw)
+            tagged = self._tagged.get(ticker)
+            if tagged is None:
+                end_date = max((d for d in map(extract_date, raw) if d), default=None)
+                tagged = IndicatorHistory(self._prices[ticker], ticker, end_date, self.indicators)
+                self._tagged[ticker] = tagged
+            result[ticker] = tagged
+        return result
+
+    def _observed(self, ticker: str) -> Sequence[float]:
+        prices = self._prices.get(ticker)
+        if prices is None:
+            if self._price_panel is None or ticker not in self._price_panel:
+                raise KeyError(ticker)
+            prices = self._price_panel.history(ticker, len(self._price_panel))
+            self._prices[ticker] = prices
+        return prices
+
+    def _series(self, ticker: str) -> Dict[str, array]:
+        """기간별 수익률 배열 (인덱스 j = j번째 관측 종가 기준, 계산 불가 NaN)."""
+        series = self._returns.get(ticker)
+        if series is None:
+            prices = self._observed(ticker)
+            series = {}
+            for period, lookback in LOOKBACK_DAYS.items():
+                col = array("d", [math.nan]) * len(prices)
+                col[lookback:] = array("d", (
+                    (curr / past) - 1.0 if past > 0 else math.nan
+                    for curr, past in zip(prices[lookback:], prices)
+                ))
+                series[f"r{period}"] = col
+            self._returns[ticker] = series
+        return series
+
+    def returns_at(self, ticker: str, count: int) -> Dict[str, Optional[float]]:
+        series = self._series(ticker)
+        returns: Dict[str, Optional[float]] = {}
+        for key, col in series.items():
+            value = col[count - 1] if 0 < count <= len(col) else math.nan
+            returns[key] = value if value == value else None
+        return returns
+
+    def at_row(self, ticker: str, row: int) -> Dict[str, Optional[float]]:
+        return self.returns_at(ticker, self._price_panel.count_before(ticker, row))
+
+    def row_columns(self, ticker: str) -> Dict[str, array]:
+        """PricePanel 행별 수익률 컬럼 (행 row 값 = at_row(t, row), 없으면 NaN)."""
+        series = self._series(ticker)
+        counts = self._price_panel.counts_before(ticker)[:-1]
+        columns: Dict[str, array] = {}
+        for key, col in series.items():
+            shifted = array("d", [math.nan]) + col  # shifted[c] = 앞쪽 c개 관측 기준 값
+            columns[key] = array("d", map(shifted.__getitem__, counts))
+        return columns
+
+    def latest(self, ticker: str) -> Dict[str, Optional[float]]:
+        return self.returns_at(ticker, len(self._observed(ticker)))
+
+    def score_matrix(self) -> "ScoreMatrix":
+        """PricePanel 전체 행의 공식별 점수 행렬 (전략 간 공유, 컬럼은 처음 조회할 때 계산)."""
+        if self._score_matrix is None:
+            self._score_matrix = ScoreMatrix(self._price_panel, momentum=self)
+        return self._score_matrix
+
+
+class ScoreMatrix:
+    """PricePanel 행 × 티커 수익률·점수 컬럼 (결측 NaN). 컬럼은 처음 조회할 때 만든다."""
+
+    def __init__(
+        self,
+        panel: PricePanel,
+        tickers: Optional[Iterable[str]] = None,
+        momentum: Optional[MomentumPanel] = None,
+    ):
+        if momentum is None:
+            momentum = MomentumPanel(panel)
+        self.panel = panel
+        self.dates = panel.dates
+        self.tickers = list(panel.tickers if tickers is None else tickers)
+        self._momentum = momentum
+        self._returns: Dict[str, Dict[str, array]] = {}
+        self._scores: Dict[str, Dict[str, array]] = {}
+
+    def _ticker_returns(self, ticker: str) -> Dict[str, array]:
+        columns = self._returns.get(ticker)
+        if columns is None:
+            columns = self._momentum.row_columns(ticker)
+            self._returns[ticker] = columns
+        return columns
+
+    def returns(self, period: str) -> Dict[str, array]:
+        """{ticker: 행별 period 수익률} (period: r1m / r3m / r6m / r12m)."""
+        return {t: self._ticker_returns(t)[period] for t in self.tickers}
+
+    def score_column(self, ticker: str, formula: str = "keller") -> array:
+        """티커 1개의 행별 formula 점수. 스칼라 score_returns와 같은 값·NaN 위치."""
+        scores = self._scores.setdefault(formula, {})
+        column = scores.get(ticker)
+        if column is None:
+            cols = self._ticker_returns(ticker)
+            fn = SCORE_FORMULAS[formula]
+            column = scores[ticker] = array("d", map(fn, *(cols[p] for p in PERIODS)))
+        return column
+
+    def scores(self, formula: str = "keller") -> Dict[str, array]:
+        """{ticker: 행별 formula 점수}."""
+        return {t: self.score_column(t, formula) for t in self.tickers}
+
@@ -0,0 +1,136 @@
+"""strategy_nav.csv 전용 컬럼형 프레임.
+
+load_strategy_nav()의 {strategy: [row_dict, ...]} (문자열 값) 대신
+전 전략이 공유하는 정수 날짜 축과 전략별 float64 컬럼을 보관한다.
+
+- dates:   array('i') — YYYYMMDD 정수, 오름차순 (모든 전략의 날짜 합집합)
+- 컬럼:    array('d') — daily_return, nav, net_nav, net_daily_return (결측은 NaN)
+- has_row: array('b') — 해당 날짜에 전략 행이 있으면 1 (값이 빈 칸인 행과 행 없음을 구분)
+
+모든 컬럼이 같은 날짜 축에 정렬되어 있으므로 전략 간 비교 시 날짜 매칭이 필요 없다.
+"""
+import math
+from array import array
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from app.time_utils import date_to_int, int_to_date
+
+NAV_FIELDS = ("daily_return", "nav", "net_nav", "net_daily_return")
+
+
+def _parse_float(value) -> float:
+    if value is None or value == "":
+        return math.nan
+    try:
+        return float(value)
+    except (ValueError, TypeError):
+        return math.nan
+
+
+class StrategyNavFrame:
+    """전략별 NAV 컬럼 묶음 (읽기 전용으로 취급)."""
+
+    def __init__(
+        self, dates: array, columns: Dict[str, Dict[str, array]], rows: Dict[str, array]
+    ):
+        self.dates = dates
+        self._columns = columns
+        self._rows = rows
+        self._date_labels: Optional[List[str]] = None
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[Dict]) -> "StrategyNavFrame":
+        """strategy_nav.csv 행(dict) 목록으로 프레임을 만든다.
+
+        (전략, 날짜) 중복은 뒤에 오는 행 우선 (load_strategy_nav와 동일).
+        """
+        by_strategy: Dict[str, Dict[int, Tuple[float, ...]]] = {}
+        for row in rows:
+            date_int = date_to_int(row.get("date", ""))
+            name = row.get("strategy", "")
+            if date_int is None or not name:
+                continue
+            by_strategy.setdefault(name, {})[date_int] = tuple(
+                _parse_float(row.get(field)) for field in NAV_FIELDS
+            )
+
+        date_axis = sorted({d for values in by_strategy.values() for d in values})
+        position = {d: i for i, d in enumerate(date_axis)}
+        empty = array("d", [math.nan]) * len(date_axis)
+
+        columns: Dict[str, Dict[str, array]] = {}
+        rows_present: Dict[str, array] = {}
+        for name, values in by_strategy.items():
+            cols = {field: array("d", empty) for field in NAV_FIELDS}
+            present = array("b", bytes(len(date_axis)))
+            for d, parsed in values.items():
+                i = position[d]
+                present[i] = 1
+                for field, value in zip(NAV_FIELDS, parsed):
+                    cols[field][i] = value
+            columns[name] = cols
+            rows_present[name] = present
+        return cls(array("i", date_axis), columns, rows_present)
+
+    def __len__(self) -> int:
+        return len(self.dates)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._columns
+
+    def __bool__(self) -> bool:
+        return bool(self._columns)
+
+    @property
+    def strategies(self) -> List[str]:
+        return sorted(self._columns)
+
+    def date_labels(self) -> List[str]:
+        """날짜 축을 YYYY-MM-DD 문자열 목록으로 반환한다 (1회 변환 후 재사용)."""
+        if self._date_labels is None:
+            self._date_labels = [int_to_date(d) for d in self.dates]
+        return self._date_labels
+
+    def column(self, name: str, field: str = "nav") -> array:
+        """날짜 축에 정렬된 원본 컬럼 (결측 NaN). 없는 전략이면 KeyError."""
+        return self._columns[name][field]
+
+    def has_row(self, name: str) -> array:
+        """날짜 축에 정렬된 행 존재 여부 (1/0). 없는 전략이면 KeyError."""
+        return self._rows[name]
+
+    def values(self, name: str, field: str = "nav") -> List[float]:
+        """결측을 제외한 값 목록 (날짜 오름차순). 없는 전략이면 빈 리스트."""
+        cols = self._columns.get(name)
+        if cols is None:
+            return []
+        return [v for v in cols[field] if v == v]
+
+    def count(self, name: str, field: str = "nav") -> int:
+        """결측이 아닌 값의 개수."""
+        return len(self.values(name, field))
+
+    def last(self, name: str, field: str = "nav") -> Optional[Tuple[str, float]]:
+        """마지막 유효 (date, value). 값이 없으면 None."""
+        cols = self._columns.get(name)
+        if cols is None:
+            return None
+        col = cols[field]
+        for i in range(len(col) - 1, -1, -1):
+            if col[i] == col[i]:
+                return self.date_labels()[i], col[i]
+        return None
+
+    def records(
+        self, name: str, fields: Tuple[str, ...] = ("daily_return", "nav")
+    ) -> Iterator[Tuple]:
+        """(date, *fields) 튜플을 날짜순으로 생성한다. 요청 필드 중 결측이 있는 날짜는 건너뛴다."""
+        cols = self._columns.get(name)
+        if cols is None:
+            return
+        labels = self.date_labels()
+        selected = [cols[field] for field in fields]
+        for i, label in enumerate(labels):
+            values = tuple(col[i] for col in selected)
+            if all(v == v for v in values):
+                yield (label,) + values
@@ -0,0 +1,133 @@
+"""백테스트용 가격 패널.
+
+price_dict({ticker: {date: close}})를 1회 변환해 날짜 × 티커 행렬로 보관한다.
+
+- dates:           전체 날짜 축 (YYYY-MM-DD, 오름차순), 행 인덱스 = 날짜 위치
+- column(t):       array('d') — 날짜 축에 정렬된 종가 (결측 NaN)
+- returns(t):      array('d') — 직전 행 대비 일별 수익률 (어느 한쪽이 결측/0이면 NaN)
+- history(t, row): row 미만 행의 관측 종가 시계열 (결측 제외, 읽기 전용 뷰)
+
+from_store/save는 mmap 컬럼 저장소(price_store)와 같은 파일 형식을 써서
+병렬 백테스트 워커가 패널을 pickle 없이 mmap으로 공유하게 한다.
+from_store로 만든 패널은 store를 기억하므로 워커가 같은 저장소 파일을 바로 연다.
+
+history는 티커별 관측값 배열과 "행 이전 관측 수" 누적 배열을 미리 만들어 두고,
+관측값 배열 위의 읽기 전용 memoryview(HistoryView)를 돌려준다. 뷰는 다시 slice해도
+(prices[-period:] 등) 복사가 없으므로 매 리밸런싱마다 티커별 가격 리스트를 만들지 않는다.
+"""
+import math
+from array import array
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+from app.analytics.price_store import PriceStore, write_price_store
+from app.time_utils import date_to_int
+
+NAN = math.nan
+
+# history() 반환 타입: 관측 종가 array('d')를 공유하는 읽기 전용 memoryview.
+# len/인덱싱/음수 인덱스/slice/반복/sum을 지원하고 slice 결과도 같은 버퍼의 뷰다.
+HistoryView = memoryview
+
+
+class PricePanel:
+    """날짜 × 티커 종가 행렬 (읽기 전용으로 취급)."""
+
+    def __init__(self, dates: List[str], columns: Dict[str, array]):
+        self.dates = dates
+        self.row_of = {d: i for i, d in enumerate(dates)}
+        self._columns = columns
+        self._returns: Dict[str, array] = {}
+        self._observed: Dict[str, HistoryView] = {}
+        self._observed_before: Dict[str, array] = {}
+        self.store: Optional[PriceStore] = None  # from_store로 만든 경우 원본 저장소
+
+    @classmethod
+    def from_price_dict(
+        cls,
+        price_dict: Dict[str, Dict[str, float]],
+        tickers: Optional[Iterable[str]] = None,
+    ) -> "PricePanel":
+        wanted = list(price_dict) if tickers is None else [t for t in tickers if t in price_dict]
+        dates = sorted({d for t in wanted for d in price_dict[t]})
+        row_of = {d: i for i, d in enumerate(dates)}
+        empty = array("d", [NAN]) * len(dates)
+        columns: Dict[str, array] = {}
+        for ticker in wanted:
+            col = array("d", empty)
+            for d, price in price_dict[ticker].items():
+                col[row_of[d]] = price
+            columns[ticker] = col
+        return cls(dates, columns)
+
+    @classmethod
+    def from_store(cls, store: PriceStore) -> "PricePanel":
+        """PriceStore의 mmap 컬럼을 복사 없이 쓰는 패널 (store는 패널 사용 중 열어 둔다)."""
+        panel = cls(store.date_labels(), {t: store.column(t) for t in store.tickers})
+        panel.store = store
+        return panel
+
+    def save(self, directory: Path) -> None:
+        """패널을 컬럼 저장소 형식으로 쓴다 (open_price_store → from_store로 다시 연다)."""
+        write_price_store(directory, [date_to_int(d) for d in self.dates], self._columns)
+
+    def __len__(self) -> int:
+        return len(self.dates)
+
+    def __contains__(self, ticker: str) -> bool:
+        return ticker in self._columns
+
+    @property
+    def tickers(self) -> List[str]:
+        return list(self._columns)
+
+    def column(self, ticker: str) -> array:
+        return self._columns[ticker]
+
+    def returns(self, ticker: str) -> array:
+        """직전 행 대비 일별 수익률 컬럼 (첫 행 NaN). 티커별 1회 계산 후 재사용."""
+        rets = self._returns.get(ticker)
+        if rets is None:
+            col = self._columns[ticker]
+            rets = array("d", [NAN]) * len(col)
+            for i in range(1, len(col)):
+                prev, curr = col[i - 1], col[i]
+                # compute_weighted_return과 동일: 전일 가격 > 0, 당일 가격 존재(0 아님)
+                if prev > 0 and curr == curr and curr != 0:
+                    rets[i] = curr / prev - 1.0
+            self._returns[ticker] = rets
+        return rets
+
+    def _observations(self, ticker: str):
+        observed = self._observed.get(ticker)
+        if observed is None:
+            col = self._columns[ticker]
+            observed = array("d")
+            before = array("i", [0]) * (len(col) + 1)
+            for i, price in enumerate(col):
+                if price == price:
+                    observed.append(price)
+                before[i + 1] = len(observed)
+            observed = self._observed[ticker] = memoryview(observed).toreadonly()
+            self._observed_before[ticker] = before
+        return observed, self._observed_before[ticker]
+
+    def count_before(self, ticker: str, row: int) -> int:
+        """row 미만 행에서 관측된 종가 수."""
+        _, before = self._observations(ticker)
+        return before[row]
+
+    def counts_before(self, ticker: str) -> array:
+        """행별 count_before (길이 len(panel) + 1, 공유 배열이므로 수정하지 않는다)."""
+        return self._observations(ticker)[1]
+
+    def history(self, ticker: str, row: int, window: Optional[int] = None) -> HistoryView:
+        """row 미만 행의 관측 종가 (오름차순). window 지정 시 최근 window개만.
+
+        cutoff 행(당일) 종가는 제외한다 (look-ahead 방지, _prices_up_to와 동일).
+        반환값은 티커 관측값 배열을 공유하는 읽기 전용 뷰로, 복사하지 않는다.
+        """
+        observed, before = self._observations(ticker)
+        end = before[row]
+        start = 0 if window is None else max(0, end - window)
+        return observed[start:end]
@@ -0,0 +1,250 @@
+"""ohlc_history.csv 읽기 경로용 memory-mapped 컬럼 저장소.
+
+ohlc_history.csv는 교환/내보내기 형식으로 유지하고, 읽기 경로는 CSV 옆의
+ohlc_history.cols/ 디렉터리에 저장된 바이너리 컬럼을 mmap으로 연다.
+
+- gen-*/dates.i32:     공유 날짜 축 (YYYYMMDD 정수, 오름차순)
+- gen-*/<TICKER>.f64:  티커별 종가 (날짜 축과 정렬, 결측은 NaN)
+- meta.json:           현재 세대 디렉터리 + 티커 목록 + 원본 CSV의 size/mtime (불일치 시 재생성)
+
+재생성은 새 세대 디렉터리에 모든 컬럼을 쓴 뒤 meta.json 1개를 rename으로 교체하므로,
+읽는 쪽은 항상 한 세대의 파일 묶음만 본다 (새 컬럼 + 옛 meta 같은 혼합 없음).
+직전 세대는 이미 열린 PriceStore가 지연 로드할 수 있도록 한 세대 더 남겨 둔다.
+
+저장소는 CSV에서 언제든 재생성할 수 있는 파생 캐시이므로 git에 커밋하지 않는다.
+"""
+import csv
+import json
+import math
+import mmap
+import os
+import shutil
+import tempfile
+from array import array
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from app.time_utils import date_to_int, int_to_date
+
+_STORE_VERSION = 2
+_META_FILE = "meta.json"
+_DATES_FILE = "dates.i32"
+_GENERATION_PREFIX = "gen-"
+
+
+def _store_dir(csv_path: Path) -> Path:
+    return csv_path.with_suffix(".cols")
+
+
+def _source_signature(csv_path: Path) -> Tuple[int, int]:
+    st = csv_path.stat()
+    return st.st_size, st.st_mtime_ns
+
+
+def _map_array(path: Path, typecode: str) -> Tuple[Optional[mmap.mmap], memoryview]:
+    """파일을 읽기 전용으로 mmap 하고 typecode 형식의 memoryview를 반환한다."""
+    if path.stat().st_size == 0:
+        return None, memoryview(array(typecode)).toreadonly()
+    with open(path, "rb") as f:
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    return mm, memoryview(mm).cast(typecode)
+
+
+class PriceStore:
+    """mmap 기반 가격 컬럼 저장소 (읽기 전용).
+
+    dates:   memoryview('i') — YYYYMMDD 정수 날짜 축
+    column(): memoryview('d') — 날짜 축과 정렬된 종가, 결측은 NaN
+    """
+
+    def __init__(self, directory: Path, tickers: List[str]):
+        self.directory = directory
+        self.tickers: Tuple[str, ...] = tuple(tickers)
+        self._maps: List[mmap.mmap] = []
+        self._columns: Dict[str, memoryview] = {}
+        self._date_labels: Optional[List[str]] = None
+        self.dates = self._open(directory / _DATES_FILE, "i")
+
+    def _open(self, path: Path, typecode: str) -> memoryview:
+        mm, view = _map_array(path, typecode)
+        if mm is not None:
+            self._maps.append(mm)
+        return view
+
+    def __len__(self) -> int:
+        return len(self.dates)
+
+    def __contains__(self, ticker: str) -> bool:
+        return ticker in self.tickers
+
+    def column(self, ticker: str) -> memoryview:
+        """티커의 종가 컬럼. 저장소에 없는 티커면 KeyError."""
+        if ticker not in self._columns:
+            if ticker not in self.tickers:
+                raise KeyError(ticker)
+            self._columns[ticker] = self._open(self.directory / f"{ticker}.f64", "d")
+        return self._columns[ticker]
+
+    def date_labels(self) -> List[str]:
+        """날짜 축을 YYYY-MM-DD 문자열 목록으로 반환한다 (1회 변환 후 재사용)."""
+        if self._date_labels is None:
+            self._date_labels = [int_to_date(d) for d in self.dates]
+        return self._date_labels
+
+    def to_price_dict(self, tickers: Optional[List[str]] = None) -> Dict[str, Dict[str, float]]:
+        """{ticker: {date: close}} 형식으로 변환한다 (load_ohlc_prices 호환)."""
+        labels = self.date_labels()
+        wanted = self.tickers if not tickers else [t for t in tickers if t in self.tickers]
+        result: Dict[str, Dict[str, float]] = {}
+        for ticker in wanted:
+            col = self.column(ticker)
+            series = {labels[i]: p for i, p in enumerate(col) if p == p}
+            if series:
+                result[ticker] = series
+        return result
+
+    def __enter__(self) -> "PriceStore":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._columns.clear()
+        self.dates.release()
+        for mm in self._maps:
+            try:
+                mm.close()
+            except BufferError:
+                # 외부에서 아직 컬럼 view를 참조 중이면 GC에 맡긴다
+                pass
+        self._maps.clear()
+
+
+def _read_meta(directory: Path) -> Optional[Dict]:
+    try:
+        with open(directory / _META_FILE, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def build_price_store(csv_path: Path) -> None:
+    """ohlc_history.csv를 1회 파싱하여 컬럼 저장소를 (재)생성한다.
+
+    동일 (ticker, date) 중복은 파일 하단 기록 우선 (load_ohlc_prices와 동일).
+    """
+    from app.analytics.csv_logger import _normalize_date
+
+    signature = _source_signature(csv_path)
+    by_ticker: Dict[str, Dict[int, float]] = {}
+    with open(csv_path, "r", newline="", encoding="utf-8") as f:
+        reader = csv.DictReader(f)
+        for row in reader:
+            ticker = row.get("ticker", "")
+            date_int = date_to_int(_normalize_date(row.get("date", "")))
+            if not ticker or date_int is None:
+                continue
+            try:
+                price = float(row.get("close", 0))
+            except (ValueError, TypeError):
+                continue
+            by_ticker.setdefault(ticker, {})[date_int] = price
+
+    date_axis = sorted({d for series in by_ticker.values() for d in series})
+    position = {d: i for i, d in enumerate(date_axis)}
+    columns: Dict[str, array] = {}
+    for ticker in sorted(by_ticker):
+        col = array("d", [math.nan]) * len(date_axis)
+        for d, price in by_ticker[ticker].items():
+            col[position[d]] = price
+        columns[ticker] = col
+
+    write_price_store(_store_dir(csv_path), date_axis, columns, signature)
+
+
+def write_price_store(
+    directory: Path,
+    date_axis: List[int],
+    columns: Dict[str, array],
+    signature: Tuple[int, int] = (0, 0),
+) -> None:
+    """날짜 축(YYYYMMDD 정수)과 정렬된 종가 컬럼을 컬럼 저장소 형식으로 쓴다.
+
+    모든 파일을 새 세대 디렉터리에 쓴 뒤 meta.json을 rename으로 교체해 한 번에 전환하고,
+    현재·직전 세대 외의 옛 세대를 지운다.
+    signature는 원본 CSV의 (size, mtime_ns) — CSV 없이 만든 저장소는 (0, 0).
+    """
+    directory.mkdir(parents=True, exist_ok=True)
+    previous = (_read_meta(directory) or {}).get("generation")
+    generation = Path(tempfile.mkdtemp(prefix=_GENERATION_PREFIX, dir=directory))
+
+    def _write(name: str, values: array) -> None:
+        with open(generation / name, "wb") as f:
+            values.tofile(f)
+
+    _write(_DATES_FILE, array("i", date_axis))
+    for ticker, col in columns.items():
+        _write(f"{ticker}.f64", array("d", col))
+
+    meta = {
+        "version": _STORE_VERSION,
+        "generation": generation.name,
+        "source_size": signature[0],
+        "source_mtime_ns": signature[1],
+        "rows": len(date_axis),
+        "tickers": sorted(columns),
+    }
+    tmp_meta = directory / f"{_META_FILE}.tmp"
+    with open(tmp_meta, "w", encoding="utf-8") as f:
+        json.dump(meta, f)
+    os.replace(tmp_meta, directory / _META_FILE)
+    _remove_stale(directory, keep=(generation.name, previous))
+
+
+def _remove_stale(directory: Path, keep: Tuple[Optional[str], ...]) -> None:
+    """현재·직전 세대가 아닌 세대 디렉터리와 v1 형식의 최상위 컬럼 파일을 지운다."""
+    for entry in directory.iterdir():
+        if entry.is_dir():
+            if entry.name.startswith(_GENERATION_PREFIX) and entry.name not in keep:
+                shutil.rmtree(entry, ignore_errors=True)
+        elif entry.suffix in (".f64", ".i32"):
+            entry.unlink(missing_ok=True)
+
+
+def _open_meta(directory: Path, meta: Optional[Dict]) -> Optional[PriceStore]:
+    if meta is None or meta.get("version") != _STORE_VERSION or not meta.get("generation"):
+        return None
+    generation = directory / meta["generation"]
+    if not generation.is_dir():
+        return None
+    return PriceStore(generation, meta.get("tickers", []))
+
+
+def open_price_store(directory: Path) -> Optional[PriceStore]:
+    """디렉터리의 컬럼 저장소를 원본 CSV 확인 없이 mmap으로 연다. 없으면 None."""
+    return _open_meta(directory, _read_meta(directory))
+
+
+def load_price_store(csv_path: Optional[Path] = None) -> Optional[PriceStore]:
+    """최신 컬럼 저장소를 mmap으로 연다. CSV가 없으면 None.
+
+    저장소가 없거나 원본 CSV의 size/mtime과 다르면 CSV에서 재생성한다.
+    """
+    if csv_path is None:
+        from app.analytics import csv_logger
+        csv_path = csv_logger.OHLC_CSV
+    if not csv_path.exists():
+        return None
+
+    directory = _store_dir(csv_path)
+    meta = _read_meta(directory)
+    signature = _source_signature(csv_path)
+    if (
+        meta is None
+        or meta.get("version") != _STORE_VERSION
+        or (meta.get("source_size"), meta.get("source_mtime_ns")) != signature
+    ):
+        build_price_store(csv_path)
+        meta = _read_meta(directory)
+    return _open_meta(directory, meta)
@@ -10,51 +10,36 @@ def _build_risk_section(strategy_results: List[Dict], window: int = 252) -> List
     데이터가 없거나 오류 발생 시 빈 리스트를 반환한다.
     """
     try:
-        from app.analytics.csv_logger import load_strategy_nav
+        from app.analytics.csv_logger import load_strategy_nav_frame
         from app.analytics.risk import historical_var, cvar, max_drawdown, annualized_sharpe
 
-        nav_data = load_strategy_nav()
-        if not nav_data:
+        frame = load_strategy_nav_frame()
+        if not frame:
             return []
 
-        # 각 전략의 날짜별 daily_return 수집
-        strategy_returns: Dict[str, Dict[str, float]] = {}
-        for result in strategy_results:
-            name = result["name"]
-            weight = result["weight"]
-            rows = nav_data.get(name, [])
-            if not rows:
-                continue
-            for row in rows:
-                date = row.get("date", "")
-                try:
-                    dr = float(row.get("daily_return", 0) or 0)
-                except (ValueError, TypeError):
-                    continue
-                strategy_returns.setdefault(date, {})[name] = (dr, weight)
-
-        if not strategy_returns:
+        # 선택 전략의 daily_return 컬럼 (공유 날짜 축에 정렬, 결측 NaN)과 행 존재 여부
+        weighted_cols = [
+            (frame.column(r["name"], "daily_return"), frame.has_row(r["name"]), r["weight"])
+            for r in strategy_results
+            if r["name"] in frame
+        ]
+        if len(weighted_cols) < len(strategy_results):
             return []
 
-        # 모든 전략에 공통으로 존재하는 날짜만 사용
-        strategy_names = [r["name"] for r in strategy_results]
-        all_dates = sorted(
-            date for date, by_name in strategy_returns.items()
-            if all(name in by_name for name in strategy_names)
-        )
+        # 모든 전략에 행이 있는 날짜만 사용
+        common = [
+            i for i in range(len(frame))
+            if all(rows[i] for _, rows, _ in weighted_cols)
+        ]
 
-        if not all_dates:
+        if not common:
             return []
 
-        # 최근 window 거래일
-        recent_dates = all_dates[-window:]
-
-        # 가중 평균 combined return 시계열
-        combined: List[float] = []
-        for date in recent_dates:
-            by_name = strategy_returns[date]
-            weighted_sum = sum(dr * w for dr, w in by_name.values())
-            combined.append(weighted_sum)
+        # 최근 window 거래일의 가중 평균 combined return 시계열 (daily_return 빈 칸은 0.0)
+        combined: List[float] = [
+            sum((col[i] if col[i] == col[i] else 0.0) * w for col, _, w in weighted_cols)
+            for i in common[-window:]
+        ]
 
         if not combined:
             return []
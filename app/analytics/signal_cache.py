@@ -0,0 +1,176 @@
+"""백테스트 리밸런싱 시그널(targets) 디스크 캐시.
+
+과거 월말의 select_targets 결과는 입력(전략 코드, 자산 정의, 그 시점까지의 가격)이
+같으면 바뀌지 않으므로 data/signal_cache/<전략>.json에 저장해 두고 재사용한다.
+
+{"version", "source": 전략 코드 해시, "assets": 자산 정의 해시,
+ "signals": {date: [가격 fingerprint, targets 또는 null(RuntimeError → 이전 targets 유지)]}}
+
+- source/assets가 다르면 파일 전체를 버린다 (전략 코드를 고치면 그 전략만 재계산)
+- 날짜별 fingerprint는 리밸런싱일 이전 관측 종가 prefix의 해시이므로,
+  가격이 뒤에 추가되기만 하면 과거 월말은 그대로 적중하고 새 월말만 계산한다
+
+캐시는 언제든 재생성할 수 있는 파생 데이터이므로 git에 커밋하지 않는다.
+"""
+import hashlib
+import json
+import os
+import sys
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from app.analytics.csv_logger import DATA_DIR
+from app.analytics.price_panel import PricePanel
+from app.strategy import BaseStrategy
+
+SIGNAL_CACHE_DIR = DATA_DIR / "signal_cache"
+
+_CACHE_VERSION = 1
+_APP_DIR = Path(__file__).resolve().parent.parent
+# 점수·지표 계산에 쓰이는 공통 모듈 (전략 클래스 파일과 함께 해시)
+_SHARED_SOURCES = (
+    "constants.py",
+    "indicators",
+    "analytics/price_panel.py",  # 리밸런싱일 이전 관측 종가 히스토리
+    "analytics/momentum_panel.py",  # 티커별 수익률·점수 컬럼
+    "analytics/signal_panel.py",  # 전략에 넘기는 점수·히스토리 구성
+    "assets/assets.py",  # 그룹 → 티커 해석
+)
+
+
+def _hash_files(paths: Iterable[Path]) -> str:
+    h = hashlib.blake2b(digest_size=16)
+    for path in sorted(set(paths)):
+        h.update(path.name.encode())
+        h.update(path.read_bytes())
+    return h.hexdigest()
+
+
+def strategy_source_hash(strategy: BaseStrategy) -> str:
+    """전략 클래스(MRO 전체) 소스 파일 + 공통 지표·패널·자산 모듈의 해시."""
+    paths: List[Path] = []
+    for cls in type(strategy).__mro__:
+        if cls.__module__ in ("builtins", "abc"):
+            continue
+        source = getattr(sys.modules.get(cls.__module__), "__file__", None)
+        if source:
+            paths.append(Path(source))
+    for name in _SHARED_SOURCES:
+        target = _APP_DIR / name
+        paths.extend(sorted(target.glob("*.py")) if target.is_dir() else [target])
+    return _hash_files(paths)
+
+
+def assets_hash(strategy: BaseStrategy) -> str:
+    """자산 정의 해시: 그룹 → 대체 티커 목록까지."""
+    universe = strategy.universe
+    resolved = {
+        asset_type: [[g, list(universe.group_tickers(g))] for g in universe.asset_groups(asset_type)]
+        for asset_type in sorted(strategy.assets)
+    }
+    return hashlib.blake2b(
+        json.dumps(resolved, sort_keys=True).encode(), digest_size=16
+    ).hexdigest()
+
+
+class PriceFingerprint:
+    """리밸런싱 행 이전 관측 종가 prefix의 해시.
+
+    티커별 누적 해시를 유지하므로 행 오름차순으로 조회하면 전체 비용이 O(history)다.
+    이전보다 앞선 행을 조회하면 해당 티커 해시를 처음부터 다시 만든다.
+    """
+
+    def __init__(self, panel: PricePanel, tickers: Iterable[str]):
+        self._panel = panel
+        self._tickers = sorted(tickers)
+        self._state: Dict[str, Tuple[Any, int]] = {}
+
+    def _ticker_digest(self, ticker: str, row: int) -> bytes:
+        count = self._panel.count_before(ticker, row)
+        state = self._state.get(ticker)
+        if state is None or state[1] > count:
+            state = (hashlib.blake2b(ticker.encode(), digest_size=16), 0)
+        h, seen = state
+        h.update(self._panel.history(ticker, row, window=count - seen).tobytes())
+        self._state[ticker] = (h, count)
+        return h.copy().digest()
+
+    def at(self, row: int) -> str:
+        combined = hashlib.blake2b(digest_size=16)
+        for ticker in self._tickers:
+            combined.update(self._ticker_digest(ticker, row))
+        return combined.hexdigest()
+
+
+class SignalCache:
+    """전략 1개의 {리밸런싱 날짜: (fingerprint, targets)} 캐시."""
+
+    def __init__(self, path: Path, source: str, assets: str, signals: Dict[str, List]):
+        self.path = path
+        self.source = source
+        self.assets = assets
+        self._signals = signals
+        self._dirty = False
+        self.hits = 0
+        self.misses = 0
+
+    @classmethod
+    def load(
+        cls,
+        strategy_name: str,
+        strategy: BaseStrategy,
+        directory: Optional[Path] = None,
+    ) -> Optional["SignalCache"]:
+        """전략의 캐시 파일을 연다. 코드/자산 해시가 다르면 빈 캐시.
+
+        외부 데이터에 의존해 가격만으로 결과가 정해지지 않는 전략
+        (SIGNAL_CACHEABLE = False)은 None을 반환한다.
+        """
+        if not getattr(strategy, "SIGNAL_CACHEABLE", True):
+            return None
+        path = (directory or SIGNAL_CACHE_DIR) / f"{strategy_name}.json"
+        source = strategy_source_hash(strategy)
+        assets = assets_hash(strategy)
+        signals: Dict[str, List] = {}
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                meta = json.load(f)
+            if (meta.get("version"), meta.get("source"), meta.get("assets")) == (
+                _CACHE_VERSION, source, assets,
+            ):
+                signals = meta["signals"]
+        except (OSError, ValueError, KeyError):
+            pass
+        return cls(path, source, assets, signals)
+
+    def get(self, date: str, fingerprint: str) -> Tuple[bool, Optional[Dict[str, float]]]:
+        """(적중 여부, targets). targets None = 해당 월말 select_targets가 RuntimeError."""
+        entry = self._signals.get(date)
+        if entry is not None and entry[0] == fingerprint:
+            self.hits += 1
+            return True, entry[1]
+        self.misses += 1
+        return False, None
+
+    def put(self, date: str, fingerprint: str, targets: Optional[Dict[str, float]]) -> None:
+        self._signals[date] = [fingerprint, targets]
+        self._dirty = True
+
+    def save(self) -> None:
+        """변경이 있을 때만 임시 파일 → rename으로 기록한다."""
+        if not self._dirty:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_name(f"{self.path.name}.tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "version": _CACHE_VERSION,
+                    "source": self.source,
+                    "assets": self.assets,
+                    "signals": dict(sorted(self._signals.items())),
+                },
+                f,
+            )
+        os.replace(tmp, self.path)
+        self._dirty = False
@@ -0,0 +1,132 @@
+"""리밸런싱 시그널 입력 패널 (BaseStrategy.select_targets_batch 입력).
+
+전략 1개의 그룹 → 후보 티커 구성을 PricePanel·MomentumPanel 위에 고정하고,
+리밸런싱 행(row) 단위 입력을 제공한다.
+
+- scores_at(row) / histories_at(row): select_targets 1회 호출용 입력 (기존 의미 그대로)
+- score_column(group, rows):          여러 리밸런싱 행의 그룹 점수 벡터 (행별 캐시)
+  점수는 MomentumPanel.score_matrix()의 SCORE_FORMULA 컬럼에서 읽는다
+  (score_from_returns를 오버라이드한 전략만 행마다 스칼라로 계산)
+- sma_above(group, rows, period):     그룹 대표 티커의 "종가 > SMA" 벡터 (누적합 기반)
+- has_history(rows):                  행 이전 가격이 있는 티커가 하나라도 있는지 벡터
+
+그룹 대표 티커는 select_targets와 동일하게 우선순위 순으로 고른다
+(점수: 12개월+1개 이상 관측되고 점수가 나오는 첫 티커, 히스토리: 관측값이 있는 첫 티커).
+"""
+from array import array
+from itertools import accumulate
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from app.analytics.price_panel import HistoryView, PricePanel
+from app.constants import LOOKBACK_DAYS
+from app.analytics.momentum_panel import MomentumPanel
+from app.indicators.sma import is_above_sma
+from app.strategy import BaseStrategy
+
+
+class SignalPanel:
+    """전략 1개의 리밸런싱 행별 점수·히스토리 입력."""
+
+    def __init__(
+        self,
+        strategy: BaseStrategy,
+        panel: PricePanel,
+        momentum: MomentumPanel,
+        groups: Dict[str, List[str]],
+    ):
+        self.strategy = strategy
+        self.panel = panel
+        self.momentum = momentum
+        self.groups = groups
+        self._scores: Dict[Tuple[str, int], Optional[float]] = {}
+        self._prefix_sums: Dict[str, array] = {}
+        self._score_columns: Dict[str, array] = {}
+        # score_from_returns를 오버라이드하지 않은 전략은 공유 ScoreMatrix의 점수 컬럼을 읽는다
+        self._formula: Optional[str] = (
+            strategy.SCORE_FORMULA
+            if type(strategy).score_from_returns is BaseStrategy.score_from_returns
+            else None
+        )
+
+    # ── 행 1개 입력 (select_targets) ──
+
+    def _ticker_score(self, ticker: str, row: int) -> Optional[float]:
+        if self._formula is None:
+            return self.strategy.score_from_returns(self.momentum.at_row(ticker, row))
+        column = self._score_columns.get(ticker)
+        if column is None:
+            column = self.momentum.score_matrix().score_column(ticker, self._formula)
+            self._score_columns[ticker] = column
+        score = column[row]
+        return None if score != score else score
+
+    def score_at(self, group: str, row: int) -> Optional[float]:
+        key = (group, row)
+        if key not in self._scores:
+            score = None
+            for ticker in self.groups.get(group, ()):
+                if self.panel.count_before(ticker, row) > LOOKBACK_DAYS["12m"]:
+                    score = self._ticker_score(ticker, row)
+                    if score is not None:
+                        break
+            self._scores[key] = score
+        return self._scores[key]
+
+    def scores_at(self, row: int) -> Dict[str, Optional[float]]:
+        """row(리밸런싱일) 이전 종가 기준 그룹별 모멘텀 점수."""
+        return {group: self.score_at(group, row) for group in self.groups}
+
+    def histories_at(self, row: int) -> Dict[str, HistoryView]:
+        """row 이전 티커별 관측 종가 뷰 (SMA·변동성·상관관계 계산용, 결측 제외, 복사 없음)."""
+        histories: Dict[str, HistoryView] = {}
+        for tickers in self.groups.values():
+            for ticker in tickers:
+                prices = self.panel.history(ticker, row)
+                if prices:
+                    histories[ticker] = prices
+        return histories
+
+    # ── 여러 행 벡터 (select_targets_batch) ──
+
+    def score_column(self, group: str, rows: Sequence[int]) -> List[Optional[float]]:
+        return [self.score_at(group, row) for row in rows]
+
+    def has_history(self, rows: Sequence[int]) -> List[bool]:
+        tickers = [t for ts in self.groups.values() for t in ts]
+        return [any(self.panel.count_before(t, row) for t in tickers) for row in rows]
+
+    def _prefix_sum(self, ticker: str) -> array:
+        sums = self._prefix_sums.get(ticker)
+        if sums is None:
+            observed = self.panel.history(ticker, len(self.panel))
+            sums = array("d", [0.0])
+            sums.extend(accumulate(observed))
+            self._prefix_sums[ticker] = sums
+        return sums
+
+    def sma_above(self, group: str, rows: Sequence[int], period: int) -> List[Optional[bool]]:
+        """행별 is_above_sma(그룹 대표 티커 히스토리, period). 대표 티커 없음/데이터 부족 시 None.
+
+        SMA는 누적합 차이로 O(1)에 구하고, 종가와 SMA가 거의 같을 때만
+        is_above_sma로 다시 계산해 기존 결과와 같은 판정을 낸다.
+        """
+        result: List[Optional[bool]] = []
+        for row in rows:
+            ticker = next(
+                (t for t in self.groups.get(group, ()) if self.panel.count_before(t, row)), None
+            )
+            if ticker is None:
+                result.append(None)
+                continue
+            count = self.panel.count_before(ticker, row)
+            if count < period:
+                result.append(None)
+                continue
+            sums = self._prefix_sum(ticker)
+            last = self.panel.history(ticker, row, window=1)[0]
+            sma = (sums[count] - sums[count - period]) / period
+            if abs(last - sma) <= 1e-9 * max(abs(last), abs(sma)):
+                result.append(is_above_sma(self.panel.history(ticker, row, window=period), period))
+            else:
+                result.append(last > sma)
+        return result
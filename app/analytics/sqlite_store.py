@@ -0,0 +1,231 @@
+"""csv_logger용 SQLite 저장 백엔드.
+
+CLASSICQUANT_STORAGE=sqlite (또는 csv_logger.set_storage_backend("sqlite"))일 때
+csv_logger의 save_*/load_* 함수가 CSV 대신 data/classicquant.sqlite3를 사용한다.
+
+- 테이블명 = CSV 파일명(확장자 제외), 컬럼 = CSV 헤더 (값은 CSV와 같은 문자열)
+- PRIMARY KEY = CSV 키 컬럼에서 date를 맨 뒤로 보낸 순서
+  (strategy, date) / (ticker, date) / (date,) … → 전략·티커 필터 조회와 최신 행 조회가 인덱스 탐색
+- 기록은 INSERT OR IGNORE: 기존 키 스킵 (CSV append와 동일한 "먼저 기록 우선")
+- CSV 가져오기는 INSERT OR REPLACE: CSV 읽기 규칙(파일 하단 기록 우선)과 동일
+- 숨은 컬럼 _seq: 기록 순번 (CSV의 행 위치에 해당). 조회 결과·내보내기에는 나오지 않고
+  order_by=(INSERTION_ORDER,)로 CSV 파일 순서와 같은 순서로 읽을 때만 쓴다
+
+git에 커밋하는 스냅샷은 export_csv()로 CSV를 다시 만든다.
+"""
+import csv
+import itertools
+import os
+import sqlite3
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+
+INSERTION_ORDER = "_seq"
+
+
+def _primary_key(key_cols: Sequence[str]) -> Tuple[str, ...]:
+    return tuple(c for c in key_cols if c != "date") + (("date",) if "date" in key_cols else ())
+
+
+def _quote(name: str) -> str:
+    return '"' + name.replace('"', '""') + '"'
+
+
+class SqliteStorage:
+    """CSV 헤더/키 정의를 그대로 쓰는 SQLite 테이블 묶음."""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.conn = sqlite3.connect(str(path))
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self._columns: Dict[str, List[str]] = {}
+        self._next_seq: Dict[str, int] = {}
+
+    def close(self) -> None:
+        self.conn.close()
+
+    # ── 스키마 ──
+
+    def has_table(self, table: str) -> bool:
+        return self.columns(table) is not None
+
+    def _table_columns(self, table: str) -> Optional[List[str]]:
+        """_seq를 포함한 실제 테이블 컬럼."""
+        if table not in self._columns:
+            info = self.conn.execute(f"PRAGMA table_info({_quote(table)})").fetchall()
+            if not info:
+                return None
+            self._columns[table] = [row[1] for row in info]
+        return self._columns[table]
+
+    def columns(self, table: str) -> Optional[List[str]]:
+        """CSV 헤더에 해당하는 컬럼 (_seq 제외)."""
+        columns = self._table_columns(table)
+        if columns is None:
+            return None
+        return [c for c in columns if c != INSERTION_ORDER]
+
+    def _select_list(self, table: str) -> str:
+        return ", ".join(_quote(c) for c in self.columns(table))
+
+    def ensure_table(self, table: str, header: Sequence[str], key_cols: Sequence[str]) -> None:
+        """테이블이 없으면 만들고, 헤더에 새 컬럼이 있으면 추가한다."""
+        existing = self._table_columns(table)
+        seq = f"{_quote(INSERTION_ORDER)} INTEGER NOT NULL DEFAULT 0"
+        if existing is None:
+            cols = ", ".join(f"{_quote(c)} TEXT NOT NULL DEFAULT ''" for c in header)
+            pk = ", ".join(_quote(c) for c in _primary_key(key_cols))
+            with self.conn:
+                self.conn.execute(
+                    f"CREATE TABLE {_quote(table)} ({cols}, {seq}, PRIMARY KEY ({pk}))"
+                    " WITHOUT ROWID"
+                )
+        else:
+            missing = [c for c in header if c not in existing]
+            with self.conn:
+                for c in missing:
+                    self.conn.execute(
+                        f"ALTER TABLE {_quote(table)} ADD COLUMN {_quote(c)} TEXT NOT NULL DEFAULT ''"
+                    )
+                # _seq 이전에 만든 테이블: 기존 행은 순번 0 (키 순으로 앞쪽)
+                if INSERTION_ORDER not in existing:
+                    self.conn.execute(f"ALTER TABLE {_quote(table)} ADD COLUMN {seq}")
+        self._columns.pop(table, None)
+
+    def _seq_start(self, table: str) -> int:
+        """다음 기록 순번 (테이블별 최대값은 연결당 1회만 읽고 이후는 메모리에서 이어간다)."""
+        if table not in self._next_seq:
+            (last,) = self.conn.execute(
+                f"SELECT COALESCE(MAX({_quote(INSERTION_ORDER)}), 0) FROM {_quote(table)}"
+            ).fetchone()
+            self._next_seq[table] = last + 1
+        return self._next_seq[table]
+
+    # ── 기록 ──
+
+    def insert_rows(
+        self,
+        table: str,
+        header: Sequence[str],
+        key_cols: Sequence[str],
+        rows: Iterable[Sequence],
+        replace: bool = False,
+    ) -> int:
+        """행을 기록하고 실제로 추가(또는 교체)된 행 수를 반환한다.
+
+        replace=False: 기존 키 스킵 (INSERT OR IGNORE)
+        replace=True:  기존 키 덮어쓰기 (INSERT OR REPLACE, upsert)
+        date 컬럼은 YYYY-MM-DD로 정규화하고, 행마다 증가하는 기록 순번(_seq)을 붙인다.
+        """
+        from app.analytics.csv_logger import _normalize_date
+
+        self.ensure_table(table, header, key_cols)
+        date_pos = list(header).index("date") if "date" in header else None
+        width = len(header)
+        seqs = itertools.count(self._seq_start(table))
+
+        def _normalized() -> Iterator[List[str]]:
+            for row in rows:
+                values = ["" if v is None else str(v) for v in row][:width]
+                values += [""] * (width - len(values))
+                if date_pos is not None:
+                    values[date_pos] = _normalize_date(values[date_pos])
+                yield values + [next(seqs)]
+
+        verb = "INSERT OR REPLACE" if replace else "INSERT OR IGNORE"
+        cols = ", ".join(_quote(c) for c in [*header, INSERTION_ORDER])
+        marks = ", ".join("?" for _ in range(width + 1))
+        before = self.conn.total_changes
+        with self.conn:
+            self.conn.executemany(
+                f"{verb} INTO {_quote(table)} ({cols}) VALUES ({marks})", _normalized()
+            )
+        self._next_seq[table] = next(seqs)
+        return self.conn.total_changes - before
+
+    # ── 조회 ──
+
+    def _where(self, where: Optional[Dict[str, object]]) -> Tuple[str, List]:
+        if not where:
+            return "", []
+        clauses = []
+        params: List = []
+        for col, value in where.items():
+            if isinstance(value, (list, tuple, set)):
+                values = list(value)
+                clauses.append(f"{_quote(col)} IN ({', '.join('?' for _ in values)})")
+                params.extend(values)
+            else:
+                clauses.append(f"{_quote(col)} = ?")
+                params.append(value)
+        return " WHERE " + " AND ".join(clauses), params
+
+    def select(
+        self,
+        table: str,
+        where: Optional[Dict[str, object]] = None,
+        order_by: Sequence[str] = ("date",),
+        start: Optional[str] = None,
+        end: Optional[str] = None,
+    ) -> List[Dict[str, str]]:
+        """조건에 맞는 행을 dict 목록으로 반환한다. 테이블이 없으면 빈 리스트.
+
+        start/end: date 컬럼 범위 (포함, YYYY-MM-DD)
+        order_by에 INSERTION_ORDER를 넣으면 기록 순서(CSV 파일 순서)로 정렬한다.
+        """
+        columns = self.columns(table)
+        if columns is None:
+            return []
+        sql, params = self._where(where)
+        for op, bound in ((">=", start), ("<=", end)):
+            if bound:
+                sql += (" AND " if sql else " WHERE ") + f'"date" {op} ?'
+                params.append(bound)
+        order = ", ".join(_quote(c) for c in order_by if c in self._table_columns(table))
+        query = f"SELECT {self._select_list(table)} FROM {_quote(table)}{sql}" + (
+            f" ORDER BY {order}" if order else ""
+        )
+        return [dict(zip(columns, row)) for row in self.conn.execute(query, params)]
+
+    def latest(self, table: str, where: Optional[Dict[str, object]] = None) -> Optional[Dict[str, str]]:
+        """조건에 맞는 행 중 date가 가장 큰 행 (PRIMARY KEY 역순 탐색)."""
+        columns = self.columns(table)
+        if columns is None:
+            return None
+        sql, params = self._where(where)
+        row = self.conn.execute(
+            f'SELECT {self._select_list(table)} FROM {_quote(table)}{sql} '
+            'ORDER BY "date" DESC LIMIT 1',
+            params,
+        ).fetchone()
+        return dict(zip(columns, row)) if row else None
+
+    # ── CSV 가져오기 / 내보내기 ──
+
+    def import_csv(self, table: str, path: Path, header: Sequence[str], key_cols: Sequence[str]) -> int:
+        """CSV를 테이블로 가져온다 (같은 키는 파일 하단 기록 우선). 반환: 기록된 행 수."""
+        if not path.exists() or path.stat().st_size == 0:
+            return 0
+        with open(path, "r", newline="", encoding="utf-8") as f:
+            reader = csv.DictReader(f)
+            rows = [[row.get(c) for c in header] for row in reader]
+        return self.insert_rows(table, header, key_cols, rows, replace=True)
+
+    def export_csv(self, table: str, path: Path, key_cols: Sequence[str]) -> int:
+        """테이블을 CSV 키 순서로 정렬해 path에 쓴다 (임시 파일 → rename). 반환: 행 수."""
+        columns = self.columns(table)
+        if columns is None:
+            return 0
+        order = ", ".join(_quote(c) for c in key_cols)
+        tmp_path = path.with_name(f"{path.name}.tmp")
+        count = 0
+        with open(tmp_path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f, lineterminator="\n")
+            writer.writerow(columns)
+            query = f"SELECT {self._select_list(table)} FROM {_quote(table)} ORDER BY {order}"
+            for row in self.conn.execute(query):
+                writer.writerow(row)
+                count += 1
+        os.replace(tmp_path, path)
+        return count
@@ -1,8 +1,9 @@
-from typing import Dict, List, Optional
+from types import MappingProxyType
+from typing import ClassVar, Dict, List, Optional, Tuple
 
 from app.assets.ticker import Ticker
 
-_CACHE: Optional[Dict[str, object]] = None
+_CACHE: Optional["AssetUniverse"] = None
 
 
 def _build_candidates(primary: Ticker) -> List[Dict]:
@@ -50,7 +51,87 @@ def _build_maps(data: Dict) -> Dict[str, object]:
     }
 
 
-def _get_cache() -> Dict[str, object]:
+class AssetUniverse:
+    """전략 자산 정의(ASSETS)를 미리 컴파일한 불변 객체.
+
+    그룹 목록·티어·티커 목록을 tuple로, 티커 → 그룹/우선순위/거래소 맵을 읽기 전용
+    매핑으로 보관한다. 같은 정의는 AssetUniverse.of()로 프로세스 내 1회만 만든다.
+    전역 캐시(reload_assets)를 거치지 않으므로 여러 전략이 스레드에서 동시에 써도 안전하다.
+    """
+
+    __slots__ = (
+        "_type_to_groups", "_group_candidates", "_group_tiers", "_group_tickers",
+        "_ticker_to_group", "_ticker_to_priority", "_ticker_to_exchange",
+    )
+
+    _INSTANCES: ClassVar[Dict[Tuple, "AssetUniverse"]] = {}
+
+    def __init__(self, data: Dict):
+        maps = _build_maps(data)
+        group_candidates = {
+            group: tuple(MappingProxyType(dict(c)) for c in candidates)
+            for group, candidates in maps["group_to_candidates"].items()
+        }
+        group_tiers: Dict[str, Tuple[Tuple[str, ...], ...]] = {}
+        for group, candidates in group_candidates.items():
+            tiers: Dict[int, List[str]] = {}
+            for item in candidates:
+                tiers.setdefault(int(item.get("priority", 1)), []).append(item["ticker"])
+            group_tiers[group] = tuple(tuple(tiers[key]) for key in sorted(tiers))
+        setattr_ = object.__setattr__
+        setattr_(self, "_type_to_groups", MappingProxyType(
+            {t: tuple(groups) for t, groups in maps["type_to_groups"].items()}
+        ))
+        setattr_(self, "_group_candidates", MappingProxyType(group_candidates))
+        setattr_(self, "_group_tiers", MappingProxyType(group_tiers))
+        setattr_(self, "_group_tickers", MappingProxyType(
+            {g: tuple(t for tier in tiers for t in tier) for g, tiers in group_tiers.items()}
+        ))
+        setattr_(self, "_ticker_to_group", MappingProxyType(maps["ticker_to_group"]))
+        setattr_(self, "_ticker_to_priority", MappingProxyType(maps["ticker_to_priority"]))
+        setattr_(self, "_ticker_to_exchange", MappingProxyType(maps["ticker_to_exchange"]))
+
+    def __setattr__(self, name, value):
+        raise AttributeError("AssetUniverse is immutable")
+
+    @classmethod
+    def of(cls, data: Dict) -> "AssetUniverse":
+        """자산 정의로 AssetUniverse를 반환한다 (같은 정의는 캐시된 객체 재사용)."""
+        key = tuple(
+            (asset_type, tuple(getattr(g, "value", g) for g in groups))
+            for asset_type, groups in data.items()
+        )
+        universe = cls._INSTANCES.get(key)
+        if universe is None:
+            universe = cls._INSTANCES.setdefault(key, cls(data))
+        return universe
+
+    def asset_groups(self, asset_type: str) -> Tuple[str, ...]:
+        return self._type_to_groups.get(asset_type, ())
+
+    def all_groups(self) -> List[str]:
+        return sorted(self._group_candidates)
+
+    def group_candidates(self, group: str) -> Tuple[MappingProxyType, ...]:
+        return self._group_candidates.get(group, ())
+
+    def group_tiers(self, group: str) -> Tuple[Tuple[str, ...], ...]:
+        return self._group_tiers.get(group, ())
+
+    def group_tickers(self, group: str) -> Tuple[str, ...]:
+        return self._group_tickers.get(group, ())
+
+    def group_for_ticker(self, ticker: str) -> str:
+        return self._ticker_to_group.get(ticker, ticker)
+
+    def priority_for_ticker(self, ticker: str) -> int:
+        return int(self._ticker_to_priority.get(ticker, 1))
+
+    def exchange_for_ticker(self, ticker: str) -> str:
+        return self._ticker_to_exchange.get(ticker, "NASD")
+
+
+def _get_cache() -> AssetUniverse:
     if _CACHE is None:
         raise RuntimeError("assets cache not initialized — call reload_assets() first")
     return _CACHE
@@ -58,7 +139,7 @@ def _get_cache() -> Dict[str, object]:
 
 def reload_assets(data: Dict) -> None:
     global _CACHE
-    _CACHE = _build_maps(data)
+    _CACHE = AssetUniverse.of(data)
 
 
 def merge_assets(asset_dicts: List[Dict]) -> None:
@@ -71,48 +152,35 @@ def merge_assets(asset_dicts: List[Dict]) -> None:
                 if ticker not in merged_type:
                     merged_type.append(ticker)
     global _CACHE
-    _CACHE = _build_maps(merged)
+    _CACHE = AssetUniverse.of(merged)
 
 
 def asset_groups(asset_type: str) -> List[str]:
-    cache = _get_cache()
-    return list(cache["type_to_groups"].get(asset_type, []))
+    return list(_get_cache().asset_groups(asset_type))
 
 
 def all_groups() -> List[str]:
-    cache = _get_cache()
-    return sorted(cache["group_to_candidates"].keys())
+    return _get_cache().all_groups()
 
 
 def group_candidates(group: str) -> List[Dict]:
-    cache = _get_cache()
-    return list(cache["group_to_candidates"].get(group, []))
+    return [dict(c) for c in _get_cache().group_candidates(group)]
 
 
 def group_tiers(group: str) -> List[List[str]]:
-    candidates = group_candidates(group)
-    tiers: Dict[int, List[str]] = {}
-    for item in candidates:
-        priority = int(item.get("priority", 1))
-        tiers.setdefault(priority, []).append(item["ticker"])
-    return [tiers[key] for key in sorted(tiers.keys())]
+    return [list(tier) for tier in _get_cache().group_tiers(group)]
 
 
 def group_tickers(group: str) -> List[str]:
-    tickers: List[str] = []
-    for tier in group_tiers(group):
-        tickers.extend(tier)
-    return tickers
+    return list(_get_cache().group_tickers(group))
 
 
 def group_for_ticker(ticker: str) -> str:
-    cache = _get_cache()
-    return cache["ticker_to_group"].get(ticker, ticker)
+    return _get_cache().group_for_ticker(ticker)
 
 
 def priority_for_ticker(ticker: str) -> int:
-    cache = _get_cache()
-    return int(cache["ticker_to_priority"].get(ticker, 1))
+    return _get_cache().priority_for_ticker(ticker)
 
 
 def group_tier_index(ticker: str) -> int:
@@ -126,5 +194,4 @@ def group_map() -> Dict[str, List[List[str]]]:
 
 
 def exchange_for_ticker(ticker: str) -> str:
-    cache = _get_cache()
-    return cache["ticker_to_exchange"].get(ticker, "NASD")
+    return _get_cache().exchange_for_ticker(ticker)
@@ -0,0 +1,75 @@
+"""지표 결과 메모이제이션 (한 번의 run_rebalance / run_collect 실행 안에서 전략 간 공유).
+
+같은 실행에서 여러 전략이 같은 티커 히스토리로 같은 지표를 계산한다
+(예: LAA와 GTAA·Ivy의 SPY SMA). 히스토리를 IndicatorHistory로 넘기면
+@memoized 지표 함수가 (ticker, 마지막 bar 날짜, 지표, 파라미터) 키로 결과를 재사용한다.
+
+- IndicatorCache:   크기 제한 LRU + hits/misses 카운터
+- IndicatorHistory: 종가 list에 (ticker, end_date, cache)를 붙인 것 — 일반 list처럼 쓰인다
+- memoized(name):   첫 인자가 IndicatorHistory일 때만 캐시를 거치는 지표 데코레이터
+  (백테스트의 HistoryView·일반 list는 그대로 계산)
+"""
+import functools
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Iterable, Optional, Tuple
+
+_DEFAULT_SIZE = 4096
+
+
+class IndicatorCache:
+    """(ticker, end_date, indicator, params) → 지표 결과 LRU 캐시."""
+
+    def __init__(self, maxsize: int = _DEFAULT_SIZE):
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[Tuple[Hashable, ...], Any]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Tuple[Hashable, ...], compute: Callable[[], Any]) -> Any:
+        """key 결과가 있으면 재사용하고, 없으면 compute()로 계산해 저장한다."""
+        if key in self._entries:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return self._entries[key]
+        self.misses += 1
+        value = compute()
+        self._entries[key] = value
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+        return value
+
+
+class IndicatorHistory(list):
+    """티커의 종가 리스트 (오름차순) + 지표 캐시 키 정보."""
+
+    def __init__(
+        self,
+        prices: Iterable[float],
+        ticker: str,
+        end_date: Optional[str],
+        cache: Optional[IndicatorCache],
+    ):
+        super().__init__(prices)
+        self.ticker = ticker
+        self.end_date = end_date
+        self.cache = cache
+
+
+def memoized(indicator: str):
+    """지표 함수 fn(prices, *params)를 IndicatorHistory 입력에 한해 캐시한다."""
+
+    def decorator(fn):
+        @functools.wraps(fn)
+        def wrapper(prices, *args, **kwargs):
+            cache = prices.cache if isinstance(prices, IndicatorHistory) else None
+            if cache is None:
+                return fn(prices, *args, **kwargs)
+            key = (prices.ticker, prices.end_date, indicator, args, tuple(sorted(kwargs.items())))
+            return cache.get(key, lambda: fn(prices, *args, **kwargs))
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,144 @@
+"""수익률 상관계수 유틸리티.
+
+전략 선택(strategy_selector의 상관관계 필터), 선택 기준 백테스트(run_selection_backtest),
+FAA/EAA의 자산-EWP 상관계수(factor)가 같은 피어슨 계산을 공유합니다.
+
+각 시계열의 최근 window개 값(뒤쪽 정렬)으로 피어슨 상관계수를 구합니다.
+min_periods를 주면 두 시계열의 공통 꼬리가 window보다 짧아도 min_periods개 이상이면 계산합니다.
+시계열별 편차·표준편차는 한 번만 계산하고 쌍마다 내적만 더하므로
+k개 시계열 행렬이 O(k·window + k²·window)입니다.
+
+행렬은 (시계열 이름, 기준일, window)와 시계열별 최근 window개 값의 blake2b 다이제스트를 키로
+LRU 캐시에 보관합니다. 다이제스트는 C 수준에서 바이트를 해시하므로 파이썬 상관계수 계산보다
+훨씬 싸고, 윈도 안의 값이 하나라도 바뀌면(NAV 재작성·compaction 등) 다른 키가 됩니다.
+"""
+import hashlib
+import math
+from array import array
+from collections import OrderedDict
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+_CACHE_SIZE = 256
+
+_Stats = Optional[Tuple[List[float], float]]  # (평균 편차, 표준편차) — 데이터 부족 시 None
+
+
+class CorrelationMatrix:
+    """이름 × 이름 상관계수. 데이터 부족·표준편차 0인 쌍은 None."""
+
+    def __init__(self, names: Iterable[str], values: Dict[Tuple[str, str], Optional[float]]):
+        self.names = tuple(names)
+        self._values = values
+
+    def get(self, a: str, b: str) -> Optional[float]:
+        return self._values.get((a, b))
+
+    def row(self, name: str) -> Dict[str, Optional[float]]:
+        """name과 나머지 시계열의 상관계수 (자기 자신 제외)."""
+        return {other: self._values.get((name, other)) for other in self.names if other != name}
+
+
+_cache: "OrderedDict[tuple, CorrelationMatrix]" = OrderedDict()
+
+
+def _window_stats(series: Sequence[float], window: int) -> _Stats:
+    if len(series) < window:
+        return None
+    tail = series[-window:]
+    mean = sum(tail) / window
+    deviations = [x - mean for x in tail]
+    std = math.sqrt(sum(d ** 2 for d in deviations) / (window - 1))
+    return deviations, std
+
+
+def _pair(stats_a: _Stats, stats_b: _Stats, window: int) -> Optional[float]:
+    if stats_a is None or stats_b is None:
+        return None
+    dev_a, std_a = stats_a
+    dev_b, std_b = stats_b
+    if std_a < 1e-10 or std_b < 1e-10:
+        return None
+    cov = sum(x * y for x, y in zip(dev_a, dev_b)) / (window - 1)
+    return cov / (std_a * std_b)
+
+
+def _common_window(
+    len_a: int, len_b: int, window: int, min_periods: Optional[int]
+) -> Optional[int]:
+    """두 시계열에 쓸 공통 꼬리 길이. 데이터 부족 시 None."""
+    n = min(len_a, len_b, window) if min_periods is not None else window
+    if n < (window if min_periods is None else min_periods):
+        return None
+    return n
+
+
+def window_correlation(
+    a: Sequence[float],
+    b: Sequence[float],
+    window: int = 63,
+    min_periods: Optional[int] = None,
+) -> Optional[float]:
+    """두 수익률 시계열의 최근 window일 피어슨 상관계수. 데이터 부족 시 None.
+
+    min_periods 지정 시 공통 꼬리 min(len(a), len(b), window)개가 min_periods 이상이면 계산한다.
+    """
+    n = _common_window(len(a), len(b), window, min_periods)
+    if n is None:
+        return None
+    return _pair(_window_stats(a, n), _window_stats(b, n), n)
+
+
+def correlations_with(
+    series: Dict[str, Sequence[float]],
+    target: Sequence[float],
+    window: int = 63,
+    min_periods: Optional[int] = None,
+) -> Dict[str, Optional[float]]:
+    """각 시계열과 target의 window_correlation. target 통계는 공통 꼬리 길이별로 1회만 계산."""
+    target_stats: Dict[int, _Stats] = {}
+    result: Dict[str, Optional[float]] = {}
+    for name, values in series.items():
+        n = _common_window(len(values), len(target), window, min_periods)
+        if n is None:
+            result[name] = None
+            continue
+        if n not in target_stats:
+            target_stats[n] = _window_stats(target, n)
+        result[name] = _pair(_window_stats(values, n), target_stats[n], n)
+    return result
+
+
+def _fingerprint(values: Sequence[float], window: int) -> bytes:
+    """캐시 키용 시계열 지문: 최근 window개 값(부족하면 전체)의 blake2b 다이제스트."""
+    tail = values[-window:] if window else values[:0]
+    return hashlib.blake2b(array("d", tail).tobytes(), digest_size=16).digest()
+
+
+def correlation_matrix(
+    series: Dict[str, Sequence[float]],
+    window: int = 63,
+    end_date: Optional[str] = None,
+) -> CorrelationMatrix:
+    """여러 수익률 시계열의 최근 window일 상관계수 행렬 (LRU 캐시).
+
+    end_date는 시계열이 끝나는 기준일로 캐시 키에 들어간다. 적중 여부는 시계열별
+    최근 window개 값의 다이제스트로 판정하므로 윈도 안 어느 값이 바뀌어도 다시 계산한다.
+    """
+    names = tuple(sorted(series))
+    key = (names, end_date, window, tuple(_fingerprint(series[name], window) for name in names))
+    matrix = _cache.get(key)
+    if matrix is not None:
+        _cache.move_to_end(key)
+        return matrix
+
+    stats = {name: _window_stats(series[name], window) for name in names}
+    values: Dict[Tuple[str, str], Optional[float]] = {}
+    for i, a in enumerate(names):
+        for b in names[i:]:
+            values[(a, b)] = values[(b, a)] = _pair(stats[a], stats[b], window)
+    matrix = CorrelationMatrix(names, values)
+
+    _cache[key] = matrix
+    if len(_cache) > _CACHE_SIZE:
+        _cache.popitem(last=False)
+    return matrix
@@ -1,16 +1,20 @@
 """변동성·상관관계 계산 유틸리티.
 
 FAA, EAA 전략의 복합 랭킹 점수 계산에 사용됩니다.
+전략에서는 compute_factor_stats로 그룹별 변동성·EWP·EWP 상관계수를 한 번에 구합니다.
 """
 import math
-from typing import Dict, List, Optional
+from typing import Dict, List, NamedTuple, Optional, Sequence
 
 from app.constants import LOOKBACK_DAYS
+from app.indicators.cache import memoized
+from app.indicators.correlation import correlations_with, window_correlation
 
 _LOOKBACK = LOOKBACK_DAYS["12m"]  # 252일
+_MIN_PERIODS = 20  # 상관계수 최소 공통 수익률 개수
 
 
-def _daily_returns(prices: List[float], lookback: int = _LOOKBACK) -> List[float]:
+def _daily_returns(prices: Sequence[float], lookback: int = _LOOKBACK) -> List[float]:
     """lookback 기간의 일별 수익률 시계열 반환."""
     if len(prices) < lookback + 1:
         n = len(prices)
@@ -24,12 +28,7 @@ def _daily_returns(prices: List[float], lookback: int = _LOOKBACK) -> List[float
     return rets
 
 
-def compute_volatility(prices: List[float], lookback: int = _LOOKBACK) -> Optional[float]:
-    """연율화 변동성 (일별 수익률 표준편차 × √252).
-
-    Returns None if insufficient data.
-    """
-    rets = _daily_returns(prices, lookback)
+def _annualized_volatility(rets: Sequence[float]) -> Optional[float]:
     if len(rets) < 20:
         return None
     mean = sum(rets) / len(rets)
@@ -37,9 +36,22 @@ def compute_volatility(prices: List[float], lookback: int = _LOOKBACK) -> Option
     return math.sqrt(variance * 252)
 
 
+def _clamp(corr: Optional[float]) -> Optional[float]:
+    return None if corr is None else max(-1.0, min(1.0, corr))
+
+
+@memoized("volatility")
+def compute_volatility(prices: Sequence[float], lookback: int = _LOOKBACK) -> Optional[float]:
+    """연율화 변동성 (일별 수익률 표준편차 × √252).
+
+    Returns None if insufficient data.
+    """
+    return _annualized_volatility(_daily_returns(prices, lookback))
+
+
 def compute_correlation(
-    prices_a: List[float],
-    prices_b: List[float],
+    prices_a: Sequence[float],
+    prices_b: Sequence[float],
     lookback: int = _LOOKBACK,
 ) -> Optional[float]:
     """두 자산의 일별 수익률 간 피어슨 상관계수.
@@ -48,23 +60,11 @@ def compute_correlation(
     """
     rets_a = _daily_returns(prices_a, lookback)
     rets_b = _daily_returns(prices_b, lookback)
-    n = min(len(rets_a), len(rets_b))
-    if n < 20:
-        return None
-    rets_a = rets_a[-n:]
-    rets_b = rets_b[-n:]
-    mean_a = sum(rets_a) / n
-    mean_b = sum(rets_b) / n
-    cov = sum((rets_a[i] - mean_a) * (rets_b[i] - mean_b) for i in range(n)) / (n - 1)
-    std_a = math.sqrt(sum((r - mean_a) ** 2 for r in rets_a) / (n - 1))
-    std_b = math.sqrt(sum((r - mean_b) ** 2 for r in rets_b) / (n - 1))
-    if std_a < 1e-10 or std_b < 1e-10:
-        return None
-    return max(-1.0, min(1.0, cov / (std_a * std_b)))
+    return _clamp(window_correlation(rets_a, rets_b, lookback, min_periods=_MIN_PERIODS))
 
 
 def compute_ewp_prices(
-    all_prices: Dict[str, List[float]],
+    all_prices: Dict[str, Sequence[float]],
 ) -> List[float]:
     """등비중(Equal-Weighted Portfolio) 일별 가격 인덱스 시계열 반환.
 
@@ -89,3 +89,47 @@ def compute_ewp_prices(
         ) / n
         ewp.append(ewp[-1] * (1.0 + avg_ret))
     return ewp
+
+
+class FactorStats(NamedTuple):
+    """compute_factor_stats 결과 (키는 입력 그룹)."""
+
+    volatilities: Dict[str, Optional[float]]
+    ewp: List[float]
+    correlations: Dict[str, Optional[float]]
+
+
+def compute_factor_stats(
+    all_prices: Dict[str, Sequence[float]],
+    lookback: int = _LOOKBACK,
+) -> FactorStats:
+    """여러 자산의 변동성, 등비중 가격 인덱스, EWP 대비 상관계수를 한 번에 계산한다.
+
+    compute_volatility / compute_ewp_prices / compute_correlation(p, ewp)를 따로 부를 때와
+    같은 값을 내되, 자산별 일별 수익률을 한 번만 만들어 변동성·상관계수에 함께 쓰고
+    EWP는 상관계수에 쓰이는 최근 lookback+1일(뒤쪽 정렬 days × assets 구간)만 만든다.
+    ewp는 그 구간의 인덱스(시작 1.0)이며, EWP를 만들 수 없으면 []와 상관계수 None.
+    """
+    returns = {g: _daily_returns(p, lookback) for g, p in all_prices.items()}
+    volatilities = {g: _annualized_volatility(rets) for g, rets in returns.items()}
+    correlations: Dict[str, Optional[float]] = {g: None for g in all_prices}
+    if not all_prices:
+        return FactorStats(volatilities, [], correlations)
+
+    window = min(min(len(p) for p in all_prices.values()), lookback + 1)
+    if window < 2:
+        return FactorStats(volatilities, [], correlations)
+    aligned = [p[-window:] for p in all_prices.values()]
+    n = len(aligned)
+    ewp = [1.0]
+    ewp_returns: List[float] = []
+    for i in range(1, window):
+        avg_ret = sum(
+            (prices[i] / prices[i - 1] - 1.0) for prices in aligned if prices[i - 1] > 0
+        ) / n
+        ewp_returns.append(avg_ret)
+        ewp.append(ewp[-1] * (1.0 + avg_ret))
+
+    by_group = correlations_with(returns, ewp_returns, lookback, min_periods=_MIN_PERIODS)
+    correlations.update((g, _clamp(corr)) for g, corr in by_group.items())
+    return FactorStats(volatilities, ewp, correlations)
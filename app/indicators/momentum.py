@@ -1,10 +1,14 @@
-from typing import Dict, List, Optional
+from typing import TYPE_CHECKING, Dict, List, Optional
 
 from app.constants import LOOKBACK_DAYS
 from app.data.data_utils import parse_history
 from app.execution.exchange import set_exchange_for_ticker
 from app.assets.assets import group_tickers
 from app.data.kis_api import KoreaInvestmentAPI
+from app.indicators.score import score_returns
+
+if TYPE_CHECKING:
+    from app.analytics.momentum_panel import MomentumPanel
 
 
 def compute_return(prices: List[float], lookback: int) -> Optional[float]:
@@ -24,16 +28,24 @@ def compute_momentum(prices: List[float]) -> tuple[Optional[float], Dict[str, Op
     r12 = compute_return(prices, LOOKBACK_DAYS["12m"])
 
     returns = {"r1m": r1, "r3m": r3, "r6m": r6, "r12m": r12}
+    return _keller_score(returns), returns
 
-    if None in (r1, r3, r6, r12):
-        return None, returns
 
-    return (r1 * 12) + (r3 * 4) + (r6 * 2) + (r12 * 1), returns
+def _keller_score(returns: Dict[str, Optional[float]]) -> Optional[float]:
+    return score_returns(returns, "keller")
 
 
 def get_momentum_scores(
-    api: KoreaInvestmentAPI, groups: List[str],
+    api: KoreaInvestmentAPI,
+    groups: List[str],
+    momentum: Optional["MomentumPanel"] = None,
+    formula: str = "keller",
 ) -> tuple[Dict[str, Optional[float]], Dict[str, Dict[str, Optional[float]]], Dict[str, list]]:
+    """그룹별 모멘텀 점수·수익률과 조회한 티커 히스토리를 반환한다.
+
+    그룹 대표 티커는 formula(전략의 SCORE_FORMULA) 점수가 나오는 첫 티커다.
+    momentum을 넘기면 여러 전략 실행 사이에 티커 히스토리 조회와 수익률 계산을 공유한다.
+    """
     scores: Dict[str, Optional[float]] = {}
     all_returns: Dict[str, Dict[str, Optional[float]]] = {}
     all_histories: Dict[str, list] = {}
@@ -41,12 +53,20 @@ def get_momentum_scores(
         score = None
         returns: Dict[str, Optional[float]] = {}
         for ticker in group_tickers(group):
-            set_exchange_for_ticker(api, ticker)
-            history = api.get_historical_data(ticker, period="D", min_records=260)
-            if not history:
-                continue
-            prices = parse_history(history)
-            score, returns = compute_momentum(prices)
+            if momentum is not None and ticker in momentum.histories:
+                history = momentum.histories[ticker]
+            else:
+                set_exchange_for_ticker(api, ticker)
+                history = api.get_historical_data(ticker, period="D", min_records=260)
+                if not history:
+                    continue
+                if momentum is not None:
+                    momentum.add_history(ticker, history)
+            if momentum is not None:
+                returns = momentum.latest(ticker)
+            else:
+                _, returns = compute_momentum(parse_history(history))
+            score = score_returns(returns, formula)
             all_histories[ticker] = history
             if score is not None:
                 break
@@ -0,0 +1,47 @@
+"""모멘텀 점수 공식.
+
+전략은 SCORE_FORMULA(ClassVar)로 SCORE_FORMULAS의 공식 이름을 고른다.
+공식은 r1m/r3m/r6m/r12m 4개 float을 받아 float을 돌려주며, 수익률이 없으면 NaN이다.
+스칼라 경로(score_returns)는 None ↔ NaN을 변환해 기존 None 의미를 그대로 유지한다.
+
+- "keller":            12·r1 + 4·r3 + 2·r6 + r12 (하나라도 없으면 NaN)
+- "annualized_return": 있는 기간의 연율화 수익률 단순 평균 (모두 없으면 NaN)
+- "r12m":              12개월 수익률 (GEM)
+
+PricePanel 행 전체에 대한 점수 컬럼은 app.analytics.momentum_panel.ScoreMatrix가
+같은 SCORE_FORMULAS로 만든다.
+"""
+import math
+from typing import Callable, Dict, Optional
+
+PERIODS = ("r1m", "r3m", "r6m", "r12m")
+_ANNUALIZE = (12, 4, 2, 1)
+
+NAN = math.nan
+
+
+def _keller(r1: float, r3: float, r6: float, r12: float) -> float:
+    return (r1 * 12) + (r3 * 4) + (r6 * 2) + (r12 * 1)
+
+
+def _annualized_return(r1: float, r3: float, r6: float, r12: float) -> float:
+    annualized = [v * mult for v, mult in zip((r1, r3, r6, r12), _ANNUALIZE) if v == v]
+    return sum(annualized) / len(annualized) if annualized else NAN
+
+
+def _r12m(r1: float, r3: float, r6: float, r12: float) -> float:
+    return r12
+
+
+SCORE_FORMULAS: Dict[str, Callable[[float, float, float, float], float]] = {
+    "keller": _keller,
+    "annualized_return": _annualized_return,
+    "r12m": _r12m,
+}
+
+
+def score_returns(returns: Dict[str, Optional[float]], formula: str = "keller") -> Optional[float]:
+    """{r1m..r12m: 수익률 또는 None} → 점수 (계산 불가 시 None)."""
+    args = [NAN if (v := returns.get(key)) is None else v for key in PERIODS]
+    score = SCORE_FORMULAS[formula](*args)
+    return None if score != score else score
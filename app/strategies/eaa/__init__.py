@@ -1,7 +1,6 @@
 from typing import ClassVar, Dict, List, Optional
 
-from app.assets.assets import asset_groups
-from app.indicators.factor import compute_correlation, compute_ewp_prices, compute_volatility
+from app.indicators.factor import compute_factor_stats
 from app.strategy import BaseStrategy
 from app.strategies import register
 from app.strategies.mixins import AnnualizedReturnScoreMixin
@@ -29,7 +28,8 @@ class EAAStrategy(AnnualizedReturnScoreMixin, BaseStrategy):
     }
 
     def get_universe(self) -> List[str]:
-        return sorted(set(asset_groups("universe") + asset_groups("defensive")))
+        universe = self.universe
+        return sorted(set(universe.asset_groups("universe") + universe.asset_groups("defensive")))
 
     def _elastic_score(
         self,
@@ -53,8 +53,8 @@ class EAAStrategy(AnnualizedReturnScoreMixin, BaseStrategy):
         scores: Dict[str, Optional[float]],
         histories: Dict[str, List[float]] | None = None,
     ) -> Dict[str, float]:
-        universe = asset_groups("universe")
-        defensive = asset_groups("defensive")
+        universe = self.universe.asset_groups("universe")
+        defensive = self.universe.asset_groups("defensive")
         cash = defensive[0]
 
         valid = [g for g in universe if scores.get(g) is not None]
@@ -69,13 +69,9 @@ class EAAStrategy(AnnualizedReturnScoreMixin, BaseStrategy):
             group_prices = self._load_group_prices(valid, histories)
 
             if len(group_prices) >= 2:
-                for g, p in group_prices.items():
-                    vols[g] = compute_volatility(p)
-
-                ewp = compute_ewp_prices(group_prices)
-                if ewp:
-                    for g, p in group_prices.items():
-                        corrs[g] = compute_correlation(p, ewp)
+                stats = compute_factor_stats(group_prices)
+                vols.update(stats.volatilities)
+                corrs.update(stats.correlations)
 
         # 탄성 점수 계산
         elastic: Dict[str, float] = {
@@ -107,5 +103,5 @@ class EAAStrategy(AnnualizedReturnScoreMixin, BaseStrategy):
         return result if result else {cash: 1.0}
 
     def is_offensive(self, scores: Dict[str, Optional[float]]) -> bool:
-        universe = asset_groups("universe")
+        universe = self.universe.asset_groups("universe")
         return any(scores.get(g) is not None and scores[g] > 0 for g in universe)
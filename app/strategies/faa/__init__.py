@@ -1,7 +1,6 @@
 from typing import ClassVar, Dict, List, Optional
 
-from app.assets.assets import asset_groups
-from app.indicators.factor import compute_correlation, compute_ewp_prices, compute_volatility
+from app.indicators.factor import compute_factor_stats
 from app.strategy import BaseStrategy
 from app.strategies import register
 from app.strategies.mixins import AnnualizedReturnScoreMixin
@@ -31,15 +30,16 @@ class FAAStrategy(AnnualizedReturnScoreMixin, BaseStrategy):
     }
 
     def get_universe(self) -> List[str]:
-        return sorted(set(asset_groups("universe") + asset_groups("defensive")))
+        universe = self.universe
+        return sorted(set(universe.asset_groups("universe") + universe.asset_groups("defensive")))
 
     def select_targets(
         self,
         scores: Dict[str, Optional[float]],
         histories: Dict[str, List[float]] | None = None,
     ) -> Dict[str, float]:
-        universe = asset_groups("universe")
-        defensive = asset_groups("defensive")
+        universe = self.universe.asset_groups("universe")
+        defensive = self.universe.asset_groups("defensive")
         cash = defensive[0]
 
         # --- 모멘텀 랭킹 ---
@@ -58,21 +58,17 @@ class FAAStrategy(AnnualizedReturnScoreMixin, BaseStrategy):
             group_prices = self._load_group_prices(valid, histories)
 
             if len(group_prices) >= 2:
-                ewp = compute_ewp_prices(group_prices)
+                stats = compute_factor_stats(group_prices)
 
-                vols = {g: compute_volatility(p) for g, p in group_prices.items()}
+                vols = stats.volatilities
                 valid_vol = [g for g in valid if vols.get(g) is not None]
                 sorted_by_vol = sorted(valid_vol, key=lambda g: vols[g])
                 vol_rank.update({g: i + 1 for i, g in enumerate(sorted_by_vol)})
 
-                if ewp:
-                    corrs = {
-                        g: compute_correlation(group_prices[g], ewp)
-                        for g in group_prices
-                    }
-                    valid_corr = [g for g in valid if corrs.get(g) is not None]
-                    sorted_by_corr = sorted(valid_corr, key=lambda g: corrs[g])
-                    corr_rank.update({g: i + 1 for i, g in enumerate(sorted_by_corr)})
+                corrs = stats.correlations
+                valid_corr = [g for g in valid if corrs.get(g) is not None]
+                sorted_by_corr = sorted(valid_corr, key=lambda g: corrs[g])
+                corr_rank.update({g: i + 1 for i, g in enumerate(sorted_by_corr)})
 
         # --- 복합 랭킹 ---
         combined = {
@@ -96,6 +92,6 @@ class FAAStrategy(AnnualizedReturnScoreMixin, BaseStrategy):
         return result
 
     def is_offensive(self, scores: Dict[str, Optional[float]]) -> bool:
-        universe = asset_groups("universe")
+        universe = self.universe.asset_groups("universe")
         risky = [g for g in universe if g != "SHY"]
         return any(scores.get(g) is not None and scores[g] > 0 for g in risky)
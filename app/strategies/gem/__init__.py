@@ -1,6 +1,5 @@
 from typing import ClassVar, Dict, List, Optional
 
-from app.assets.assets import asset_groups
 from app.strategy import BaseStrategy
 from app.strategies import register
 from app.assets.ticker import Ticker
@@ -22,21 +21,20 @@ class GEMStrategy(BaseStrategy):
     }
 
     def get_universe(self) -> List[str]:
-        offensive = asset_groups("offensive")
-        defensive = asset_groups("defensive")
+        offensive = self.universe.asset_groups("offensive")
+        defensive = self.universe.asset_groups("defensive")
         return sorted(set(offensive + defensive))
 
-    def score_from_returns(self, returns: Dict[str, Optional[float]]) -> Optional[float]:
-        """Antonacci 원논문: 12개월 수익률만 사용 (복합 공식 X)."""
-        return returns.get("r12m")
+    # Antonacci 원논문: 12개월 수익률만 사용 (복합 공식 X)
+    SCORE_FORMULA: ClassVar[str] = "r12m"
 
     def select_targets(
         self,
         scores: Dict[str, Optional[float]],
         histories: Dict[str, List[float]] | None = None,
     ) -> Dict[str, float]:
-        offensive_assets = asset_groups("offensive")   # SPY, EFA
-        defensive_assets = asset_groups("defensive")   # AGG
+        offensive_assets = self.universe.asset_groups("offensive")   # SPY, EFA
+        defensive_assets = self.universe.asset_groups("defensive")   # AGG
 
         # 상대 모멘텀: 공격자산 중 점수 최고 선택
         ranked_off = sorted(
@@ -65,7 +63,7 @@ class GEMStrategy(BaseStrategy):
         return {ranked_def[0]: 1.0}
 
     def is_offensive(self, scores: Dict[str, Optional[float]]) -> bool:
-        offensive_assets = asset_groups("offensive")
+        offensive_assets = self.universe.asset_groups("offensive")
         return any(
             scores.get(t) is not None and scores[t] >= 0
             for t in offensive_assets
@@ -1,6 +1,5 @@
 from typing import ClassVar, Dict, List, Optional
 
-from app.assets.assets import asset_groups, group_tickers
 from app.indicators.sma import SMA_200D, is_above_sma
 from app.strategy import BaseStrategy
 from app.strategies import register
@@ -32,13 +31,15 @@ class LAAStrategy(BaseStrategy):
         "risk_off": [Ticker.SHY],
         "trend":    [Ticker.SPY],
     }
+    # 실업률(FRED)을 조회 시점 기준으로 읽으므로 가격만으로 시그널이 정해지지 않는다
+    SIGNAL_CACHEABLE: ClassVar[bool] = False
 
     def get_universe(self) -> List[str]:
         return sorted(
             set(
-                asset_groups("risk_on")
-                + asset_groups("risk_off")
-                + asset_groups("trend")
+                self.universe.asset_groups("risk_on")
+                + self.universe.asset_groups("risk_off")
+                + self.universe.asset_groups("trend")
             )
         )
 
@@ -68,10 +69,10 @@ class LAAStrategy(BaseStrategy):
         """SPY < 200일 SMA이면 True."""
         if not histories:
             return False
-        trend_groups = asset_groups("trend")
+        trend_groups = self.universe.asset_groups("trend")
         if not trend_groups:
             return False
-        for ticker in group_tickers(trend_groups[0]):
+        for ticker in self.universe.group_tickers(trend_groups[0]):
             if ticker in histories and histories[ticker]:
                 result = is_above_sma(histories[ticker], SMA_200D)
                 # is_above_sma=True면 SMA 위 → 정상, False면 SMA 아래 → 위험
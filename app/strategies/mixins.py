@@ -2,10 +2,14 @@
 
 각 Mixin은 단독으로 사용할 수 없으며, BaseStrategy와 함께 다중 상속으로 사용한다.
 """
-from typing import ClassVar, Dict, List, Optional
+from array import array
+from typing import TYPE_CHECKING, ClassVar, Dict, List, Optional, Sequence
 
-from app.assets.assets import asset_groups, group_tickers
 from app.indicators.sma import SMA_10M, is_above_sma
+from app.strategy import TargetMatrix
+
+if TYPE_CHECKING:
+    from app.analytics.signal_panel import SignalPanel
 
 
 def _rank_by_score(
@@ -32,7 +36,7 @@ class FixedWeightMixin:
     WEIGHTS: ClassVar[Dict[str, float]]
 
     def get_universe(self) -> List[str]:
-        return sorted(asset_groups("fixed"))
+        return sorted(self.universe.asset_groups("fixed"))
 
     def select_targets(
         self,
@@ -41,6 +45,18 @@ class FixedWeightMixin:
     ) -> Dict[str, float]:
         return dict(self.WEIGHTS)
 
+    def static_targets(self) -> Optional[Dict[str, float]]:
+        return dict(self.WEIGHTS)
+
+    def select_targets_batch(
+        self,
+        panel: "SignalPanel",
+        rebalance_idx: Sequence[int],
+    ) -> TargetMatrix:
+        """모든 리밸런싱일이 같은 WEIGHTS 행 (점수·히스토리 계산 없음)."""
+        row = array("d", self.WEIGHTS.values())
+        return TargetMatrix(list(self.WEIGHTS), [row] * len(rebalance_idx))
+
     def is_offensive(self, scores: Dict[str, Optional[float]]) -> bool:
         return True
 
@@ -54,21 +70,22 @@ class SmaTrendMixin:
     """
 
     def get_universe(self) -> List[str]:
-        return sorted(set(asset_groups("offensive") + asset_groups("defensive")))
+        universe = self.universe
+        return sorted(set(universe.asset_groups("offensive") + universe.asset_groups("defensive")))
 
     def select_targets(
         self,
         scores: Dict[str, Optional[float]],
         histories: Dict[str, List[float]] | None = None,
     ) -> Dict[str, float]:
-        offensive = asset_groups("offensive")
-        defensive = asset_groups("defensive")
+        offensive = self.universe.asset_groups("offensive")
+        defensive = self.universe.asset_groups("defensive")
 
         if histories:
             above = []
             for group in offensive:
                 prices = None
-                for ticker in group_tickers(group):
+                for ticker in self.universe.group_tickers(group):
                     if ticker in histories and histories[ticker]:
                         prices = histories[ticker]
                         break
@@ -83,8 +100,38 @@ class SmaTrendMixin:
         weight = 1.0 / len(above)
         return {g: weight for g in above}
 
+    def select_targets_batch(
+        self,
+        panel: "SignalPanel",
+        rebalance_idx: Sequence[int],
+    ) -> TargetMatrix:
+        """그룹별 "종가 > 10개월 SMA" 벡터로 전체 리밸런싱일을 한 번에 계산한다."""
+        offensive = self.universe.asset_groups("offensive")
+        defensive = self.universe.asset_groups("defensive")
+        columns = list(dict.fromkeys(offensive + defensive[:1]))
+        position = {g: i for i, g in enumerate(columns)}
+
+        has_history = panel.has_history(rebalance_idx)
+        trend = {g: panel.sma_above(g, rebalance_idx, SMA_10M) for g in offensive}
+        scores = {g: panel.score_column(g, rebalance_idx) for g in offensive}
+
+        rows: List[Optional[array]] = []
+        for i in range(len(rebalance_idx)):
+            if has_history[i]:
+                above = [g for g in offensive if trend[g][i] is True]
+            else:
+                above = [g for g in offensive if scores[g][i] is not None and scores[g][i] > 0]
+            row = array("d", [0.0]) * len(columns)
+            if not above:
+                row[position[defensive[0]]] = 1.0
+            else:
+                for g in above:
+                    row[position[g]] = 1.0 / len(above)
+            rows.append(row)
+        return TargetMatrix(columns, rows)
+
     def is_offensive(self, scores: Dict[str, Optional[float]]) -> bool:
-        offensive = asset_groups("offensive")
+        offensive = self.universe.asset_groups("offensive")
         return any(scores.get(g) is not None and scores[g] > 0 for g in offensive)
 
 
@@ -106,15 +153,16 @@ class CanaryMixin:
 
     def _canary_ok(self, scores: Dict[str, Optional[float]]) -> bool:
         if self.CANARY_GROUP is None:
-            canary = asset_groups("offensive")
+            canary = self.universe.asset_groups("offensive")
         else:
-            canary = asset_groups(self.CANARY_GROUP)
+            canary = self.universe.asset_groups(self.CANARY_GROUP)
         return all(scores.get(t) is not None and scores[t] >= 0 for t in canary)
 
     def get_universe(self) -> List[str]:
-        groups = asset_groups("offensive") + asset_groups("defensive")
+        universe = self.universe
+        groups = universe.asset_groups("offensive") + universe.asset_groups("defensive")
         if self.CANARY_GROUP:
-            groups += asset_groups(self.CANARY_GROUP)
+            groups += universe.asset_groups(self.CANARY_GROUP)
         return sorted(set(groups))
 
     def select_targets(
@@ -123,7 +171,7 @@ class CanaryMixin:
         histories: Dict[str, List[float]] | None = None,
     ) -> Dict[str, float]:
         if self._canary_ok(scores):
-            ranked = _rank_by_score(asset_groups("offensive"), scores)
+            ranked = _rank_by_score(self.universe.asset_groups("offensive"), scores)
             if len(ranked) < self.OFFENSIVE_SLOTS:
                 raise RuntimeError(
                     f"{self.__class__.__name__}: 공격자산 모멘텀 데이터 부족"
@@ -132,13 +180,59 @@ class CanaryMixin:
             w = 1.0 / len(top)
             return {t: w for t in top}
 
-        ranked = _rank_by_score(asset_groups("defensive"), scores)
+        ranked = _rank_by_score(self.universe.asset_groups("defensive"), scores)
         if not ranked:
             raise RuntimeError(
                 f"{self.__class__.__name__}: 수비자산 모멘텀 데이터 부족"
             )
         return {ranked[0]: 1.0}
 
+    def select_targets_batch(
+        self,
+        panel: "SignalPanel",
+        rebalance_idx: Sequence[int],
+    ) -> TargetMatrix:
+        """그룹 점수 벡터 → 카나리아 판정 벡터 → 행별 상위 N개 / 수비 1위 비중 행렬.
+
+        데이터 부족(select_targets의 RuntimeError)인 행은 None.
+        """
+        universe = self.universe
+        offensive = universe.asset_groups("offensive")
+        defensive = universe.asset_groups("defensive")
+        canary = offensive if self.CANARY_GROUP is None else universe.asset_groups(
+            self.CANARY_GROUP
+        )
+        columns = list(dict.fromkeys(offensive + defensive))
+        position = {g: i for i, g in enumerate(columns)}
+
+        n = len(rebalance_idx)
+        scores = {
+            g: panel.score_column(g, rebalance_idx) for g in dict.fromkeys(columns + list(canary))
+        }
+        canary_ok = [
+            all(s is not None and s >= 0 for s in row_scores)
+            for row_scores in zip(*(scores[g] for g in canary))
+        ] if canary else [True] * n
+
+        rows: List[Optional[array]] = []
+        for i in range(n):
+            row_scores = {g: col[i] for g, col in scores.items()}
+            if canary_ok[i]:
+                top = _rank_by_score(offensive, row_scores)[: self.OFFENSIVE_SLOTS]
+                if len(top) < self.OFFENSIVE_SLOTS:
+                    rows.append(None)
+                    continue
+            else:
+                top = _rank_by_score(defensive, row_scores)[:1]
+                if not top:
+                    rows.append(None)
+                    continue
+            row = array("d", [0.0]) * len(columns)
+            for g in top:
+                row[position[g]] = 1.0 / len(top)
+            rows.append(row)
+        return TargetMatrix(columns, rows)
+
     def is_offensive(self, scores: Dict[str, Optional[float]]) -> bool:
         return self._canary_ok(scores)
 
@@ -150,25 +244,19 @@ class AnnualizedReturnScoreMixin:
     대상: FAA, EAA
     """
 
-    def score_from_returns(self, returns: Dict[str, Optional[float]]) -> Optional[float]:
-        """1·3·6·12개월 연율화 수익률 단순 평균."""
-        annualized = [
-            v * mult
-            for key, mult in [("r1m", 12), ("r3m", 4), ("r6m", 2), ("r12m", 1)]
-            if (v := returns.get(key)) is not None
-        ]
-        return sum(annualized) / len(annualized) if annualized else None
+    # 1·3·6·12개월 연율화 수익률 단순 평균 (있는 기간만)
+    SCORE_FORMULA: ClassVar[str] = "annualized_return"
 
-    @staticmethod
     def _load_group_prices(
+        self,
         groups: List[str],
-        histories: Dict[str, List[float]],
+        histories: Dict[str, Sequence[float]],
         min_len: int = 20,
-    ) -> Dict[str, List[float]]:
+    ) -> Dict[str, Sequence[float]]:
         """그룹 목록에서 유효한 가격 시계열을 로딩한다."""
-        result: Dict[str, List[float]] = {}
+        result: Dict[str, Sequence[float]] = {}
         for group in groups:
-            for ticker in group_tickers(group):
+            for ticker in self.universe.group_tickers(group):
                 if ticker in histories and len(histories[ticker]) > min_len:
                     result[group] = histories[ticker]
                     break
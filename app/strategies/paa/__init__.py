@@ -1,6 +1,5 @@
 from typing import ClassVar, Dict, List, Optional
 
-from app.assets.assets import asset_groups
 from app.strategy import BaseStrategy
 from app.strategies import register
 from app.assets.ticker import Ticker
@@ -28,8 +27,8 @@ class PAAStrategy(BaseStrategy):
     }
 
     def get_universe(self) -> List[str]:
-        offensive = asset_groups("offensive")
-        defensive = asset_groups("defensive")
+        offensive = self.universe.asset_groups("offensive")
+        defensive = self.universe.asset_groups("defensive")
         return sorted(set(offensive + defensive))
 
     def select_targets(
@@ -37,8 +36,8 @@ class PAAStrategy(BaseStrategy):
         scores: Dict[str, Optional[float]],
         histories: Dict[str, List[float]] | None = None,
     ) -> Dict[str, float]:
-        offensive_assets = asset_groups("offensive")
-        defensive_assets = asset_groups("defensive")
+        offensive_assets = self.universe.asset_groups("offensive")
+        defensive_assets = self.universe.asset_groups("defensive")
 
         # 모멘텀 양수인 공격자산 개수
         positive_count = sum(
@@ -79,7 +78,7 @@ class PAAStrategy(BaseStrategy):
 
     def is_offensive(self, scores: Dict[str, Optional[float]]) -> bool:
         """n >= 6이면 오펜시브 모드."""
-        offensive_assets = asset_groups("offensive")
+        offensive_assets = self.universe.asset_groups("offensive")
         positive_count = sum(
             1 for t in offensive_assets
             if scores.get(t) is not None and scores[t] >= 0
@@ -1,27 +1,86 @@
 from abc import ABC, abstractmethod
-from typing import ClassVar, Dict, List, Optional
+from array import array
+from typing import TYPE_CHECKING, ClassVar, Dict, List, Optional, Sequence
+
+from app.indicators.score import score_returns
+
+if TYPE_CHECKING:
+    from app.analytics.signal_panel import SignalPanel
+    from app.assets.assets import AssetUniverse
+
+
+class TargetMatrix:
+    """select_targets_batch 결과: 리밸런싱일 × 그룹 목표 비중 행렬.
+
+    groups: 컬럼(그룹) 순서
+    rows:   리밸런싱일별 비중 array('d') — None은 데이터 부족(이전 targets 유지)
+    """
+
+    def __init__(self, groups: Sequence[str], rows: List[Optional[array]]):
+        self.groups = tuple(groups)
+        self.rows = rows
+
+    @classmethod
+    def from_targets(cls, targets_list: List[Optional[Dict[str, float]]]) -> "TargetMatrix":
+        """select_targets 결과 dict 목록 → 행렬 (컬럼은 처음 나타난 순서)."""
+        groups: Dict[str, int] = {}
+        for targets in targets_list:
+            for g in targets or ():
+                groups.setdefault(g, len(groups))
+        rows: List[Optional[array]] = []
+        for targets in targets_list:
+            if targets is None:
+                rows.append(None)
+                continue
+            row = array("d", [0.0]) * len(groups)
+            for g, w in targets.items():
+                row[groups[g]] = w
+            rows.append(row)
+        return cls(list(groups), rows)
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def targets(self, i: int) -> Optional[Dict[str, float]]:
+        """i번째 리밸런싱일의 {group: weight} (비중 0 제외). 데이터 부족이면 None."""
+        row = self.rows[i]
+        if row is None:
+            return None
+        return {g: w for g, w in zip(self.groups, row) if w}
 
 
 class BaseStrategy(ABC):
     """퀀트 전략의 추상 베이스 클래스."""
 
     ASSETS: ClassVar[Dict]
+    # 가격 히스토리만으로 select_targets 결과가 정해지는지 (백테스트 시그널 캐시 허용 여부)
+    SIGNAL_CACHEABLE: ClassVar[bool] = True
+    # 모멘텀 점수 공식 (app.indicators.score.SCORE_FORMULAS 키, ScoreMatrix.scores에도 사용)
+    SCORE_FORMULA: ClassVar[str] = "keller"
 
     @property
     def assets(self) -> Dict:
         """전략이 사용하는 자산 그룹 정의."""
         return self.__class__.ASSETS
 
+    @property
+    def universe(self) -> "AssetUniverse":
+        """ASSETS를 컴파일한 불변 AssetUniverse (전역 reload_assets 캐시와 무관)."""
+        universe = self.__dict__.get("_universe")
+        if universe is None:
+            from app.assets.assets import AssetUniverse
+            universe = self._universe = AssetUniverse.of(self.assets)
+        return universe
+
     def get_universe(self) -> List[str]:
         """전략에 필요한 전체 자산 그룹 목록을 반환한다.
 
         기본 구현: ASSETS의 모든 그룹을 합쳐 정렬하여 반환한다.
         커스텀 로직이 필요한 전략은 오버라이드한다.
         """
-        from app.assets.assets import asset_groups
         all_tickers: List[str] = []
         for asset_type in self.assets:
-            all_tickers += asset_groups(asset_type)
+            all_tickers += self.universe.asset_groups(asset_type)
         return sorted(set(all_tickers))
 
     @abstractmethod
@@ -34,21 +93,44 @@ class BaseStrategy(ABC):
 
         Args:
             scores: 그룹별 모멘텀 점수 (전략별 score_from_returns로 계산)
-            histories: 티커별 파싱된 가격 시계열 (SMA·변동성·상관관계 계산용)
+            histories: 티커별 파싱된 가격 시계열 (SMA·변동성·상관관계 계산용).
+                백테스트에서는 PricePanel.history의 읽기 전용 뷰가 전달되므로 수정하지 않는다.
         """
 
+    def select_targets_batch(
+        self,
+        panel: "SignalPanel",
+        rebalance_idx: Sequence[int],
+    ) -> TargetMatrix:
+        """여러 리밸런싱일(panel 행 인덱스)의 목표 비중을 한 번에 계산한다 (백테스트용).
+
+        기본 구현은 행마다 select_targets를 호출하고, RuntimeError인 행은 None으로 둔다.
+        시그널을 벡터로 계산할 수 있는 전략(Mixin)은 오버라이드한다.
+        """
+        results: List[Optional[Dict[str, float]]] = []
+        for row in rebalance_idx:
+            try:
+                results.append(
+                    self.select_targets(panel.scores_at(row), histories=panel.histories_at(row))
+                )
+            except RuntimeError:
+                results.append(None)
+        return TargetMatrix.from_targets(results)
+
+    def static_targets(self) -> Optional[Dict[str, float]]:
+        """점수·히스토리와 무관하게 항상 같은 목표 비중이면 그 {group: weight}, 아니면 None.
+
+        값을 반환하는 전략은 백테스트에서 시그널 계산 없이 고정 비중 NAV 경로를 탄다.
+        """
+        return None
+
     def score_from_returns(self, returns: Dict[str, Optional[float]]) -> Optional[float]:
         """raw returns → 모멘텀 점수 변환. 기본은 Keller 복합 공식.
 
-        전략별로 오버라이드하여 고유 공식을 사용할 수 있다.
+        SCORE_FORMULA로 등록된 공식을 고르고, 등록 공식으로 표현할 수 없는
+        전략만 오버라이드한다.
         """
-        r1 = returns.get("r1m")
-        r3 = returns.get("r3m")
-        r6 = returns.get("r6m")
-        r12 = returns.get("r12m")
-        if None in (r1, r3, r6, r12):
-            return None
-        return (r1 * 12) + (r3 * 4) + (r6 * 2) + r12
+        return score_returns(returns, self.SCORE_FORMULA)
 
     def is_offensive(self, scores: Dict[str, Optional[float]]) -> bool:
         """offensive_mode 기준용: 현재 공격자산에 투자 중인지 여부.
@@ -56,9 +138,8 @@ class BaseStrategy(ABC):
         기본 구현은 select_targets() 결과가 offensive 그룹에 속하는지 확인.
         정적 전략(Permanent, All Weather)은 True를 반환하도록 오버라이드.
         """
-        from app.assets.assets import asset_groups
         targets = self.select_targets(scores)
-        offensive = set(asset_groups("offensive"))
+        offensive = set(self.universe.asset_groups("offensive"))
         return any(t in offensive for t in targets)
 
     @staticmethod
@@ -81,20 +162,19 @@ class BaseStrategy(ABC):
         )
         return ranked[:n] if n is not None else ranked
 
-    @staticmethod
     def _load_group_prices(
+        self,
         groups: List[str],
-        histories: Dict[str, List[float]],
+        histories: Dict[str, Sequence[float]],
         min_len: int = 20,
-    ) -> Dict[str, List[float]]:
+    ) -> Dict[str, Sequence[float]]:
         """그룹 목록에서 유효한 가격 시계열을 로딩한다.
 
         각 그룹의 티커 중 histories에 존재하고 min_len 이상인 첫 번째를 사용한다.
         """
-        from app.assets.assets import group_tickers
-        result: Dict[str, List[float]] = {}
+        result: Dict[str, Sequence[float]] = {}
         for group in groups:
-            for ticker in group_tickers(group):
+            for ticker in self.universe.group_tickers(group):
                 if ticker in histories and len(histories[ticker]) > min_len:
                     result[group] = histories[ticker]
                     break
@@ -15,26 +15,18 @@ criteria 종류:
 import math
 from typing import Dict, List, Optional, Tuple
 
+from app.analytics.nav_frame import StrategyNavFrame
 from app.constants import LOOKBACK_DAYS
+from app.indicators.correlation import correlation_matrix, window_correlation as _corr
 from app.strategy import BaseStrategy
 
 
-def _compute_nav_momentum(nav_series: List[Dict]) -> Tuple[Optional[float], float]:
+def _compute_nav_momentum(prices: List[float]) -> Tuple[Optional[float], float]:
     """NAV 시계열에서 모멘텀 점수와 현재 낙폭(drawdown)을 계산한다.
 
-    nav_series: [{"date": ..., "nav": "1.234"}, ...] 날짜 오름차순
+    prices: NAV 값 리스트 (날짜 오름차순)
     반환: (momentum_score, current_drawdown)
     """
-    if not nav_series:
-        return None, 0.0
-
-    prices = []
-    for row in nav_series:
-        try:
-            prices.append(float(row["nav"]))
-        except (KeyError, ValueError, TypeError):
-            continue
-
     if len(prices) < 2:
         return None, 0.0
 
@@ -182,23 +174,22 @@ def _select_by_nav_score(
     cfg: Optional[Dict] = None,
 ) -> List[Tuple[str, float]]:
     """strategy_nav.csv NAV 데이터 기반 다양한 기준으로 전략 선택."""
-    from app.analytics.csv_logger import load_strategy_nav
+    from app.analytics.csv_logger import load_strategy_nav_frame
 
-    all_nav = load_strategy_nav()
+    all_nav = load_strategy_nav_frame()
     scored: List[Tuple[str, float, float]] = []  # (name, score, drawdown)
 
     for entry in strategy_entries:
         name = entry["name"]
-        nav_series = all_nav.get(name, [])
-        if not nav_series:
+        if name not in all_nav:
             print(f"  ⚠️  {name}: NAV 데이터 없음")
             continue
 
-        prices = [float(row["nav"]) for row in nav_series if row.get("nav")]
-        rets = [float(row["daily_return"]) for row in nav_series if row.get("daily_return")]
+        prices = all_nav.values(name, "nav")
+        rets = all_nav.values(name, "daily_return")
 
         if criteria == "strategy_momentum":
-            score, _ = _compute_nav_momentum(nav_series)  # score만 사용, drawdown은 롤링으로 재계산
+            score, _ = _compute_nav_momentum(prices)  # score만 사용, drawdown은 롤링으로 재계산
         else:
             if criteria == "corr_constrained":
                 score = _compute_nav_score(prices, rets, "sharpe_12m")
@@ -249,25 +240,20 @@ def _select_by_nav_score(
 
 def _apply_corr_filter(
     ranked: List[Tuple[str, float]],
-    all_nav: Dict,
+    all_nav: StrategyNavFrame,
     top_n: Optional[int],
     corr_threshold: float = 0.7,
     window: int = 63,
 ) -> List[Tuple[str, float]]:
     """상관관계 필터: 이미 선택된 전략과 corr_threshold 이상인 전략 제외."""
-    rets_map = {
-        name: [float(row["daily_return"]) for row in series if row.get("daily_return")]
-        for name, series in all_nav.items()
-    }
+    rets_map = {name: all_nav.values(name, "daily_return") for name, _ in ranked}
+    corr = correlation_matrix(rets_map, window)
     selected: List[Tuple[str, float]] = []
     for name, score in ranked:
         if not selected:
             selected.append((name, score))
             continue
-        max_corr = max(
-            _corr(rets_map.get(name, []), rets_map.get(s, []), window) or 0.0
-            for s, _ in selected
-        )
+        max_corr = max(corr.get(name, s) or 0.0 for s, _ in selected)
         if max_corr < corr_threshold:
             selected.append((name, score))
         if top_n is not None and len(selected) >= top_n:
@@ -277,20 +263,6 @@ def _apply_corr_filter(
     return selected
 
 
-def _corr(a: List[float], b: List[float], window: int = 63) -> Optional[float]:
-    if len(a) < window or len(b) < window:
-        return None
-    a, b = a[-window:], b[-window:]
-    mean_a = sum(a) / window
-    mean_b = sum(b) / window
-    cov = sum((a[i] - mean_a) * (b[i] - mean_b) for i in range(window)) / (window - 1)
-    std_a = math.sqrt(sum((x - mean_a) ** 2 for x in a) / (window - 1))
-    std_b = math.sqrt(sum((x - mean_b) ** 2 for x in b) / (window - 1))
-    if std_a < 1e-10 or std_b < 1e-10:
-        return None
-    return cov / (std_a * std_b)
-
-
 def _compute_nav_score(
     prices: List[float],
     rets: List[float],
@@ -341,9 +313,9 @@ def _select_by_offensive_mode(
     mdd_threshold_ratio: Optional[float] = None,
 ) -> List[Tuple[str, float]]:
     """현재 전략 신호(offensive/defensive)로 active 전략 선택."""
-    from app.analytics.csv_logger import load_strategy_nav
+    from app.analytics.csv_logger import load_strategy_nav_frame
 
-    all_nav = load_strategy_nav() if mdd_threshold is not None else {}
+    all_nav = load_strategy_nav_frame() if mdd_threshold is not None else None
 
     result: List[Tuple[str, float]] = []
 
@@ -354,9 +326,6 @@ def _select_by_offensive_mode(
             continue
 
         scores = scores_by_strategy.get(name, {})
-        # 전략별 assets 캐시를 복원 후 판단
-        from app.assets.assets import reload_assets
-        reload_assets(strategy.assets)
         offensive = strategy.is_offensive(scores)
 
         if not offensive:
@@ -365,8 +334,7 @@ def _select_by_offensive_mode(
 
         # MDD 필터 (데이터 있을 때만)
         if mdd_threshold is not None:
-            nav_series = all_nav.get(name, [])
-            prices_dd = [float(row["nav"]) for row in nav_series if row.get("nav")]
+            prices_dd = all_nav.values(name, "nav")
             drawdown = _rolling_drawdown(prices_dd)
             effective_threshold = _effective_mdd_threshold(prices_dd, mdd_threshold, mdd_threshold_ratio)
             if drawdown < effective_threshold:
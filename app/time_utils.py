@@ -1,4 +1,5 @@
 from datetime import datetime
+from typing import Optional
 
 try:
     from zoneinfo import ZoneInfo
@@ -13,3 +14,17 @@ def trading_date_label() -> str:
     if ZoneInfo is None:
         return datetime.now().strftime("%Y-%m-%d")
     return datetime.now(ZoneInfo(US_MARKET_TZ)).strftime("%Y-%m-%d")
+
+
+def date_to_int(date: str) -> Optional[int]:
+    """YYYY-MM-DD 또는 YYYYMMDD 문자열을 YYYYMMDD 정수로 변환한다. 형식이 다르면 None."""
+    s = str(date).strip().replace("-", "")
+    if len(s) == 8 and s.isdigit():
+        return int(s)
+    return None
+
+
+def int_to_date(value: int) -> str:
+    """YYYYMMDD 정수를 YYYY-MM-DD 문자열로 변환한다."""
+    s = f"{value:08d}"
+    return f"{s[:4]}-{s[4:6]}-{s[6:]}"
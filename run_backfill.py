@@ -1,6 +1,8 @@
 """과거 NAV 일괄 생성 스크립트 (1회 실행).
 
 실행: python run_backfill.py
+      python run_backfill.py --nav-only --jobs 4   # NAV 시뮬레이션만, 4개 프로세스 병렬
+      python run_backfill.py --nav-only --incremental  # 저장된 NAV 이후 날짜만 연장
 
 동작:
 1. 전체 전략의 자산에 대해 과거 가격 데이터 수집 (KIS API, 최대 ~5년)
@@ -18,7 +20,7 @@ sys.path.insert(0, str(Path(__file__).resolve().parent))
 from app.assets.assets import merge_assets, reload_assets
 from app.analytics.backtest import run_all_backtests
 from app.config import build_kis_config, load_config, load_key, load_strategy_entries
-from app.analytics.csv_logger import save_ohlc_history
+from app.analytics.csv_logger import save_ohlc_history_bulk
 from app.execution.exchange import set_exchange_for_ticker
 from app.assets.assets import group_tickers
 from app.data.kis_api import KoreaInvestmentAPI
@@ -60,8 +62,8 @@ def collect_price_history_yfinance(strategy_entries: list) -> None:
 
     ticker_data = fetch_all_tickers(sorted_tickers, period="max")
 
-    for ticker, rows in ticker_data.items():
-        save_ohlc_history(ticker, rows)
+    added = save_ohlc_history_bulk(ticker_data)
+    print(f"💾 ohlc_history.csv 병합 완료: 신규 {added}행")
 
 
 def collect_price_history_kis(api: KoreaInvestmentAPI, strategy_entries: list) -> None:
@@ -75,19 +77,23 @@ def collect_price_history_kis(api: KoreaInvestmentAPI, strategy_entries: list) -
     print(f"\n📋 수집할 티커: {len(sorted_tickers)}개")
     print(", ".join(sorted_tickers))
 
+    ticker_data = {}
     for i, ticker in enumerate(sorted_tickers, 1):
         print(f"\n[{i}/{len(sorted_tickers)}] {ticker} 가격 히스토리 수집 중...")
         try:
             set_exchange_for_ticker(api, ticker)
             history = api.get_historical_data(ticker, period="D", min_records=5040, max_pages=52)
             if history:
-                save_ohlc_history(ticker, history)
-                print(f"  ✅ {len(history)}개 데이터 저장")
+                ticker_data[ticker] = history
+                print(f"  ✅ {len(history)}개 데이터 수집")
             else:
                 print(f"  ⚠️  데이터 없음")
         except Exception as e:
             print(f"  ❌ 실패: {e}")
 
+    added = save_ohlc_history_bulk(ticker_data)
+    print(f"\n💾 ohlc_history.csv 병합 완료: 신규 {added}행")
+
 
 def main() -> None:
     parser = argparse.ArgumentParser(description="classicQuant 백필")
@@ -102,6 +108,22 @@ def main() -> None:
         action="store_true",
         help="가격 수집 없이 NAV 시뮬레이션만 실행",
     )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="저장된 NAV 마지막 날짜 이후만 시뮬레이션하여 연장 (누락일 보충)",
+    )
+    parser.add_argument(
+        "--no-signal-cache",
+        action="store_true",
+        help="data/signal_cache/의 리밸런싱 시그널 캐시를 쓰지 않고 전부 다시 계산",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="NAV 시뮬레이션 병렬 프로세스 수 (기본: 1 = 순차 실행)",
+    )
     args = parser.parse_args()
 
     base_dir = Path(__file__).resolve().parent
@@ -127,15 +149,17 @@ def main() -> None:
 
     # Step 2: 전략 NAV 시뮬레이션
     print("\n[Step 2] 전략 NAV 시뮬레이션 (20년 기준)")
-    run_all_backtests(strategy_entries, lookback_months=240)
+    run_all_backtests(
+        strategy_entries, lookback_months=240, jobs=args.jobs,
+        incremental=args.incremental, use_signal_cache=not args.no_signal_cache,
+    )
 
     # 백테스트 완료 후 벤치마크 NAV 생성
     try:
-        from app.analytics.benchmark import build_benchmark_nav, save_benchmark_nav
-        from app.analytics.csv_logger import load_ohlc_history
-        ohlc = load_ohlc_history()
-        if ohlc:
-            bm_rows = build_benchmark_nav(ohlc)
+        from app.analytics.benchmark import BENCHMARK_TICKERS, build_benchmark_nav, save_benchmark_nav
+        from app.analytics.csv_logger import iter_ohlc_history
+        bm_rows = build_benchmark_nav(iter_ohlc_history(BENCHMARK_TICKERS))
+        if bm_rows:
             save_benchmark_nav(bm_rows)
             print(f"벤치마크 NAV 생성 완료: {len(bm_rows)}일")
     except Exception as e:
@@ -6,7 +6,7 @@
 1. 전체 9개 전략의 오늘 신호 계산 (잔고 조회 없음)
 2. data/strategy_signals.csv 에 오늘치 신호 기록
 3. data/momentum.csv 에 오늘치 모멘텀 점수 기록
-4. data/ohlc_history.csv 에 오늘 가격 추가
+4. data/ohlc_history.csv 에 오늘 가격 추가 (모든 전략 처리 후 티커당 1회)
 5. data/strategy_nav.csv 에 오늘치 NAV 추가 (gross + 비용 적용 net)
 
 매매 없음, 보고서 없음.
@@ -20,19 +20,19 @@ sys.path.insert(0, str(Path(__file__).resolve().parent))
 from app.assets.assets import reload_assets
 from app.config import build_kis_config, load_config, load_key, load_strategy_entries
 from app.analytics.csv_logger import (
+    load_latest_strategy_nav,
     load_ohlc_prices,
-    load_strategy_nav,
     load_strategy_signals,
     save_momentum,
-    save_ohlc_history,
+    save_ohlc_history_many,
     save_strategy_nav,
     save_strategy_signal,
 )
 from app.data.kis_api import KoreaInvestmentAPI
-from app.data.data_utils import parse_history
 from app.analytics.returns import compute_weighted_return
 from app.analytics.cost_model import apply_cost, ROUNDTRIP_COST_RATE, DEFAULT_MONTHLY_TURNOVER
 from app.analytics.audit_log import log_nav_update, log_signal_collect
+from app.analytics.momentum_panel import MomentumPanel
 from app.indicators.momentum import get_momentum_scores
 from app.strategies import get_strategy
 from app.time_utils import trading_date_label
@@ -77,23 +77,20 @@ def _calc_strategy_daily_return(
 
 def _get_prev_nav(strategy_name: str) -> float:
     """이전 NAV 값을 가져온다. 없으면 1.0."""
-    nav_data = load_strategy_nav(strategy_name)
-    series = nav_data.get(strategy_name, [])
-    if not series:
+    last = load_latest_strategy_nav(strategy_name)
+    if not last:
         return 1.0
     try:
-        return float(series[-1]["nav"])
+        return float(last["nav"])
     except (KeyError, ValueError, TypeError):
         return 1.0
 
 
 def _get_prev_net_nav(strategy_name: str) -> float:
     """이전 net NAV 값을 가져온다. 없으면 gross nav와 동일하게 시작."""
-    nav_data = load_strategy_nav(strategy_name)
-    series = nav_data.get(strategy_name, [])
-    if not series:
+    last = load_latest_strategy_nav(strategy_name)
+    if not last:
         return 1.0
-    last = series[-1]
     net_nav_str = last.get("net_nav", "")
     if net_nav_str:
         try:
@@ -125,6 +122,11 @@ def main() -> None:
     print(f"📊 classicQuant 일별 수집 | {today}")
     print("=" * 60)
 
+    # 전략 간 공유: 티커 히스토리 조회·기간 수익률 계산은 티커당 1회
+    momentum = MomentumPanel()
+    ohlc_histories: dict = {}
+    collected = []
+
     for entry in strategy_entries:
         name = entry["name"]
 
@@ -137,17 +139,18 @@ def main() -> None:
             reload_assets(strategy.assets)
 
             universe = strategy.get_universe()
-            _, all_returns, all_histories = get_momentum_scores(api, universe)
+            _, all_returns, all_histories = get_momentum_scores(
+                api, universe, momentum, strategy.SCORE_FORMULA
+            )
             scores = {group: strategy.score_from_returns(rets) for group, rets in all_returns.items()}
-            parsed_histories = {t: parse_history(h) for t, h in all_histories.items()}
+            parsed_histories = momentum.price_histories(all_histories)
             targets = strategy.select_targets(scores, histories=parsed_histories)
 
             # 모멘텀 기록
             save_momentum(today, name, scores, all_returns)
 
-            # OHLC 기록
-            for ticker, history in all_histories.items():
-                save_ohlc_history(ticker, history)
+            # OHLC는 모든 전략을 돈 뒤 티커당 1회 기록
+            ohlc_histories.update(all_histories)
 
             # 신호 기록
             mode = "offensive" if strategy.is_offensive(scores) else "defensive"
@@ -157,12 +160,24 @@ def main() -> None:
             )
             save_strategy_signal(today, name, mode, targets, top_score)
             log_signal_collect(name, today, mode, targets)
+            collected.append(name)
 
             print(f"  모드: {mode}")
             print(f"  선택 자산: {', '.join(f'{g}({w:.0%})' for g, w in targets.items())}")
 
+        except Exception as e:
+            print(f"  ❌ {name} 처리 실패: {e}")
+
+    # OHLC 기록 후 가격을 한 번만 읽어 모든 전략 NAV에 사용
+    save_ohlc_history_many(ohlc_histories)
+    price_dict = load_ohlc_prices() if collected else {}
+
+    print(f"\n{'─'*50}")
+    print("💹 NAV 업데이트")
+    print(f"{'─'*50}")
+    for name in collected:
+        try:
             # NAV 업데이트 (gross)
-            price_dict = load_ohlc_prices()
             daily_return = _calc_strategy_daily_return(name, today, price_dict)
             prev_nav = _get_prev_nav(name)
             new_nav = prev_nav * (1.0 + daily_return)
@@ -178,11 +193,14 @@ def main() -> None:
             save_strategy_nav(today, name, daily_return, new_nav, new_net_nav, net_daily_return)
             log_nav_update(name, today, new_nav, new_net_nav, daily_return)
 
-            print(f"  일별수익: {daily_return:.4%} | NAV(gross): {new_nav:.4f} | NAV(net): {new_net_nav:.4f}")
+            print(f"  {name} | 일별수익: {daily_return:.4%} | NAV(gross): {new_nav:.4f} | NAV(net): {new_net_nav:.4f}")
 
         except Exception as e:
-            print(f"  ❌ {name} 처리 실패: {e}")
+            print(f"  ❌ {name} NAV 업데이트 실패: {e}")
 
+    indicators = momentum.indicators
+    if indicators.hits:
+        print(f"\n🧮 지표 캐시: {indicators.hits}건 재사용, {indicators.misses}건 계산")
     print(f"\n✅ 수집 완료: {today}")
 
 
@@ -0,0 +1,57 @@
+"""data/ CSV 압축 스크립트.
+
+실행:
+    python run_compact.py            # 중복·대체된 행 제거 후 다시 쓰기 (행 순서 유지)
+    python run_compact.py --dry-run  # 회수 가능한 행/바이트만 출력
+
+동작:
+1. append 전용 CSV(strategy_nav, strategy_signals, portfolio_state 등)를 읽는다
+2. 같은 키는 파일 하단 기록 우선으로 1행만 남기고, 남은 행은 원래 순서를 유지한다
+3. 임시 파일 → rename으로 교체 (이미 정리된 파일은 건드리지 않음)
+
+load_* 결과는 바뀌지 않으므로 정기 워크플로우에서 커밋 전에 실행해도 안전하다.
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from app.analytics.csv_logger import compact_data_files
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="data/ CSV 중복 제거 (행 순서 유지)")
+    parser.add_argument("--dry-run", action="store_true", help="파일을 쓰지 않고 결과만 출력")
+    args = parser.parse_args()
+
+    results = compact_data_files(dry_run=args.dry_run)
+    if not results:
+        print("압축할 데이터 파일 없음")
+        return
+
+    total_rows = 0
+    total_bytes = 0
+    for r in results:
+        if r.get("skipped"):
+            print(f"⚠️  {r['file']}: 건너뜀 ({r['skipped']})")
+            continue
+        rows = r["rows_before"] - r["rows_after"]
+        nbytes = r["bytes_before"] - r["bytes_after"]
+        total_rows += rows
+        total_bytes += nbytes
+        status = "정리됨" if r["rewritten"] else "변경 없음"
+        if args.dry_run and r["rewritten"]:
+            status = "정리 대상"
+        print(
+            f"  {r['file']:<28} {r['rows_before']:>8}행 → {r['rows_after']:>8}행"
+            f" (-{rows}행, {nbytes:,}B) {status}"
+        )
+
+    label = "회수 가능" if args.dry_run else "회수"
+    print(f"\n✅ 총 {total_rows}행, {total_bytes:,}B {label}")
+
+
+if __name__ == "__main__":
+    main()
@@ -20,7 +20,7 @@ from app.analytics.csv_logger import (
     load_portfolio_state,
     save_holdings,
     save_momentum,
-    save_ohlc_history,
+    save_ohlc_history_many,
     save_portfolio,
     save_portfolio_nav_actual,
     save_portfolio_state,
@@ -48,7 +48,7 @@ from app.constants import (
 )
 from app.data.kis_api import KoreaInvestmentAPI
 from app.execution.market import is_us_market_holiday
-from app.data.data_utils import parse_history
+from app.analytics.momentum_panel import MomentumPanel
 from app.indicators.momentum import get_momentum_scores
 from app.assets.assets import group_tickers
 from app.execution.portfolio import build_group_orders, execute_orders, get_holdings_all_exchanges, get_prices
@@ -102,7 +102,7 @@ def _build_cached_report_api() -> CachedMarketDataAPI:
     return CachedMarketDataAPI(price_history)
 
 
-def _run_strategy(strategy_entry, api, prices, today):
+def _run_strategy(strategy_entry, api, prices, today, momentum=None):
     """단일 전략을 실행하여 (weighted_targets, scores, targets, strategy_instance)를 반환한다."""
     name = strategy_entry["name"]
     weight = strategy_entry["weight"]
@@ -116,16 +116,19 @@ def _run_strategy(strategy_entry, api, prices, today):
     print(f"📊 전략: {name} (비중: {weight * 100:.0f}%)")
     print(f"{'='*50}")
 
+    if momentum is None:
+        momentum = MomentumPanel()
     universe = strategy.get_universe()
-    _, all_returns, all_histories = get_momentum_scores(api, universe)
+    _, all_returns, all_histories = get_momentum_scores(
+        api, universe, momentum, strategy.SCORE_FORMULA
+    )
     scores = {group: strategy.score_from_returns(rets) for group, rets in all_returns.items()}
-    parsed_histories = {t: parse_history(h) for t, h in all_histories.items()}
+    parsed_histories = momentum.price_histories(all_histories)
     targets = strategy.select_targets(scores, histories=parsed_histories)
 
     # CSV 로깅: 모멘텀 스코어 & OHLC 히스토리
     save_momentum(today, name, scores, all_returns)
-    for ticker, history in all_histories.items():
-        save_ohlc_history(ticker, history)
+    save_ohlc_history_many(all_histories)
 
     print("\n✅ 목표 포트폴리오")
     for ticker, w in targets.items():
@@ -320,17 +323,22 @@ def main() -> None:
     # Phase 1: 전략별 신호 수집 (전체 전략)
     all_results: dict = {}   # name → (weighted_targets, scores, targets, strategy)
     asset_files = []
+    momentum = MomentumPanel()  # 전략 간 티커 히스토리·수익률 공유
 
     for entry in strategy_entries:
         try:
             weighted_targets, scores, targets, strategy = _run_strategy(
-                entry, api, prices, today,
+                entry, api, prices, today, momentum,
             )
             all_results[entry["name"]] = (weighted_targets, scores, targets, strategy)
             asset_files.append(strategy.assets)
         except Exception as e:
             print(f"❌ {entry['name']} 전략 실패: {e}")
 
+    indicators = momentum.indicators
+    if indicators.hits:
+        print(f"\n🧮 지표 캐시: {indicators.hits}건 재사용, {indicators.misses}건 계산")
+
     # Phase 2: 전략 선택 (selection 기준 적용)
     print(f"\n{'='*50}")
     print(f"🎯 전략 선택 (criteria: {selection_cfg.get('criteria')})")
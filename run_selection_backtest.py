@@ -25,8 +25,9 @@ from typing import Dict, List, Optional, Tuple
 
 sys.path.insert(0, str(Path(__file__).resolve().parent))
 
+from app.indicators.correlation import correlation_matrix
+
 DATA_DIR = Path(__file__).resolve().parent / "data"
-NAV_CSV = DATA_DIR / "strategy_nav.csv"
 
 LOOKBACK = {"1m": 21, "3m": 63, "6m": 126, "12m": 252}
 
@@ -49,22 +50,15 @@ CORR_THRESHOLD = 0.7  # 상관관계 필터 임계값 (corr_constrained 기준)
 # ── 데이터 로딩 ────────────────────────────────────────────────────────────────
 
 def load_nav_data() -> Dict[str, List[Tuple[str, float, float]]]:
-    """strategy_nav.csv → {strategy: [(date, daily_return, nav), ...]} 오름차순."""
-    if not NAV_CSV.exists():
-        return {}
-    data: Dict[str, List] = defaultdict(list)
-    with open(NAV_CSV, encoding="utf-8") as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            try:
-                data[row["strategy"]].append((
-                    row["date"].strip(),
-                    float(row["daily_return"]),
-                    float(row["nav"]),
-                ))
-            except (KeyError, ValueError):
-                continue
-    return {k: sorted(v, key=lambda x: x[0]) for k, v in data.items()}
+    """strategy_nav.csv → {strategy: [(date, daily_return, nav), ...]} 오름차순.
+
+    csv_logger의 StrategyNavFrame(캐시된 float 컬럼)에서 튜플을 만든다.
+    """
+    from app.analytics.csv_logger import load_strategy_nav_frame
+
+    frame = load_strategy_nav_frame()
+    data = {name: list(frame.records(name)) for name in frame.strategies}
+    return {name: rows for name, rows in data.items() if rows}
 
 
 # ── 날짜 유틸 ──────────────────────────────────────────────────────────────────
@@ -180,22 +174,6 @@ def current_drawdown(series, date: str) -> float:
     return (past_navs[-1] / peak - 1.0) if peak > 0 else 0.0
 
 
-def _compute_corr(ret_a: List[float], ret_b: List[float], window: int = 63) -> Optional[float]:
-    """두 수익률 시계열의 피어슨 상관관계 (최근 window일)."""
-    if len(ret_a) < window or len(ret_b) < window:
-        return None
-    a = ret_a[-window:]
-    b = ret_b[-window:]
-    mean_a = sum(a) / window
-    mean_b = sum(b) / window
-    cov = sum((a[i] - mean_a) * (b[i] - mean_b) for i in range(window)) / (window - 1)
-    std_a = math.sqrt(sum((x - mean_a) ** 2 for x in a) / (window - 1))
-    std_b = math.sqrt(sum((x - mean_b) ** 2 for x in b) / (window - 1))
-    if std_a < 1e-10 or std_b < 1e-10:
-        return None
-    return cov / (std_a * std_b)
-
-
 def _select_strategies_at_date(
     nav_data: Dict[str, List[Tuple[str, float, float]]],
     date: str,
@@ -237,15 +215,13 @@ def _select_strategies_at_date(
             name: [r for d, r, _ in nav_data[name] if d <= date]
             for name in scores
         }
+        corr = correlation_matrix(ret_map, corr_window, end_date=date)
         selected = []
         for name, _ in ranked:
             if not selected:
                 selected.append(name)
                 continue
-            max_corr = max(
-                (_compute_corr(ret_map[name], ret_map[s], corr_window) or 0.0)
-                for s in selected
-            )
+            max_corr = max(corr.get(name, s) or 0.0 for s in selected)
             if max_corr < corr_threshold:
                 selected.append(name)
             if len(selected) >= top_n:
@@ -747,6 +723,7 @@ def print_duplication_analysis(
         for name in names
     }
 
+    matrix = correlation_matrix(rets_map, 63, end_date=cutoff)
     pair_corrs: List[Tuple[str, str, float]] = []
     avg_corrs: List[Tuple[str, float]] = []
     for name in names:
@@ -754,7 +731,7 @@ def print_duplication_analysis(
         for other in names:
             if other == name:
                 continue
-            corr = _compute_corr(rets_map.get(name, []), rets_map.get(other, []), 63)
+            corr = matrix.get(name, other)
             if corr is not None:
                 corrs.append(corr)
                 if name < other:
@@ -1345,7 +1322,7 @@ def main() -> None:
             CGT_EXEMPTION_KRW,
             DEFAULT_MONTHLY_TURNOVER,
         )
-        from app.analytics.csv_logger import load_strategy_nav
+        from app.analytics.csv_logger import load_strategy_nav_frame
         from app.config import build_cost_config
 
         config_path = Path(__file__).resolve().parent / "config.json"
@@ -1367,18 +1344,18 @@ def main() -> None:
         print(f"  양도세  : {cgt_rate*100:.0f}% (연간 공제 {exemption:,}원, {'적용' if apply_cgt else '미적용'})")
         print(f"  포트폴리오: {pf_krw:,}원  |  월 회전율 추정: {DEFAULT_MONTHLY_TURNOVER*100:.0f}%")
 
-        nav_data_full = load_strategy_nav()
-        if not nav_data_full:
+        nav_frame = load_strategy_nav_frame()
+        if not nav_frame:
             print("❌ strategy_nav.csv 데이터 없음")
         else:
             gross_rows = []
-            for strategy, rows in nav_data_full.items():
-                for row in rows:
+            for strategy in nav_frame.strategies:
+                for date, daily_return, nav in nav_frame.records(strategy):
                     gross_rows.append({
-                        "date": row["date"],
+                        "date": date,
                         "strategy": strategy,
-                        "nav": row.get("nav", "1.0"),
-                        "daily_return": row.get("daily_return", "0.0"),
+                        "nav": nav,
+                        "daily_return": daily_return,
                     })
 
             net_rows = compute_kis_net_nav(
@@ -1397,9 +1374,10 @@ def main() -> None:
             gross_by_strategy: Dict[str, float] = {}
             for row in net_rows:
                 final_by_strategy[row["strategy"]] = row
-            for strategy, rows in nav_data_full.items():
-                if rows:
-                    gross_by_strategy[strategy] = float(rows[-1].get("nav", 1.0))
+            for strategy in nav_frame.strategies:
+                last = nav_frame.last(strategy, "nav")
+                if last is not None:
+                    gross_by_strategy[strategy] = last[1]
 
             header = f"{'전략':<16} {'Gross':>8} {'Net':>8} {'수수료':>8} {'환전':>6} {'양도세':>8} {'총드래그':>8}"
             print(f"\n{header}")
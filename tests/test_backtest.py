@@ -0,0 +1,364 @@
+"""백테스트 엔진 회귀 테스트.
+
+합성 가격으로 PricePanel과 run_backtest의 의미(당일 종가 제외, 결측 처리,
+월말 리밸런싱, 그룹 수익률)를 검증한다. 외부 API는 사용하지 않는다.
+"""
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+from app.analytics.backtest import run_backtest
+from app.analytics.nav_frame import StrategyNavFrame
+from app.analytics.price_panel import PricePanel
+from app.analytics.signal_cache import SignalCache
+from app.strategies import get_strategy
+
+
+def _business_days(n, start_month=1):
+    """2020-01-01부터 월 20영업일 가정의 날짜 레이블 n개."""
+    return [f"2020-{start_month + i // 20:02d}-{1 + i % 20:02d}" for i in range(n)]
+
+
+# ── PricePanel ───────────────────────────────────────────────────────────────
+
+def test_price_panel_history_excludes_cutoff_and_gaps():
+    """history(t, row): row 이전 관측값만, 결측 행은 건너뛴다."""
+    panel = PricePanel.from_price_dict({
+        "SPY": {"2020-01-01": 100.0, "2020-01-02": 101.0, "2020-01-04": 103.0},
+        "AGG": {"2020-01-03": 50.0, "2020-01-04": 51.0},
+    })
+
+    assert panel.dates == ["2020-01-01", "2020-01-02", "2020-01-03", "2020-01-04"]
+    assert list(panel.history("SPY", 3)) == [100.0, 101.0]
+    assert list(panel.history("SPY", 4, window=2)) == [101.0, 103.0]
+    assert panel.count_before("AGG", 3) == 1
+    rets = panel.returns("AGG")
+    assert rets[3] == pytest.approx(0.02)
+    assert rets[2] != rets[2]  # 전일 결측 → NaN
+
+
+def test_price_panel_history_is_shared_readonly_view():
+    """history는 관측값 배열을 공유하는 읽기 전용 뷰이며 slice도 복사하지 않는다."""
+    panel = PricePanel.from_price_dict({
+        "SPY": {f"2020-01-{d:02d}": 100.0 + d for d in range(1, 11)},
+    })
+    full = panel.history("SPY", len(panel))
+    recent = panel.history("SPY", 8)[-3:]
+
+    assert list(recent) == [106.0, 107.0, 108.0]
+    assert recent.obj is full.obj
+    assert sum(recent) / len(recent) == pytest.approx(107.0)
+    with pytest.raises(TypeError):
+        recent[0] = 0.0
+
+
+def test_momentum_panel_matches_compute_momentum():
+    """MomentumPanel.at_row: row 이전 관측 종가로 compute_momentum한 수익률과 동일."""
+    from app.analytics.momentum_panel import MomentumPanel
+    from app.indicators.momentum import compute_momentum
+
+    dates = _business_days(300)
+    spy = {d: 100.0 + i * 0.5 + (i % 7) for i, d in enumerate(dates) if i % 11 != 5}
+    spy[dates[40]] = 0.0  # 과거 가격 0 → 해당 기간 수익률 None
+    panel = PricePanel.from_price_dict({"SPY": spy})
+    momentum = MomentumPanel(panel)
+
+    saw_zero_past = False
+    for row in range(len(panel) + 1):
+        _, expected = compute_momentum(list(panel.history("SPY", row)))
+        assert momentum.at_row("SPY", row) == expected
+        saw_zero_past |= expected["r1m"] is None and row > 30
+    assert saw_zero_past
+    assert momentum.latest("SPY") == compute_momentum(list(panel.history("SPY", len(panel))))[1]
+
+
+# ── run_backtest ─────────────────────────────────────────────────────────────
+
+def test_run_backtest_resume_extends_only_new_dates():
+    """resume=(마지막 날짜, nav): 전체 재계산 결과의 꼬리와 동일한 행만 반환."""
+    dates = _business_days(100)
+    growth = {"SPY": 0.004, "TLT": -0.002, "GLD": 0.003, "BIL": 0.001}
+    price_dict = {
+        ticker: {d: 100.0 * (1 + g) ** i * (1 + 0.01 * (i % 3)) for i, d in enumerate(dates)}
+        for ticker, g in growth.items()
+    }
+    strategy = get_strategy("permanent")
+    full = run_backtest("permanent", strategy, price_dict, lookback_months=240)
+
+    stored = [row for row in full if row[0] <= dates[59]]
+    last_date, _, last_nav = stored[-1]
+    tail = run_backtest(
+        "permanent", strategy, price_dict, lookback_months=240, resume=(last_date, last_nav)
+    )
+
+    expected = full[len(stored):]
+    assert [row[0] for row in tail] == [row[0] for row in expected] == dates[60:]
+    assert [row[2] for row in tail] == pytest.approx([row[2] for row in expected])
+    assert run_backtest(
+        "permanent", strategy, price_dict, lookback_months=240, resume=(dates[-1], 1.0)
+    ) == []
+
+
+def test_run_backtest_fixed_weights_matches_manual_nav():
+    """permanent: 첫 월말 리밸런싱 이후 매일 25%씩 가중한 수익률로 NAV 누적."""
+    dates = _business_days(60)
+    growth = {"SPY": 0.01, "TLT": -0.005, "GLD": 0.002, "BIL": 0.001}
+    price_dict = {
+        ticker: {d: 100.0 * (1 + g) ** i for i, d in enumerate(dates)}
+        for ticker, g in growth.items()
+    }
+    del price_dict["GLD"][dates[30]]  # GLD 결측일 → 해당 그룹 0% 처리
+
+    nav_series = run_backtest("permanent", get_strategy("permanent"), price_dict)
+
+    # 첫 월말(20번째 날짜)부터 기록
+    assert nav_series[0][0] == dates[19]
+    expected_nav = 1.0
+    gld_missing = {dates[30], dates[31]}  # 당일 또는 전일 가격 없음
+    for date, daily_return, nav in nav_series:
+        expected = sum(
+            0.25 * g for t, g in growth.items() if not (t == "GLD" and date in gld_missing)
+        )
+        assert daily_return == pytest.approx(expected)
+        expected_nav *= 1 + expected
+        assert nav == pytest.approx(expected_nav)
+    assert len(nav_series) == len(dates) - 19
+
+
+def test_run_all_backtests_parallel_matches_sequential(monkeypatch, capsys, tmp_path):
+    """jobs=2: 워커가 기존 컬럼 저장소를 mmap — 결과를 1회 bulk 기록, 순차 실행과 동일."""
+    import app.analytics.backtest as backtest
+    import app.analytics.csv_logger as csv_logger
+    import app.analytics.signal_cache as signal_cache
+
+    monkeypatch.setattr(signal_cache, "SIGNAL_CACHE_DIR", tmp_path)
+
+    dates = _business_days(80)
+    growth = {"SPY": 0.01, "TLT": -0.005, "GLD": 0.002, "BIL": 0.001, "IEF": 0.003}
+    price_dict = {
+        ticker: {d: 100.0 * (1 + g) ** i for i, d in enumerate(dates)}
+        for ticker, g in growth.items()
+    }
+    ohlc_csv = tmp_path / "ohlc_history.csv"
+    ohlc_csv.write_text(
+        "ticker,date,close\n" + "".join(
+            f"{ticker},{d},{price!r}\n" for ticker, series in price_dict.items()
+            for d, price in series.items()
+        ),
+        encoding="utf-8",
+    )
+    monkeypatch.setattr(csv_logger, "OHLC_CSV", ohlc_csv)  # mmap 컬럼 저장소 경로로 로드
+    monkeypatch.setattr(
+        csv_logger, "load_strategy_nav_frame", lambda: StrategyNavFrame.from_rows([])
+    )
+
+    def _collect(jobs):
+        writes = []
+        monkeypatch.setattr(
+            backtest, "save_strategy_nav_many", lambda rows: writes.append(list(rows)) or 0
+        )
+        backtest.run_all_backtests(
+            [{"name": "permanent"}, {"name": "golden_butterfly"}], lookback_months=12, jobs=jobs
+        )
+        return writes
+
+    sequential = _collect(1)
+
+    def _no_copy(self, directory):
+        raise AssertionError("워커는 기존 컬럼 저장소를 열어야 한다")
+
+    monkeypatch.setattr(PricePanel, "save", _no_copy)
+    parallel = _collect(2)
+    capsys.readouterr()
+
+    assert len(sequential) == 2
+    assert len(parallel) == 1  # 병렬 결과는 한 번에 기록
+    assert sorted(parallel[0]) == sorted(row for rows in sequential for row in rows)
+    assert parallel[0]
+
+
+def test_rebalance_schedules():
+    """weekly/quarterly: 기간별 마지막 거래일, 날짜 목록: 당일 또는 직전 거래일."""
+    from app.analytics.backtest import _get_rebalance_dates
+
+    dates = ["2024-01-02", "2024-01-05", "2024-01-08", "2024-03-28", "2024-04-01", "2024-06-28"]
+    assert _get_rebalance_dates(dates, "weekly") == [
+        "2024-01-05", "2024-01-08", "2024-03-28", "2024-04-01", "2024-06-28"
+    ]
+    assert _get_rebalance_dates(dates, "quarterly") == ["2024-03-28", "2024-06-28"]
+    assert _get_rebalance_dates(dates, "daily") == dates
+    custom = ["2024-01-01", "2024-01-06", "2024-01-07", "2024-04-01"]
+    assert _get_rebalance_dates(dates, custom) == ["2024-01-05", "2024-04-01"]
+    with pytest.raises(ValueError):
+        _get_rebalance_dates(dates, "hourly")
+
+
+def test_run_backtest_daily_schedule_rebalances_from_first_day():
+    """daily: 첫 거래일부터 리밸런싱 → 둘째 날부터 NAV 기록."""
+    dates = _business_days(30)
+    price_dict = {
+        t: {d: 100.0 * (1.001 + 0.001 * k) ** i for i, d in enumerate(dates)}
+        for k, t in enumerate(["SPY", "TLT", "GLD", "BIL"])
+    }
+    nav_series = run_backtest("permanent", get_strategy("permanent"), price_dict, schedule="daily")
+    assert [row[0] for row in nav_series] == dates[1:]
+
+
+# ── 시그널 캐시 ──────────────────────────────────────────────────────────────
+
+def test_signal_cache_reuses_past_month_ends_after_append(tmp_path):
+    """가격이 뒤에 추가되면 과거 월말은 캐시 적중, 새 월말만 select_targets 호출."""
+    dates = _business_days(100)
+    growth = {"SPY": 0.004, "TLT": -0.002, "GLD": 0.003, "BIL": 0.001}
+    full_prices = {
+        ticker: {d: 100.0 * (1 + g) ** i for i, d in enumerate(dates)}
+        for ticker, g in growth.items()
+    }
+    old_prices = {t: {d: p for d, p in s.items() if d <= dates[59]} for t, s in full_prices.items()}
+    strategy = get_strategy("permanent")
+    strategy.static_targets = lambda: None  # 고정 비중 경로 대신 시그널 경로 사용
+
+    def _run(price_dict):
+        cache = SignalCache.load("permanent", strategy, directory=tmp_path)
+        nav = run_backtest("permanent", strategy, price_dict, lookback_months=240, signal_cache=cache)
+        cache.save()
+        return cache, nav
+
+    first, _ = _run(old_prices)
+    assert (first.hits, first.misses) == (0, 3)
+
+    second, nav = _run(full_prices)
+    assert (second.hits, second.misses) == (3, 2)  # 1~3월 적중, 4~5월 계산
+    assert nav == run_backtest("permanent", strategy, full_prices, lookback_months=240)
+
+    # 과거 가격이 바뀌면 그 이후 월말 fingerprint 불일치 → 재계산
+    full_prices["SPY"][dates[25]] *= 1.01
+    third, _ = _run(full_prices)
+    assert (third.hits, third.misses) == (1, 4)
+
+
+@pytest.mark.parametrize(
+    "source", ["analytics/price_panel.py", "analytics/signal_panel.py", "assets/assets.py"]
+)
+def test_signal_cache_invalidated_by_shared_source_change(tmp_path, monkeypatch, source):
+    """패널·자산 해석 모듈이 바뀌면 캐시 전체를 버린다."""
+    import shutil
+
+    import app.analytics.signal_cache as signal_cache
+
+    app_dir = tmp_path / "app"
+    for name in signal_cache._SHARED_SOURCES:
+        src = signal_cache._APP_DIR / name
+        if src.is_dir():
+            shutil.copytree(src, app_dir / name, ignore=shutil.ignore_patterns("__pycache__"))
+        else:
+            (app_dir / name).parent.mkdir(parents=True, exist_ok=True)
+            shutil.copy(src, app_dir / name)
+    monkeypatch.setattr(signal_cache, "_APP_DIR", app_dir)
+
+    strategy = get_strategy("gem")
+    cache = SignalCache.load("gem", strategy, directory=tmp_path)
+    cache.put("2024-01-31", "fp", {"SPY": 1.0})
+    cache.save()
+    assert SignalCache.load("gem", strategy, directory=tmp_path).get("2024-01-31", "fp")[0]
+
+    with open(app_dir / source, "a", encoding="utf-8") as f:
+        f.write("\n# changed\n")
+    reloaded = SignalCache.load("gem", strategy, directory=tmp_path)
+    assert reloaded.get("2024-01-31", "fp") == (False, None)
+
+
+def test_static_weight_fast_path_matches_signal_path():
+    """static_targets 전략: 고정 비중 NAV 경로 == 리밸런싱일마다 targets를 고르는 일반 경로."""
+    dates = _business_days(200)
+    growth = {"SPY": 0.004, "TLT": -0.002, "GLD": 0.003, "BIL": 0.001, "IEF": 0.002}
+    price_dict = {
+        ticker: {d: 100.0 * (1 + g) ** i * (1 + 0.01 * (i % 4)) for i, d in enumerate(dates)}
+        for ticker, g in growth.items()
+    }
+    del price_dict["GLD"][dates[70]]
+    for t in ("SPY", "TLT", "GLD", "BIL"):
+        del price_dict[t][dates[90]]  # 전 티커 결측일 → 날짜 축에서 빠짐
+
+    for name in ("permanent", "golden_butterfly"):
+        fast = get_strategy(name)
+        slow = get_strategy(name)
+        slow.static_targets = lambda: None
+        for kwargs in (
+            {"lookback_months": 240},
+            {"lookback_months": 4},
+            {"lookback_months": 240, "schedule": "weekly"},
+            {"lookback_months": 240, "resume": (dates[120], 1.3)},
+        ):
+            expected = run_backtest(name, slow, price_dict, **kwargs)
+            assert expected
+            assert run_backtest(name, fast, price_dict, **kwargs) == expected
+
+
+# ── select_targets_batch ─────────────────────────────────────────────────────
+
+@pytest.mark.parametrize("name", ["vaa", "daa", "haa", "gtaa", "ivy", "permanent"])
+def test_native_select_targets_batch_matches_per_date_loop(name):
+    """Mixin의 벡터 select_targets_batch == 기본 구현(행마다 select_targets)."""
+    from app.analytics.signal_panel import SignalPanel
+    from app.analytics.backtest import _group_columns
+    from app.analytics.momentum_panel import MomentumPanel
+    from app.strategy import BaseStrategy
+
+    strategy = get_strategy(name)
+    universe = strategy.universe
+    tickers = sorted({t for g in strategy.get_universe() for t in universe.group_tickers(g)})
+    dates = _business_days(400)
+    price_dict = {
+        t: {
+            d: 100.0 * (1 + 0.0004 * (k % 5 - 2)) ** i * (1 + 0.05 * ((i // (37 + k)) % 3))
+            for i, d in enumerate(dates) if (i + k) % 13
+        }
+        for k, t in enumerate(tickers)
+    }
+    panel = PricePanel.from_price_dict(price_dict)
+    signals = SignalPanel(strategy, panel, MomentumPanel(panel), _group_columns(strategy, panel))
+    rows = list(range(20, len(panel), 20))
+
+    native = strategy.select_targets_batch(signals, rows)
+    looped = BaseStrategy.select_targets_batch(strategy, signals, rows)
+
+    assert len(native) == len(looped) == len(rows)
+    assert [native.targets(i) for i in range(len(rows))] == [
+        looped.targets(i) for i in range(len(rows))
+    ]
+
+
+@pytest.mark.parametrize("name", ["vaa", "gem", "paa"])
+def test_signal_panel_scores_from_score_matrix_match_scalar(name):
+    """SignalPanel 점수: 공유 ScoreMatrix 컬럼 == score_from_returns 스칼라 경로."""
+    from app.analytics.signal_panel import SignalPanel
+    from app.analytics.backtest import _group_columns
+    from app.analytics.momentum_panel import MomentumPanel
+
+    strategy = get_strategy(name)
+
+    class Scalar(type(strategy)):
+        def score_from_returns(self, returns):  # 오버라이드 → 행마다 스칼라 계산
+            return super().score_from_returns(returns)
+
+    dates = _business_days(400)
+    tickers = sorted({
+        t for g in strategy.get_universe() for t in strategy.universe.group_tickers(g)
+    })
+    price_dict = {
+        t: {d: 100.0 * (1 + 0.0005 * (k % 7 - 3)) ** i for i, d in enumerate(dates) if (i + k) % 9}
+        for k, t in enumerate(tickers)
+    }
+    panel = PricePanel.from_price_dict(price_dict)
+    groups = _group_columns(strategy, panel)
+    momentum = MomentumPanel(panel)
+    shared = SignalPanel(strategy, panel, momentum, groups)
+    scalar = SignalPanel(Scalar(), panel, MomentumPanel(panel), groups)
+
+    rows = range(250, len(panel))
+    assert [shared.scores_at(row) for row in rows] == [scalar.scores_at(row) for row in rows]
+    assert any(s is not None for s in shared.scores_at(len(panel) - 1).values())
+    assert momentum.score_matrix()._scores[strategy.SCORE_FORMULA]
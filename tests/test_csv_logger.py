@@ -0,0 +1,505 @@
+"""데이터 저장 계층 회귀 테스트.
+
+csv_logger의 경로 상수를 tmp_path로 바꿔 실제 data/ 디렉터리를 건드리지 않는다.
+"""
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+from app.analytics import csv_logger
+
+
+@pytest.fixture
+def data_dir(tmp_path, monkeypatch):
+    """csv_logger의 모든 CSV 경로를 tmp_path 아래로 돌린다."""
+    monkeypatch.setattr(csv_logger, "DATA_DIR", tmp_path)
+    for attr in dir(csv_logger):
+        if attr.endswith("_CSV"):
+            original = getattr(csv_logger, attr)
+            monkeypatch.setattr(csv_logger, attr, tmp_path / original.name)
+    return tmp_path
+
+
+def _write_ohlc(path, rows):
+    lines = ["ticker,date,close"] + [f"{t},{d},{c}" for t, d, c in rows]
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+
+# ── 컬럼 저장소 ───────────────────────────────────────────────────────────────
+
+def test_load_ohlc_prices_reads_column_store(data_dir):
+    """load_ohlc_prices: 컬럼 저장소 경유 결과가 CSV 내용과 일치해야 한다."""
+    _write_ohlc(csv_logger.OHLC_CSV, [
+        ("SPY", "2024-01-02", "470.10"),
+        ("AGG", "20240102", "98.50"),
+        ("SPY", "2024-01-03", "468.00"),
+        ("SPY", "2024-01-03", "468.50"),  # 중복: 하단 기록 우선
+        ("AGG", "2024-01-04", "bad"),     # 파싱 불가 → 제외
+    ])
+
+    prices = csv_logger.load_ohlc_prices()
+
+    assert prices == {
+        "SPY": {"2024-01-02": 470.10, "2024-01-03": 468.50},
+        "AGG": {"2024-01-02": 98.50},
+    }
+    assert csv_logger.load_ohlc_prices(["AGG"]) == {"AGG": {"2024-01-02": 98.50}}
+    assert (data_dir / "ohlc_history.cols" / "meta.json").exists()
+
+
+def test_ohlc_readers_close_column_store(data_dir, monkeypatch):
+    """load_ohlc_prices / open_ohlc_panel: 사용이 끝나면 mmap 저장소를 닫는다."""
+    from app.analytics.price_store import PriceStore
+
+    closed = []
+    original = PriceStore.close
+    monkeypatch.setattr(PriceStore, "close", lambda self: closed.append(1) or original(self))
+    _write_ohlc(csv_logger.OHLC_CSV, [
+        ("SPY", "2024-01-02", "470.00"),
+        ("AGG", "2024-01-03", "98.50"),
+    ])
+
+    csv_logger.load_ohlc_prices()
+    assert closed == [1]
+
+    with csv_logger.open_ohlc_panel() as panel:
+        assert panel.dates == ["2024-01-02", "2024-01-03"]
+        assert list(panel.history("SPY", 2)) == [470.0]
+        assert closed == [1]
+    assert closed == [1, 1]
+
+
+def test_price_store_rebuilds_when_csv_changes(data_dir):
+    """CSV가 갱신되면 다음 로드에서 저장소가 재생성되어야 한다."""
+    from app.analytics.price_store import load_price_store
+
+    _write_ohlc(csv_logger.OHLC_CSV, [("SPY", "2024-01-02", "470.00")])
+    store = load_price_store(csv_logger.OHLC_CSV)
+    assert list(store.dates) == [20240102]
+    store.close()
+
+    with open(csv_logger.OHLC_CSV, "a", encoding="utf-8") as f:
+        f.write("SPY,2024-01-03,471.00\nQQQ,2024-01-03,400.00\n")
+    store = load_price_store(csv_logger.OHLC_CSV)
+    assert list(store.dates) == [20240102, 20240103]
+    assert store.tickers == ("QQQ", "SPY")
+    qqq = store.column("QQQ")
+    assert qqq[0] != qqq[0]  # 결측 = NaN
+    assert qqq[1] == 400.0
+
+
+def test_price_store_swaps_generations_atomically(tmp_path):
+    """write_price_store: 새 세대에 모두 쓴 뒤 meta 교체, 열려 있던 직전 세대는 계속 읽힌다."""
+    from array import array
+    from app.analytics.price_store import open_price_store, write_price_store
+
+    directory = tmp_path / "store.cols"
+    write_price_store(directory, [20240102], {"SPY": array("d", [1.0]), "AGG": array("d", [2.0])})
+    old = open_price_store(directory)
+    old_spy = old.column("SPY")
+
+    write_price_store(directory, [20240102, 20240103], {"SPY": array("d", [1.5, 1.6])})
+    new = open_price_store(directory)
+    assert new.directory != old.directory
+    assert new.tickers == ("SPY",)
+    assert list(new.column("SPY")) == [1.5, 1.6]
+    assert list(old_spy) == [1.0]
+    assert list(old.column("AGG")) == [2.0]      # 교체 후 지연 로드도 직전 세대에서
+    old.close()
+    new.close()
+
+    write_price_store(directory, [20240104], {"QQQ": array("d", [3.0])})
+    generations = sorted(p.name for p in directory.iterdir() if p.is_dir())
+    assert len(generations) == 2                 # 현재 + 직전 세대만 유지
+
+
+# ── strategy_nav 일괄 기록 ────────────────────────────────────────────────────
+
+def test_save_strategy_nav_many_skips_existing_and_duplicate_keys(data_dir):
+    """save_strategy_nav_many: 기존 (전략, 날짜)와 배치 내부 중복을 모두 스킵."""
+    csv_logger.save_strategy_nav("2024-01-02", "gem", 0.01, 1.01)
+
+    saved = csv_logger.save_strategy_nav_many([
+        ("20240102", "gem", 0.05, 1.05),   # 기존 키 (날짜 형식만 다름)
+        ("2024-01-03", "gem", 0.02, 1.0302),
+        ("2024-01-03", "gem", 0.03, 1.0403),  # 배치 내부 중복
+        ("2024-01-02", "vaa", -0.01, 0.99, 0.98, -0.02),
+    ])
+
+    assert saved == 2
+    nav = csv_logger.load_strategy_nav()
+    assert [r["nav"] for r in nav["gem"]] == ["1.010000", "1.030200"]
+    assert nav["vaa"][0]["net_nav"] == "0.980000"
+
+
+# ── 키 인덱스 사이드카 ────────────────────────────────────────────────────────
+
+def test_key_index_sidecar_tracks_appends(data_dir):
+    """append 시 사이드카에 신규 키만 추가되고, 재실행 중복은 스킵된다."""
+    csv_logger.save_strategy_signal("2024-01-02", "gem", "offensive", {"SPY": 1.0}, 0.5)
+    csv_logger.save_strategy_signal("2024-01-03", "gem", "offensive", {"SPY": 1.0}, 0.6)
+    csv_logger.save_strategy_signal("20240103", "gem", "defensive", {"AGG": 1.0}, -0.1)
+
+    idx_path = data_dir / "strategy_signals.csv.date+strategy.idx"
+    lines = idx_path.read_text(encoding="utf-8").splitlines()
+    size, mtime_ns = (int(v) for v in lines[0].split())
+    st = csv_logger.STRATEGY_SIGNALS_CSV.stat()
+    assert (size, mtime_ns) == (st.st_size, st.st_mtime_ns)
+    assert sorted(lines[1:]) == ["2024-01-02\tgem", "2024-01-03\tgem"]
+    assert [r["mode"] for r in csv_logger.load_strategy_signals("gem")] == ["offensive", "offensive"]
+
+
+def test_key_index_rebuilds_after_external_edit(data_dir):
+    """CSV가 외부에서 바뀌면(size/mtime 불일치) 사이드카를 재생성한다."""
+    csv_logger.save_portfolio_state("2024-01-02", 1000.0, 10.0)
+    with open(csv_logger.PORTFOLIO_STATE_CSV, "a", encoding="utf-8") as f:
+        f.write("2024-01-03,1010.00,10.00\n")
+
+    csv_logger.save_portfolio_state("2024-01-03", 9999.0, 0.0)  # 외부 기록과 중복 → 스킵
+    csv_logger.save_portfolio_state("2024-01-04", 1020.0, 10.0)
+
+    rows = csv_logger.load_portfolio_state()
+    assert [(r["date"], r["total_equity"]) for r in rows] == [
+        ("2024-01-02", "1000.00"),
+        ("2024-01-03", "1010.00"),
+        ("2024-01-04", "1020.00"),
+    ]
+
+
+# ── OHLC 워터마크 ─────────────────────────────────────────────────────────────
+
+def test_save_ohlc_history_skips_scan_past_watermark(data_dir, monkeypatch):
+    """워터마크 이후 날짜만 들어오면 CSV 스캔 없이 append, 이전 날짜가 섞이면 dedup."""
+    csv_logger.save_ohlc_history("SPY", [{"date": "2024-01-02", "close": "470"}])
+    csv_logger.save_ohlc_history("AGG", [{"xymd": "20240102", "clos": "98"}])
+
+    scans = []
+    original = csv_logger._ohlc_dates_for_ticker
+    monkeypatch.setattr(
+        csv_logger, "_ohlc_dates_for_ticker",
+        lambda ticker: scans.append(ticker) or original(ticker),
+    )
+
+    csv_logger.save_ohlc_history("SPY", [{"date": "2024-01-03", "close": "471"}])
+    csv_logger.save_ohlc_history("SPY", [
+        {"date": "2024-01-02", "close": "999"},  # 기존 날짜 → 스킵
+        {"date": "2024-01-04", "close": "472"},
+    ])
+    assert scans == []
+
+    assert csv_logger._ohlc_watermarks()["SPY"] == {
+        "last": "2024-01-04",
+        "count": 3,
+        "recent": ["2024-01-02", "2024-01-03", "2024-01-04"],
+    }
+    prices = csv_logger.load_ohlc_prices(["SPY"])["SPY"]
+    assert prices == {"2024-01-02": 470.0, "2024-01-03": 471.0, "2024-01-04": 472.0}
+
+
+def test_save_ohlc_history_dedups_trailing_window_without_scan(data_dir, monkeypatch):
+    """수집처럼 매번 최근 창 전체가 다시 들어와도 CSV를 스캔하지 않고 신규 bar만 추가한다."""
+    monkeypatch.setattr(csv_logger, "_OHLC_RECENT_DATES", 3)
+    bars = [{"date": f"2024-01-{day:02d}", "close": str(100 + day)} for day in range(2, 9)]
+    csv_logger.save_ohlc_history("SPY", bars[:5])
+
+    def no_scan(ticker):
+        raise AssertionError("full scan")
+
+    monkeypatch.setattr(csv_logger, "_ohlc_dates_for_ticker", no_scan)
+    csv_logger.save_ohlc_history("SPY", bars[3:])  # 01-05..01-08, 01-05·01-06은 recent와 겹침
+    csv_logger.save_ohlc_history("SPY", bars[4:])  # 전부 저장됨 → 기록 없음
+
+    mark = csv_logger._ohlc_watermarks()["SPY"]
+    assert (mark["last"], mark["count"]) == ("2024-01-08", 7)
+    assert mark["recent"] == ["2024-01-06", "2024-01-07", "2024-01-08"]
+    prices = csv_logger.load_ohlc_prices(["SPY"])["SPY"]
+    assert sorted(prices) == [bar["date"] for bar in bars]
+
+    # recent보다 이전 날짜가 섞이면 해당 티커만 전체 스캔으로 dedup
+    monkeypatch.setattr(csv_logger, "_ohlc_dates_for_ticker", lambda ticker: {"2024-01-02"})
+    csv_logger.save_ohlc_history("SPY", [{"date": "2024-01-02", "close": "999"}])
+    assert csv_logger.load_ohlc_prices(["SPY"])["SPY"]["2024-01-02"] == 102.0
+
+
+def test_save_ohlc_history_many_writes_watermark_once(data_dir, monkeypatch):
+    """save_ohlc_history_many: 티커마다 append 하되 워터마크 사이드카는 1회만 기록."""
+    csv_logger.save_ohlc_history("SPY", [{"date": "2024-01-02", "close": "470"}])
+
+    flushes = []
+    original = csv_logger._flush_ohlc_watermarks
+    monkeypatch.setattr(
+        csv_logger, "_flush_ohlc_watermarks", lambda: flushes.append(1) or original()
+    )
+    csv_logger.save_ohlc_history_many({
+        "SPY": [{"date": "2024-01-02", "close": "470"}, {"date": "2024-01-03", "close": "471"}],
+        "AGG": [{"date": "2024-01-03", "close": "98"}],
+        "QQQ": [{"date": "2024-01-03", "close": "400"}],
+    })
+    assert flushes == [1]
+
+    csv_logger._OHLC_WATERMARK_CACHE.clear()   # 다음 실행: 사이드카에서 그대로 읽힘 (재스캔 없음)
+    monkeypatch.setattr(csv_logger, "_ohlc_mark", None)
+    marks = csv_logger._ohlc_watermarks()
+    assert {t: m["count"] for t, m in marks.items()} == {"SPY": 2, "AGG": 1, "QQQ": 1}
+
+    csv_logger.save_ohlc_history_many({"SPY": [{"date": "2024-01-03", "close": "471"}]})
+    assert flushes == [1]                       # 추가된 행이 없으면 기록하지 않음
+
+
+def test_save_ohlc_history_bulk_merges_sorted_and_deduplicated(data_dir):
+    """save_ohlc_history_bulk: 기존 값 유지, 신규만 추가, (ticker, date) 정렬로 1회 기록."""
+    _write_ohlc(csv_logger.OHLC_CSV, [
+        ("SPY", "2024-01-03", "471.00"),
+        ("AGG", "20240102", "98.00"),
+        ("SPY", "2024-01-02", "470.00"),
+    ])
+
+    added = csv_logger.save_ohlc_history_bulk({
+        "SPY": [{"date": "2024-01-02", "close": "999"}, {"date": "2024-01-04", "close": "472"}],
+        "QQQ": [{"xymd": "20240102", "clos": "400"}],
+    })
+
+    assert added == 2
+    lines = csv_logger.OHLC_CSV.read_text(encoding="utf-8").splitlines()
+    assert lines == [
+        "ticker,date,close",
+        "AGG,2024-01-02,98.00",
+        "QQQ,2024-01-02,400.00",
+        "SPY,2024-01-02,470.00",
+        "SPY,2024-01-03,471.00",
+        "SPY,2024-01-04,472.00",
+    ]
+    assert csv_logger._ohlc_watermarks()["SPY"]["count"] == 3
+    assert csv_logger._ohlc_watermarks()["SPY"]["last"] == "2024-01-04"
+
+
+# ── strategy_nav 캐시 로더 ────────────────────────────────────────────────────
+
+def test_load_strategy_nav_is_cached_until_file_changes(data_dir, monkeypatch):
+    """같은 파일이면 재파싱하지 않고, append 후에는 새 내용을 반환한다."""
+    csv_logger.save_strategy_nav("2024-01-02", "gem", 0.01, 1.01)
+
+    parses = []
+    original = csv_logger._parse_strategy_nav
+    monkeypatch.setattr(
+        csv_logger, "_parse_strategy_nav",
+        lambda path: parses.append(path) or original(path),
+    )
+
+    first = csv_logger.load_strategy_nav()
+    assert csv_logger.load_strategy_nav("gem")["gem"] is first["gem"]
+    assert csv_logger.load_strategy_nav("vaa") == {}
+    assert len(parses) == 1
+
+    csv_logger.save_strategy_nav("2024-01-03", "gem", 0.01, 1.0201)
+    assert len(csv_logger.load_strategy_nav("gem")["gem"]) == 2
+    assert len(parses) == 2
+
+
+def test_load_strategy_nav_frame_aligns_float_columns(data_dir):
+    """StrategyNavFrame: 공유 날짜 축에 전략별 float 컬럼을 정렬하고 결측은 NaN."""
+    csv_logger.save_strategy_nav_many([
+        ("2024-01-02", "gem", 0.01, 1.01),
+        ("2024-01-03", "gem", 0.02, 1.0302, 1.03, 0.0198),
+        ("2024-01-03", "vaa", -0.01, 0.99),
+    ])
+
+    frame = csv_logger.load_strategy_nav_frame()
+
+    assert list(frame.dates) == [20240102, 20240103]
+    assert frame.strategies == ["gem", "vaa"]
+    assert frame.values("gem", "nav") == [1.01, 1.0302]
+    assert frame.values("gem", "net_nav") == [1.03]
+    vaa = frame.column("vaa", "nav")
+    assert vaa[0] != vaa[0] and vaa[1] == 0.99
+    assert list(frame.records("vaa")) == [("2024-01-03", -0.01, 0.99)]
+    assert frame.last("gem") == ("2024-01-03", 1.0302)
+    assert frame.values("missing") == []
+    assert csv_logger.load_strategy_nav_frame() is frame
+
+
+def test_risk_section_counts_blank_daily_return_as_zero(data_dir):
+    """_build_risk_section: 행은 있지만 daily_return이 빈 칸인 날짜는 0.0으로 포함한다."""
+    from app.analytics.report import _build_risk_section
+    from app.analytics.risk import max_drawdown
+
+    csv_logger.STRATEGY_NAV_CSV.write_text(
+        "date,strategy,daily_return,nav\n"
+        "2024-01-02,gem,0.10,1.10\n"
+        "2024-01-02,vaa,0.00,1.00\n"
+        "2024-01-03,gem,,1.10\n"          # 빈 칸 → 0.0
+        "2024-01-03,vaa,-0.20,0.80\n"
+        "2024-01-04,gem,0.05,1.155\n",    # vaa 행 없음 → 제외
+        encoding="utf-8",
+    )
+    frame = csv_logger.load_strategy_nav_frame()
+    assert list(frame.has_row("vaa")) == [1, 1, 0]
+
+    lines = _build_risk_section([{"name": "gem", "weight": 0.5}, {"name": "vaa", "weight": 0.5}])
+    assert lines[1] == "## 리스크 지표 (최근 2거래일)"
+    assert f"- MDD: {max_drawdown([0.05, -0.10]) * 100:.2f}%" in lines
+
+
+# ── OHLC 스트리밍 로더 ────────────────────────────────────────────────────────
+
+def test_iter_ohlc_history_streams_filtered_rows_in_date_order(data_dir):
+    """iter_ohlc_history: 티커·기간 필터 후 날짜 오름차순으로 생성한다."""
+    _write_ohlc(csv_logger.OHLC_CSV, [
+        ("SPY", "2024-01-04", "472.00"),
+        ("AGG", "2024-01-02", "98.00"),
+        ("QQQ", "2024-01-03", "400.00"),
+        ("SPY", "2024-01-02", "470.00"),
+        ("AGG", "20240104", "98.50"),
+        ("SPY", "2024-01-03", "471.00"),
+    ])
+
+    rows = list(csv_logger.iter_ohlc_history(["SPY", "AGG", "XLE"], start="20240102", end="2024-01-03"))
+
+    assert rows == [
+        {"ticker": "SPY", "date": "2024-01-02", "close": 470.0},
+        {"ticker": "AGG", "date": "2024-01-02", "close": 98.0},
+        {"ticker": "SPY", "date": "2024-01-03", "close": 471.0},
+    ]
+    assert [r["date"] for r in csv_logger.iter_ohlc_history(["AGG"])] == ["2024-01-02", "2024-01-04"]
+
+
+# ── 압축 ─────────────────────────────────────────────────────────────────────
+
+def test_compact_data_files_dedups_and_keeps_reads(data_dir):
+    """compact: 하단 기록 우선 중복 제거, 행 순서 유지, load 결과는 그대로, 재실행 시 무변경."""
+    csv_logger.STRATEGY_NAV_CSV.write_text(
+        "date,strategy,daily_return,nav\n"
+        "2024-01-03,gem,0.010000,1.020000\n"
+        "20240102,gem,0.010000,1.010000\n"
+        "2024-01-03,gem,0.020000,1.030000\n"
+        "2024-01-02,vaa,0.000000,1.000000,0.990000,-0.010000\r\n",
+        encoding="utf-8",
+    )
+    before = csv_logger.load_strategy_nav()
+
+    results = csv_logger.compact_data_files()
+
+    assert results == [{
+        "file": "strategy_nav.csv",
+        "rows_before": 4,
+        "rows_after": 3,
+        "bytes_before": results[0]["bytes_before"],
+        "bytes_after": results[0]["bytes_after"],
+        "rewritten": True,
+    }]
+    assert csv_logger.STRATEGY_NAV_CSV.read_text(encoding="utf-8").splitlines() == [
+        "date,strategy,daily_return,nav,net_nav,net_daily_return",
+        "2024-01-02,gem,0.010000,1.010000,,",
+        "2024-01-03,gem,0.020000,1.030000,,",
+        "2024-01-02,vaa,0.000000,1.000000,0.990000,-0.010000",
+    ]
+    after = csv_logger.load_strategy_nav()
+    assert [r["nav"] for r in after["gem"]] == [r["nav"] for r in before["gem"]]
+    assert after["vaa"][0]["net_nav"] == "0.990000"
+    assert csv_logger.compact_data_files()[0]["rewritten"] is False
+
+
+def test_compact_keeps_loader_results(data_dir):
+    """같은 날짜에 여러 키가 섞인 파일도 압축 전후 load_* 결과가 같다."""
+    csv_logger.PORTFOLIO_CSV.write_text(
+        ",".join(csv_logger.PORTFOLIO_HEADER) + "\n"
+        "2024-01-02,1000.00,10.00,gem,offensive,1.0000,SPY\n"
+        "2024-01-02,1000.00,10.00,vaa,offensive,1.0000,SPY\n"
+        "2024-01-02,1001.00,11.00,gem,offensive,1.0000,SPY\n"
+        "2024-01-03,1010.00,10.00,vaa,defensive,1.0000,AGG\n",
+        encoding="utf-8",
+    )
+    csv_logger.PORTFOLIO_NAV_MODEL_CSV.write_text(
+        ",".join(csv_logger.PORTFOLIO_NAV_MODEL_HEADER) + "\n"
+        "2024-01-03,1.010000,0.010000,,\n"
+        "2024-01-02,1.000000,0.000000,,\n",
+        encoding="utf-8",
+    )
+    snapshots = csv_logger.load_portfolio_snapshots()
+    model = csv_logger.load_portfolio_nav_model()
+
+    results = csv_logger.compact_data_files()
+
+    assert [r["file"] for r in results if r["rewritten"]] == ["portfolio.csv"]
+    assert csv_logger.load_portfolio_snapshots() == snapshots
+    assert [(r["date"], r["strategy"], r["total_equity"]) for r in snapshots] == [
+        ("2024-01-02", "gem", "1001.00"),
+        ("2024-01-03", "vaa", "1010.00"),
+    ]
+    assert csv_logger.load_portfolio_nav_model() == model
+
+
+# ── SQLite 백엔드 ─────────────────────────────────────────────────────────────
+
+@pytest.fixture
+def sqlite_backend(data_dir, monkeypatch):
+    """SQLite 백엔드로 전환하고 DB를 tmp_path 아래에 둔다."""
+    monkeypatch.setattr(csv_logger, "SQLITE_DB", data_dir / "classicquant.sqlite3")
+    monkeypatch.setattr(csv_logger, "_SQLITE_STORAGE", None)
+    monkeypatch.setattr(csv_logger, "STORAGE_BACKEND", "sqlite")
+    yield data_dir
+    if csv_logger._SQLITE_STORAGE is not None:
+        csv_logger._SQLITE_STORAGE.close()
+
+
+def test_sqlite_backend_keeps_save_load_semantics(sqlite_backend):
+    """SQLite 백엔드: 기존 CSV 가져오기, 기존 키 스킵, 필터·최신 행 조회, CSV 내보내기."""
+    csv_logger.STRATEGY_NAV_CSV.write_text(
+        "date,strategy,daily_return,nav\n"
+        "2024-01-02,gem,0.010000,1.010000\n"
+        "2024-01-02,gem,0.020000,1.020000\n",  # 하단 기록 우선으로 가져옴
+        encoding="utf-8",
+    )
+
+    csv_logger.save_strategy_nav("20240102", "gem", 0.05, 1.05)  # 기존 키 → 스킵
+    csv_logger.save_strategy_nav("2024-01-03", "gem", 0.01, 1.0302, 1.03, 0.0098)
+    assert csv_logger.save_strategy_nav_many([("2024-01-03", "vaa", 0.0, 1.0)]) == 1
+    csv_logger.save_strategy_signal("2024-01-03", "gem", "offensive", {"SPY": 1.0}, 0.5)
+    csv_logger.save_ohlc_history("SPY", [{"date": "2024-01-03", "close": "471"}])
+    assert csv_logger.save_ohlc_history_bulk({"SPY": [{"date": "2024-01-03", "close": "999"}]}) == 0
+
+    nav = csv_logger.load_strategy_nav("gem")
+    assert [(r["date"], r["nav"]) for r in nav["gem"]] == [("2024-01-02", "1.020000"), ("2024-01-03", "1.030200")]
+    assert csv_logger.load_latest_strategy_nav("gem")["net_nav"] == "1.030000"
+    assert csv_logger.load_latest_strategy_nav("haa") is None
+    assert csv_logger.load_strategy_nav_frame().values("vaa") == [1.0]
+    assert [r["mode"] for r in csv_logger.load_strategy_signals("gem")] == ["offensive"]
+    assert csv_logger.load_ohlc_prices(["SPY"]) == {"SPY": {"2024-01-03": 471.0}}
+
+    exported = csv_logger.export_storage_to_csv()
+    assert exported["strategy_nav.csv"] == 3
+    assert csv_logger.STRATEGY_NAV_CSV.read_text(encoding="utf-8").splitlines() == [
+        "date,strategy,daily_return,nav,net_nav,net_daily_return",
+        "2024-01-02,gem,0.020000,1.020000,,",
+        "2024-01-03,gem,0.010000,1.030200,1.030000,0.009800",
+        "2024-01-03,vaa,0.000000,1.000000,,",
+    ]
+
+
+def test_sqlite_portfolio_snapshots_match_csv_backend(data_dir, monkeypatch):
+    """load_portfolio_snapshots: 날짜별 마지막 기록 행이 CSV·SQLite 백엔드에서 같다."""
+    results = [
+        {"name": "vaa", "targets": {"SPY": 1.0}},
+        {"name": "gem", "targets": {"AGG": 1.0}},
+    ]
+    csv_logger.save_portfolio("2024-01-02", 1000.0, 10.0, results[:1], {"SPY": 1.0}, {})
+    csv_logger.save_portfolio("2024-01-02", 1000.0, 10.0, results[1:], {"AGG": 1.0}, {})
+    csv_logger.save_portfolio("2024-01-03", 1010.0, 10.0, results, {"SPY": 0.5, "AGG": 0.5}, {})
+    from_csv = csv_logger.load_portfolio_snapshots()
+    assert [(r["date"], r["strategy"]) for r in from_csv] == [
+        ("2024-01-02", "gem"), ("2024-01-03", "gem"),
+    ]
+
+    monkeypatch.setattr(csv_logger, "SQLITE_DB", data_dir / "classicquant.sqlite3")
+    monkeypatch.setattr(csv_logger, "_SQLITE_STORAGE", None)
+    monkeypatch.setattr(csv_logger, "STORAGE_BACKEND", "sqlite")
+    try:
+        assert csv_logger.load_portfolio_snapshots() == from_csv       # CSV 가져오기 후
+        csv_logger.save_portfolio("2024-01-04", 1020.0, 10.0, results[:1], {"SPY": 1.0}, {})
+        csv_logger.save_portfolio("2024-01-04", 1020.0, 10.0, results[1:], {"AGG": 1.0}, {})
+        assert csv_logger.load_portfolio_snapshots()[-1]["strategy"] == "gem"   # 키 순이면 vaa
+        assert "_seq" not in csv_logger.load_portfolio_snapshots()[-1]
+    finally:
+        csv_logger._SQLITE_STORAGE.close()
@@ -0,0 +1,203 @@
+"""지표 모듈 회귀 테스트.
+
+배치 지표가 기존 스칼라 함수(compute_volatility, compute_correlation 등)와
+같은 값을 내는지 합성 가격으로 검증한다.
+"""
+import sys
+import os
+import random
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+from app.indicators.factor import (
+    compute_correlation, compute_ewp_prices, compute_factor_stats, compute_volatility,
+)
+
+
+def _random_walk(n, seed, start=100.0):
+    rng = random.Random(seed)
+    prices = [start]
+    for _ in range(n - 1):
+        prices.append(prices[-1] * (1 + rng.gauss(0.0003, 0.012)))
+    return prices
+
+
+# ── factor ───────────────────────────────────────────────────────────────────
+
+@pytest.mark.parametrize("lengths", [(400, 350, 300), (120, 80, 60)])
+def test_factor_stats_matches_per_asset_functions(lengths):
+    """compute_factor_stats == compute_volatility / compute_correlation(p, compute_ewp_prices)."""
+    prices = {f"G{i}": _random_walk(n, seed=i) for i, n in enumerate(lengths)}
+    stats = compute_factor_stats(prices)
+    ewp = compute_ewp_prices(prices)
+
+    assert stats.ewp[-1] / stats.ewp[-2] == pytest.approx(ewp[-1] / ewp[-2], rel=1e-12)
+    for g, p in prices.items():
+        assert stats.volatilities[g] == compute_volatility(p)
+        assert stats.correlations[g] == pytest.approx(compute_correlation(p, ewp), rel=1e-12)
+
+
+# ── score ────────────────────────────────────────────────────────────────────
+
+def test_score_matrix_matches_scalar_strategy_scores():
+    """ScoreMatrix.scores(공식)[t][row] == score_from_returns(at_row(t, row)), None ↔ NaN."""
+    from app.analytics.price_panel import PricePanel
+    from app.analytics.momentum_panel import MomentumPanel, ScoreMatrix
+    from app.strategies import get_strategy
+
+    dates = [f"{2000 + i // 250}-{1 + i % 250 // 21:02d}-{1 + i % 21:02d}" for i in range(400)]
+    spy = _random_walk(400, seed=5)
+    spy[30] = 0.0  # 과거 가격 0 → 해당 기간만 NaN
+    prices = {
+        "SPY": {d: p for i, (d, p) in enumerate(zip(dates, spy)) if i % 13 != 4},
+        "AGG": {d: p for d, p in zip(dates[100:], _random_walk(300, seed=6))},
+    }
+    panel = PricePanel.from_price_dict(prices)
+    momentum = MomentumPanel(panel)
+    matrix = ScoreMatrix(panel, momentum=momentum)
+
+    for name in ("vaa", "faa", "gem"):
+        strategy = get_strategy(name)
+        scores = matrix.scores(strategy.SCORE_FORMULA)
+        for ticker in ("SPY", "AGG"):
+            for row in range(len(panel)):
+                expected = strategy.score_from_returns(momentum.at_row(ticker, row))
+                value = scores[ticker][row]
+                assert (None if value != value else value) == expected
+    r12 = matrix.returns("r12m")["SPY"]
+    assert r12[len(panel) - 1] == momentum.at_row("SPY", len(panel) - 1)["r12m"]
+
+
+def test_get_momentum_scores_picks_group_ticker_by_formula(monkeypatch):
+    """get_momentum_scores: 그룹 대표 티커는 formula 점수가 나오는 첫 티커 (패널 공유 여부 무관)."""
+    from app.analytics.momentum_panel import MomentumPanel
+    from app.indicators import momentum as momentum_mod
+
+    def history(n, seed):
+        return [{"xymd": f"{20000101 + i}", "clos": str(p)}
+                for i, p in enumerate(_random_walk(n, seed))]
+
+    class FakeAPI:
+        histories = {"NEW": history(30, 1), "OLD": history(300, 2)}
+
+        def get_historical_data(self, ticker, period="D", min_records=0):
+            return self.histories[ticker]
+
+    monkeypatch.setattr(momentum_mod, "group_tickers", lambda group: ["NEW", "OLD"])
+    monkeypatch.setattr(momentum_mod, "set_exchange_for_ticker", lambda api, ticker: None)
+
+    for panel in (None, MomentumPanel()):
+        _, returns, _ = momentum_mod.get_momentum_scores(FakeAPI(), ["G"], panel)
+        assert returns["G"]["r12m"] is not None                    # keller: NEW 건너뜀 → OLD
+        scores, returns, _ = momentum_mod.get_momentum_scores(
+            FakeAPI(), ["G"], panel, "annualized_return"
+        )
+        assert returns["G"]["r12m"] is None and scores["G"] is not None   # NEW 채택
+
+
+# ── correlation ──────────────────────────────────────────────────────────────
+
+def test_correlation_matrix_matches_pairwise_and_caches():
+    """correlation_matrix: 쌍별 window_correlation과 같고, 같은 입력은 캐시 객체를 재사용."""
+    from app.indicators.correlation import correlation_matrix, window_correlation
+
+    rng = random.Random(7)
+    series = {name: [rng.gauss(0, 0.01) for _ in range(n)]
+              for name, n in (("a", 100), ("b", 80), ("c", 40))}
+    series["flat"] = [0.0] * 100
+    matrix = correlation_matrix(series, 63, end_date="2024-06-28")
+
+    for x in series:
+        for y in series:
+            assert matrix.get(x, y) == window_correlation(series[x], series[y], 63)
+    assert matrix.get("a", "a") == pytest.approx(1.0)
+    assert matrix.get("a", "c") is None      # window보다 짧음
+    assert matrix.get("a", "flat") is None   # 표준편차 0
+    assert correlation_matrix(dict(series), 63, end_date="2024-06-28") is matrix
+
+    series["a"] = series["a"][:-1] + [0.05]
+    changed = correlation_matrix(series, 63, end_date="2024-06-28")
+    assert changed.get("a", "b") != matrix.get("a", "b")
+    series["b"] = series["b"] + [0.01]       # 새 bar 추가 → 지문(길이)이 달라져 재계산
+    appended = correlation_matrix(series, 63, end_date="2024-06-28")
+    assert appended is not changed
+    assert appended.get("a", "b") == window_correlation(series["a"], series["b"], 63)
+
+    series["b"] = list(series["b"])
+    series["b"][-30] += 0.02                 # 윈도 중간 값 수정 (길이·양 끝 값은 그대로)
+    corrected = correlation_matrix(series, 63, end_date="2024-06-28")
+    assert corrected is not appended
+    assert corrected.get("a", "b") == window_correlation(series["a"], series["b"], 63)
+
+    # end_date 없이 부르는 selector 경로도 윈도 중간 수정에 재계산
+    before = correlation_matrix(series, 63)
+    series["a"] = series["a"][:50] + [series["a"][50] + 0.02] + series["a"][51:]
+    assert correlation_matrix(series, 63) is not before
+
+
+def test_window_correlation_min_periods_and_correlations_with():
+    """min_periods: 공통 꼬리가 window보다 짧아도 계산, correlations_with == 쌍별 결과."""
+    from app.indicators.correlation import correlations_with, window_correlation
+
+    rng = random.Random(11)
+    target = [rng.gauss(0, 0.01) for _ in range(60)]
+    series = {name: [rng.gauss(0, 0.01) for _ in range(n)]
+              for name, n in (("long", 90), ("short", 30), ("tiny", 10))}
+
+    assert window_correlation(series["short"], target, 63) is None
+    short = window_correlation(series["short"], target, 63, min_periods=20)
+    assert short == window_correlation(series["short"], target[-30:], 30)
+    assert window_correlation(series["tiny"], target, 63, min_periods=20) is None
+
+    by_name = correlations_with(series, target, 63, min_periods=20)
+    assert by_name == {name: window_correlation(values, target, 63, min_periods=20)
+                       for name, values in series.items()}
+
+
+# ── cache ────────────────────────────────────────────────────────────────────
+
+def test_indicator_cache_lru_eviction_and_counters():
+    """maxsize 초과 시 가장 오래 안 쓴 키부터 제거, hits/misses 집계."""
+    from app.indicators.cache import IndicatorCache
+
+    cache = IndicatorCache(maxsize=2)
+    calls = []
+    compute = lambda key: cache.get(key, lambda: calls.append(key) or len(calls))  # noqa: E731
+
+    assert compute(("SPY",)) == 1
+    assert compute(("AGG",)) == 2
+    assert compute(("SPY",)) == 1      # 적중 → SPY가 최근
+    assert compute(("SHY",)) == 3      # AGG 제거
+    assert compute(("AGG",)) == 4
+    assert (cache.hits, cache.misses, len(cache)) == (1, 4, 2)
+
+
+def test_price_histories_share_indicator_results_across_strategies():
+    """MomentumPanel.price_histories: parse_history와 같은 결과, 전략 간 SMA 계산 재사용."""
+    from app.assets.assets import reload_assets
+    from app.data.data_utils import parse_history
+    from app.analytics.momentum_panel import MomentumPanel
+    from app.strategies import get_strategy
+
+    dates = [f"{2020 + i // 240}{1 + i % 240 // 20:02d}{1 + i % 20:02d}" for i in range(300)]
+    momentum = MomentumPanel()
+    for name in ("gtaa", "ivy"):
+        strategy = get_strategy(name)
+        reload_assets(strategy.assets)
+        histories = {
+            t: momentum.histories.get(t) or [
+                {"xymd": d, "clos": str(p)} for d, p in zip(dates, _random_walk(300, seed=k))
+            ][::-1]
+            for k, t in enumerate(strategy.universe.group_tickers(g)[0]
+                                  for g in strategy.get_universe())
+        }
+        tagged = momentum.price_histories(histories)
+        plain = {t: parse_history(h) for t, h in histories.items()}
+
+        assert tagged == plain
+        assert tagged["VNQ"].end_date == dates[-1]
+        assert strategy.select_targets({}, histories=tagged) == strategy.select_targets(
+            {}, histories=plain
+        )
+    assert momentum.indicators.hits > 0
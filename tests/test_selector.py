@@ -10,22 +10,23 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 import math
 import pytest
+from app.analytics.nav_frame import StrategyNavFrame
 from app.strategy_selector import _apply_corr_filter, _corr
 
 
 # ── 헬퍼 ─────────────────────────────────────────────────────────────────────
 
-def _make_nav_series(returns):
-    """일별 수익률 리스트로 all_nav 포맷의 딕셔너리 생성.
+def _make_all_nav(name_returns: dict):
+    """전략별 수익률 딕셔너리 → StrategyNavFrame 생성.
 
-    _apply_corr_filter 내부에서 row["daily_return"] 키로 접근한다.
+    _apply_corr_filter 내부에서 daily_return 컬럼으로 접근한다.
     """
-    return [{"daily_return": str(r)} for r in returns]
-
-
-def _make_all_nav(name_returns: dict):
-    """전략별 수익률 딕셔너리 → all_nav 포맷 딕셔너리 생성."""
-    return {name: _make_nav_series(rets) for name, rets in name_returns.items()}
+    rows = [
+        {"date": f"2024-{1 + i // 28:02d}-{1 + i % 28:02d}", "strategy": name, "daily_return": str(r)}
+        for name, rets in name_returns.items()
+        for i, r in enumerate(rets)
+    ]
+    return StrategyNavFrame.from_rows(rows)
 
 
 # ── _apply_corr_filter 테스트 ─────────────────────────────────────────────────
@@ -71,7 +72,7 @@ def test_corr_filter_low_corr_selects_two(monkeypatch):
 
 def test_corr_filter_empty_ranked_returns_empty():
     """ranked가 빈 리스트 → 빈 리스트 반환."""
-    all_nav = {}
+    all_nav = _make_all_nav({})
     result = _apply_corr_filter([], all_nav, top_n=2)
     assert result == []
 
@@ -174,3 +174,24 @@ def test_all_weather_weights_sum_to_one():
     targets = all_weather.select_targets({})
     total = sum(targets.values())
     assert abs(total - 1.0) < 0.001, f"가중치 합: {total}"
+
+
+# ── 5. AssetUniverse ──────────────────────────────────────────────────────────
+
+def test_strategy_universe_independent_of_global_assets_cache():
+    """strategy.universe는 전역 reload_assets 상태와 무관하고, 같은 정의는 공유·불변."""
+    from app.assets.assets import AssetUniverse
+    from app.strategies import get_strategy
+
+    vaa = get_strategy("vaa")
+    reload_assets(get_strategy("permanent").ASSETS)  # 다른 전략 캐시가 로드된 상태
+
+    scores = {"SPY": 0.5, "EFA": 0.3, "EEM": 0.2, "AGG": 0.1, "LQD": 0.2, "IEF": 0.1, "SHY": 0.05}
+    assert vaa.select_targets(scores) == {"SPY": 1.0}
+    assert vaa.get_universe() == sorted({"SPY", "EFA", "EEM", "AGG", "LQD", "IEF", "SHY"})
+
+    universe = vaa.universe
+    assert universe is get_strategy("vaa").universe is AssetUniverse.of(vaa.ASSETS)
+    assert universe.group_tickers("SPY")[0] == "SPY"
+    with pytest.raises(AttributeError):
+        universe._type_to_groups = {}